@@ -0,0 +1,39 @@
+'''
+Measure repeated unit conversions of the same units with different values, e.g. `3 km/hr` to `m/s`,
+with and without the conversion plan cache (`latex2sympy.units.conversion_cache`),
+and converting all the values at once with `convert_many` (requires numpy).
+
+Run from the root of the repo: `python sandbox/benchmark_convert_to.py`
+'''
+import timeit
+from latex2sympy.latex2sympyAsUnit import process_sympy_as_unit
+from latex2sympy.units import convert_to, convert_many, conversion_cache
+
+COUNT = 2000
+
+CONVERSIONS = [
+    ('\\frac{km}{hr}', '\\frac{m}{s}'),
+    ('kW*h', 'J'),
+    ('\\frac{mmol}{L}', 'M'),
+    ('GiB', 'MB'),
+]
+
+for src, dest in CONVERSIONS:
+    src_unit = process_sympy_as_unit(src)
+    dest_unit = process_sympy_as_unit(dest)
+    exprs = [(i + 1) * src_unit for i in range(COUNT)]
+
+    def convert_all():
+        for expr in exprs:
+            convert_to(expr, dest_unit)
+
+    conversion_cache.resize(0)
+    uncached = timeit.timeit(convert_all, number=1)
+    conversion_cache.resize(1024)
+    cached = timeit.timeit(convert_all, number=1)
+    values = list(range(1, COUNT + 1))
+    many = timeit.timeit(lambda: convert_many(values, src, dest), number=1)
+    print(f'{src:>16} => {dest:<14}: {uncached / COUNT * 1e6:8.1f} us uncached, {cached / COUNT * 1e6:6.1f} us cached, '
+          f'{many / COUNT * 1e6:5.2f} us convert_many')
+
+print(conversion_cache.info())
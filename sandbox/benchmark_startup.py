@@ -0,0 +1,53 @@
+'''
+Measure the startup cost of the package: the time to import it, and the latency of the first call, which includes
+importing sympy (and, for units, the units subsystem).
+
+Each scenario runs in a fresh python process, and the median of several runs is compared to its budget.
+Exits with an error if any scenario is over budget, so that regressions in startup time are noticed.
+
+Run from the root of the repo: `python sandbox/benchmark_startup.py`
+'''
+import os
+import statistics
+import subprocess
+import sys
+
+RUN_COUNT = 5
+
+# scenario -> (code to time, budget in seconds)
+SCENARIOS = {
+    'import latex2sympy': ('import latex2sympy', 0.05),
+    'validate': ('import latex2sympy; latex2sympy.validate("x^{2}+1")', 0.1),
+    'process_sympy': ('from latex2sympy.latex2sympy import process_sympy; process_sympy("x^{2}+1")', 1.0),
+    'process_sympy_as_unit': (
+        'from latex2sympy.latex2sympyAsUnit import process_sympy_as_unit; process_sympy_as_unit("km")', 1.5),
+}
+
+# run the code, and print its time and the modules it loaded
+TIMER = '''
+import sys, time
+t0 = time.perf_counter()
+{code}
+print(time.perf_counter() - t0, 'sympy' in sys.modules, 'latex2sympy.units.sie' in sys.modules)
+'''
+
+
+def run(code):
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(['src', os.environ.get('PYTHONPATH', '')]))
+    output = subprocess.check_output([sys.executable, '-c', TIMER.format(code=code)], env=env).decode().split()
+    return float(output[0]), output[1] == 'True', output[2] == 'True'
+
+
+over_budget = []
+for name, (code, budget) in SCENARIOS.items():
+    runs = [run(code) for _ in range(RUN_COUNT)]
+    seconds = statistics.median(r[0] for r in runs)
+    _, sympy_loaded, units_loaded = runs[0]
+    status = 'ok' if seconds <= budget else 'OVER BUDGET'
+    print(f'{name:>22}: {seconds * 1000:7.1f} ms (budget {budget * 1000:.0f} ms) {status:>11}, '
+          f'sympy loaded: {sympy_loaded}, units loaded: {units_loaded}')
+    if seconds > budget:
+        over_budget.append(name)
+
+if len(over_budget) > 0:
+    raise Exception('over startup budget: ' + ', '.join(over_budget))
@@ -0,0 +1,81 @@
+'''
+Compare the cost of the token index over whole conversions, against scanning the tokens of each node.
+
+The pre-compiled parsers return json, so the index can only be built by `index_tokens` as the `object_hook` of the
+decoder, on every node of every parse. "scan" decodes without the hook, as `parseToObject` does, so `get_token` and
+`find_type` scan the tokens of each node. "index" decodes with the hook. Both are run over the test suite corpus:
+
+- decode: `parseToJson` and decoding its json
+- convert: `process_sympy`, which includes decoding
+
+Parsing takes most of the time of both, and the index made no measurable difference to either,
+so `parseToObject` does not build it.
+
+Run from the root of the repo: `python sandbox/benchmark_token_index.py`
+'''
+import json
+import time
+from sympy import srepr
+from corpus import get_test_corpus
+import latex2sympy.latex2sympy
+from latex2sympy.latex2sympy import LatexToSympy, process_sympy
+from latex2sympy.lib import parseToJson, parseToObject
+from latex2sympy.utils.json import index_tokens
+
+REPEAT_COUNT = 3
+
+
+def parse_without_index(latex):
+    return json.loads(parseToJson(latex))
+
+
+def parse_with_index(latex):
+    return json.loads(parseToJson(latex), object_hook=index_tokens)
+
+
+def convert(latex):
+    try:
+        return srepr(process_sympy(latex))
+    except Exception as e:
+        return type(e).__name__
+
+
+def decode(parse, latex):
+    try:
+        return parse(latex)
+    except ValueError:
+        return None
+
+
+corpus = get_test_corpus()
+pre_processed = [LatexToSympy(latex).pre_process_latex(latex) for latex in corpus]
+print(f'latex strings: {len(corpus)}')
+# warm the antlr DFA cache, so that it does not count against the first timing
+for latex in corpus:
+    convert(latex)
+
+timings = {}
+results = {}
+for name, parse in [('scan', parse_without_index), ('index', parse_with_index)]:
+    t0 = time.perf_counter()
+    for _ in range(REPEAT_COUNT):
+        for latex in pre_processed:
+            decode(parse, latex)
+    timings[('decode', name)] = time.perf_counter() - t0
+
+    latex2sympy.latex2sympy.parseToObject = parse
+    t0 = time.perf_counter()
+    for _ in range(REPEAT_COUNT):
+        results[name] = [convert(latex) for latex in corpus]
+    timings[('convert', name)] = time.perf_counter() - t0
+latex2sympy.latex2sympy.parseToObject = parseToObject
+
+if results['scan'] != results['index']:
+    raise Exception('conversions with the token index differ from conversions without it')
+
+for step in ['decode', 'convert']:
+    for name in ['scan', 'index']:
+        seconds = timings[(step, name)]
+        per_latex_us = seconds / (REPEAT_COUNT * len(corpus)) * 1e6
+        speedup = timings[(step, 'scan')] / seconds
+        print(f'{step:>7} {name:>5}: {seconds:.3f} s total, {per_latex_us:.1f} us/latex, {speedup:.2f}x vs scan')
@@ -0,0 +1,72 @@
+'''
+Measure sending the converted expressions of the test corpus between processes, with `latex2sympy.transport`,
+`pickle`, and `srepr`/`sympify`: the time to serialize and deserialize all the results as one list (as
+`process_sympy_many` sends each chunk), the size of the data, and how many results are equal after the round trip.
+
+`pickle` and `sympify` re-create each expression from its args, which evaluates it, so they are not exact
+for the converter's `evaluate=False` trees, e.g. `x^{2}+1` comes back as `1+x^{2}`. `srepr` writes units as symbols,
+so each result is written on its own line, and a result which `sympify` cannot read is counted as not equal.
+
+For the 765 results of `process_sympy`, a round trip took ~15 ms with `transport` (27 KB), ~50 ms with `pickle`
+(21 KB), and ~400 ms with `srepr`/`sympify` (55 KB), and only `transport` returned every result equal.
+
+Run from the root of the repo: `python sandbox/benchmark_transport.py`
+'''
+import pickle
+import timeit
+import sympy
+from corpus import get_test_corpus
+from latex2sympy import transport
+from latex2sympy.latex2sympy import process_sympy
+from latex2sympy.latex2sympyAsUnit import process_sympy_as_unit
+
+REPEAT = 5
+
+
+def convert_all(convert, latex_list):
+    results = []
+    for latex in latex_list:
+        try:
+            results.append(convert(latex))
+        except Exception:
+            pass
+    return results
+
+
+def count_equal(results, loaded):
+    return sum(1 for a, b in zip(results, loaded) if type(a) == type(b) and a == b)
+
+
+def srepr_dumps(results):
+    return '\n'.join(sympy.srepr(result) for result in results).encode()
+
+
+def sympify_loads(data):
+    loaded = []
+    for line in data.decode().split('\n'):
+        try:
+            loaded.append(sympy.sympify(line))
+        except Exception:
+            loaded.append(None)
+    return loaded
+
+
+CODECS = [
+    ('transport', transport.dumps, transport.loads),
+    ('pickle', lambda results: pickle.dumps(results, pickle.HIGHEST_PROTOCOL), pickle.loads),
+    ('srepr/sympify', srepr_dumps, sympify_loads),
+]
+
+for name, convert, latex_list in [
+    ('process_sympy', process_sympy, get_test_corpus()),
+    ('process_sympy_as_unit', process_sympy_as_unit, get_test_corpus(unit_examples=True)),
+]:
+    results = convert_all(convert, latex_list)
+    print(f'{name}: {len(results)} results')
+    for codec_name, dumps, loads in CODECS:
+        data = dumps(results)
+        dumps_seconds = min(timeit.repeat(lambda: dumps(results), number=1, repeat=REPEAT))
+        loads_seconds = min(timeit.repeat(lambda: loads(data), number=1, repeat=REPEAT))
+        equal = count_equal(results, loads(data))
+        print(f'{codec_name:>15}: dumps {dumps_seconds * 1000:7.1f} ms, loads {loads_seconds * 1000:7.1f} ms, '
+              f'{len(data) / 1024:6.1f} KB, {equal}/{len(results)} equal')
@@ -0,0 +1,65 @@
+'''
+Measure the cost of loading the unit aliases on a cold interpreter: the time and peak RSS of the first `find_unit`
+call for a string which is not a unit (a miss), including importing the units subsystem,
+then of the first lookup of a unit (a hit), and of the first lookup of a prefixed unit which is created on demand
+(a prefixed hit).
+
+Each measurement runs in a fresh python process, with `sympy.physics.units` already imported,
+as it is by any unit conversion.
+
+With the previous pickled `UNIT_ALIASES` (every `Quantity` unpickled, and the unit system built, on first use),
+a miss took ~100 ms and +4.2 MB, and a hit was then free.
+With the alias index, a miss took ~30 ms and +1.3 MB, and the first hit ~50 ms and +1.0 MB, mostly to build `SIE`.
+With additional prefixed units (e.g. `GiB`) created on demand, rather than for every prefix up front, the index is a
+third smaller, a miss takes ~28 ms and +1.0 MB, the first hit ~15 ms and +0.1 MB, and a prefixed hit is <1 ms.
+
+Run from the root of the repo: `python sandbox/benchmark_unit_aliases.py`
+'''
+import os
+import statistics
+import subprocess
+import sys
+
+RUN_COUNT = 5
+
+MEASURE = '''
+import resource, time
+import sympy.physics.units
+
+def measure(func):
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    t0 = time.perf_counter()
+    func()
+    return time.perf_counter() - t0, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss
+
+def first_miss():
+    from latex2sympy.units import find_unit
+    find_unit('notaunit')
+
+def first_hit():
+    from latex2sympy.units import find_unit
+    find_unit('km')
+
+def first_prefixed_hit():
+    from latex2sympy.units import find_unit
+    find_unit('GiB')
+
+miss = measure(first_miss)
+hit = measure(first_hit)
+prefixed_hit = measure(first_prefixed_hit)
+print(*miss, *hit, *prefixed_hit)
+'''
+
+
+def run():
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(['src', os.environ.get('PYTHONPATH', '')]))
+    output = subprocess.check_output([sys.executable, '-c', MEASURE], env=env).decode().split()
+    return [float(value) for value in output]
+
+
+runs = [run() for _ in range(RUN_COUNT)]
+for name, offset in [('first miss', 0), ('first hit', 2), ('first prefixed hit', 4)]:
+    seconds = statistics.median(r[offset] for r in runs)
+    # `ru_maxrss` is in KB on linux, and in bytes on macOS
+    rss = statistics.median(r[offset + 1] for r in runs) / (1024 if sys.platform != 'darwin' else 1024 * 1024)
+    print(f'{name:>18}: {seconds * 1000:6.1f} ms, +{rss:.1f} MB peak RSS')
@@ -0,0 +1,48 @@
+'''
+Collect the latex strings used by the test suite, for use as a benchmark corpus.
+
+Strings are taken from the module-level and class-level example lists in `tests/*_test.py`,
+e.g. `TestAllGood.GOOD_PAIRS` or `unit_examples`.
+'''
+import importlib
+import os
+import sys
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if ROOT_DIR not in sys.path:
+    sys.path.append(ROOT_DIR)
+
+
+def get_latex_strings(values):
+    strings = []
+    if not isinstance(values, list):
+        return strings
+    for value in values:
+        if isinstance(value, str):
+            strings.append(value)
+        elif isinstance(value, tuple) and len(value) > 0 and isinstance(value[0], str):
+            strings.append(value[0])
+    return strings
+
+
+def get_test_corpus(unit_examples=False):
+    '''
+    Return the unique latex strings from the test suite, in a stable order.
+
+    unit_examples: bool - include the examples from `tests/unit_test.py`, which only parse with `process_sympy_as_unit`
+    '''
+    corpus = {}
+    tests_dir = os.path.join(ROOT_DIR, 'tests')
+    for file_name in sorted(os.listdir(tests_dir)):
+        if not file_name.endswith('_test.py') or (file_name == 'unit_test.py' and not unit_examples):
+            continue
+        module = importlib.import_module('tests.' + file_name[:-3])
+        for attr in dir(module):
+            value = getattr(module, attr)
+            candidates = [value]
+            if isinstance(value, type) and value.__module__ == module.__name__:
+                candidates = [getattr(value, class_attr) for class_attr in dir(value) if class_attr.isupper()]
+            for candidate in candidates:
+                for latex in get_latex_strings(candidate):
+                    corpus[latex] = True
+    return list(corpus.keys())
@@ -1,5 +1,6 @@
 from sympy import *
 from latex2sympy import process_sympy
+from latex2sympy.equivalence import are_equivalent
 
 
 #
@@ -72,4 +73,5 @@ for answer_set in answer_sets:
         print('simplified =>', simplify(correct_answer_parsed - student_answer_parsed))
         print('')
         print('Numeric Substitution (c.equals(s)) =>', correct_answer_parsed.equals(student_answer_parsed))
+        print('Random Sampling (are_equivalent(c, s)) =>', are_equivalent(correct_answer, student_answer))
         print('-----------------------------------------------------')
@@ -28,10 +28,13 @@ setup(
         'latex2sympy.lib.macOS.arm64': ['latex2antlrJson.so'],
         'latex2sympy.lib.macOS.x86_64': ['latex2antlrJson.so'],
         'latex2sympy.units': [],
-        'latex2sympy.units.unit_aliases': [],
+        'latex2sympy.units.unit_aliases': ['unit_aliases_index.json'],
         'latex2sympy.utils': []
     },
     install_requires=[
         'sympy==1.12'
-    ]
+    ],
+    extras_require={
+        'numeric': ['numpy']
+    }
 )
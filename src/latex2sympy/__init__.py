@@ -0,0 +1,21 @@
+import importlib
+
+# top-level functions, by the module they are loaded from on first use,
+# so that e.g. `latex2sympy.validate` does not import sympy
+LAZY_ATTRIBUTES = {
+    'validate': 'latex2sympy.validation',
+    'process_sympy_many': 'latex2sympy.batch',
+}
+
+
+def __getattr__(name):
+    if name in LAZY_ATTRIBUTES:
+        value = getattr(importlib.import_module(LAZY_ATTRIBUTES[name]), name)
+        # later lookups find the value directly, without calling `__getattr__`
+        globals()[name] = value
+        return value
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+def __dir__():
+    return sorted(set(globals()) | set(LAZY_ATTRIBUTES))
@@ -0,0 +1,110 @@
+import concurrent.futures
+import os
+import pickle
+from latex2sympy import transport
+from latex2sympy.latex2sympy import LatexToSympy, copy_mutable
+from latex2sympy.latex2sympyAsUnit import LatexToSympyAsUnit
+
+# the number of chunks per worker, so that the workers which get the cheaper chunks can take more of them
+CHUNKS_PER_WORKER = 4
+
+
+def process_sympy_many(latex_list: list, variable_values: dict = None, workers: int = None, as_unit: bool = False):
+    '''
+    Convert many latex strings, and return the result of each, in order, or the exception it raised.
+
+    Each distinct string is converted once. With `workers` (by default the number of CPUs, 0 converts in this
+    process), the strings are converted in a pool of that many processes, in chunks of about the same estimated cost
+    (see `estimate_cost`). The most expensive chunks are dispatched first, so that a long expression (e.g. a large
+    matrix) does not start last, while the other workers are idle.
+
+    With `as_unit`, the strings are converted with `LatexToSympyAsUnit`.
+    '''
+    variable_values = variable_values or {}
+    pending = list(dict.fromkeys(latex_list))
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers > 0 and len(pending) > 1:
+        results = {}
+        with concurrent.futures.ProcessPoolExecutor(workers, initializer=init_worker,
+                                                    initargs=(variable_values, as_unit)) as executor:
+            chunks = get_chunks(pending, workers * CHUNKS_PER_WORKER)
+            for chunk, chunk_data in zip(chunks, executor.map(convert_chunk_in_worker, chunks)):
+                results.update(zip(chunk, transport.loads(chunk_data)))
+    else:
+        results = {latex: convert(latex, variable_values, as_unit) for latex in pending}
+
+    # each duplicate gets its own copy of any mutable result (lists and mutable matrices)
+    seen = set()
+    return_data = []
+    for latex in latex_list:
+        result = results[latex]
+        return_data.append(copy_mutable(result) if latex in seen else result)
+        seen.add(latex)
+    return return_data
+
+
+def estimate_cost(latex: str):
+    '''
+    Return the estimated cost of converting the latex, which is its length, as the number of tokens (and so the size
+    of the tree to convert) grows with it
+    '''
+    return len(latex)
+
+
+def get_chunks(latex_list: list, chunk_count: int):
+    '''
+    Split the latex strings into chunks of at least `1 / chunk_count` of the total estimated cost each,
+    from the most to the least expensive, so that an expensive string is in a chunk by itself, and cheap strings are
+    grouped, to not send each one to a worker separately
+    '''
+    latex_list = sorted(latex_list, key=estimate_cost, reverse=True)
+    target_cost = sum(estimate_cost(latex) for latex in latex_list) / chunk_count
+    chunks = []
+    chunk, chunk_cost = [], 0
+    for latex in latex_list:
+        chunk.append(latex)
+        chunk_cost += estimate_cost(latex)
+        if chunk_cost >= target_cost:
+            chunks.append(chunk)
+            chunk, chunk_cost = [], 0
+    if len(chunk) > 0:
+        chunks.append(chunk)
+    return chunks
+
+
+def convert(latex: str, variable_values: dict, as_unit: bool):
+    converter_class = LatexToSympyAsUnit if as_unit else LatexToSympy
+    try:
+        return converter_class(latex, variable_values).process_sympy()
+    except Exception as e:
+        return e
+
+
+# the options of a worker process, set once when the process starts
+worker_variable_values = None
+worker_as_unit = False
+
+
+def init_worker(variable_values: dict, as_unit: bool):
+    global worker_variable_values, worker_as_unit
+    worker_variable_values = variable_values
+    worker_as_unit = as_unit
+
+
+def convert_chunk_in_worker(chunk: list):
+    results = [convert(latex, worker_variable_values, worker_as_unit) for latex in chunk]
+    # the results are sent back with `transport`, as pickle would evaluate them when unpickled
+    return transport.dumps([get_picklable_exception(r) if isinstance(r, Exception) else r for r in results])
+
+
+def get_picklable_exception(e: Exception):
+    '''
+    Return the exception, or an `Exception` with its message, if it cannot be sent back from the worker process
+    '''
+    try:
+        pickle.dumps(e)
+        return e
+    except Exception:  # pragma: no cover
+        return Exception(str(e))
@@ -0,0 +1,125 @@
+import hashlib
+import sympy
+from latex2sympy.latex2sympy import process_sympy
+
+# largest exponent folded into a number, e.g. `2^{10}`, so that `10^{10^{10}}` is not computed
+MAX_FOLDED_EXPONENT = 64
+
+# relations which are the same when swapped, e.g. `a > b` and `b < a`
+REVERSED_RELATIONS = {
+    sympy.StrictGreaterThan: sympy.StrictLessThan,
+    sympy.GreaterThan: sympy.LessThan,
+}
+
+# relations with interchangeable sides
+SYMMETRIC_RELATIONS = (sympy.Eq, sympy.Ne)
+
+
+def canonical_hash(expr, bits: int = 64):
+    '''
+    Return a hash of the canonical form of a converted expression (see `canonicalize`), as an int of `bits` bits
+    (64 or 128). Unlike `hash()`, it is the same in every process, so it can be stored and compared across runs.
+    '''
+    if bits not in (64, 128):
+        raise Exception('Expected 64 or 128 bits')
+    text = sympy.srepr(canonicalize(expr))
+    return int.from_bytes(hashlib.blake2b(text.encode(), digest_size=bits // 8).digest(), 'big')
+
+
+def canonical_hash_latex(latex: str, variable_values: dict = {}, bits: int = 64):
+    return canonical_hash(process_sympy(latex, variable_values), bits)
+
+
+def canonicalize(expr):
+    '''
+    Return a canonical form of a converted expression, so that answers which only differ in the order of terms
+    or factors, or in how a division or a number is written, are identical, e.g. `(x+2y)(x-y)` and `(x-y)(x+2y)`,
+    or `2\\times y` and `y\\cdot 2`.
+
+    - nested `Add`/`Mul`/`MatAdd` are flattened and their args are sorted (`MatMul` is not commutative)
+    - a division `Pow(Mul(a, b), -1)` is split into `Pow(a, -1)` and `Pow(b, -1)`
+    - numbers are folded, e.g. `2 \\cdot 3 x` is `6x` and `\\frac{1}{2}` is `Rational(1, 2)`
+    - relations are written with `<`/`\\leq`, and the sides of `=`/`\\neq` are sorted
+
+    The result is not evaluated further, so it is not a simplification, e.g. `x^2-y^2` and `(x-y)(x+y)` differ.
+    '''
+    if isinstance(expr, list):
+        return [canonicalize(item) for item in expr]
+    if getattr(expr, 'is_Matrix', False) and not isinstance(expr, sympy.MatrixExpr):
+        return sympy.ImmutableMatrix(expr.rows, expr.cols, [canonicalize(item) for item in expr])
+    if not isinstance(expr, sympy.Basic) or expr.is_Atom:
+        return expr
+
+    args = [canonicalize(arg) for arg in expr.args]
+
+    with sympy.evaluate(False):
+        if expr.is_Add:
+            return canonicalize_add(args)
+        elif expr.is_Mul:
+            return canonicalize_mul(args)
+        elif expr.is_Pow:
+            return canonicalize_pow(*args)
+        elif isinstance(expr, sympy.MatAdd):
+            return sympy.MatAdd(*sort_args(flatten_args(args, sympy.MatAdd)))
+        elif isinstance(expr, sympy.MatMul):
+            return sympy.MatMul(*flatten_args(args, sympy.MatMul))
+        elif type(expr) in REVERSED_RELATIONS:
+            return REVERSED_RELATIONS[type(expr)](args[1], args[0])
+        elif isinstance(expr, SYMMETRIC_RELATIONS):
+            return expr.func(*sort_args(args))
+        return expr.func(*args)
+
+
+def canonicalize_add(args):
+    args = flatten_args(args, sympy.Add)
+    numbers = [arg for arg in args if arg.is_Number]
+    others = [arg for arg in args if not arg.is_Number]
+    if len(numbers) > 0:
+        number = fold_numbers(sympy.Add, numbers)
+        others = others if number == 0 and len(others) > 0 else others + [number]
+    if len(others) == 1:
+        return others[0]
+    return sympy.Add(*sort_args(others))
+
+
+def canonicalize_mul(args):
+    args = flatten_args(args, sympy.Mul)
+    # split a division of a product, e.g. `\frac{1}{ab}`
+    args = flatten_args([canonicalize_pow(*arg.args) if arg.is_Pow else arg for arg in args], sympy.Mul)
+    numbers = [arg for arg in args if arg.is_Number]
+    others = [arg for arg in args if not arg.is_Number]
+    if len(numbers) > 0:
+        number = fold_numbers(sympy.Mul, numbers)
+        others = others if number == 1 and len(others) > 0 else [number] + others
+    if len(others) == 1:
+        return others[0]
+    return sympy.Mul(others[0], *sort_args(others[1:])) if others[0].is_Number else sympy.Mul(*sort_args(others))
+
+
+def canonicalize_pow(base, exp):
+    if exp == 1:
+        return base
+    if base.is_Number and exp.is_Integer and abs(exp) <= MAX_FOLDED_EXPONENT and not (base == 0 and exp < 0):
+        return fold_numbers(sympy.Pow, [base, exp])
+    if base.is_Mul and exp == -1 and base.is_commutative:
+        return canonicalize_mul([sympy.Pow(arg, -1) for arg in base.args])
+    return sympy.Pow(base, exp)
+
+
+def fold_numbers(cls, numbers):
+    with sympy.evaluate(True):
+        return cls(*numbers)
+
+
+def flatten_args(args, cls):
+    flat_args = []
+    for arg in args:
+        if isinstance(arg, cls):
+            flat_args.extend(arg.args)
+        else:
+            flat_args.append(arg)
+    return flat_args
+
+
+def sort_args(args):
+    return sorted(args, key=sympy.default_sort_key)
@@ -0,0 +1,230 @@
+import sympy
+from latex2sympy.latex2sympy import process_sympy
+from latex2sympy.numeric import compile_numeric, numpy
+
+# sample domains by symbol assumptions, as (low, high)
+POSITIVE_DOMAIN = (0.5, 5.0)
+REAL_DOMAIN = (-5.0, 5.0)
+
+# relations which are equivalent when swapped, e.g. `a < b` and `b > a`
+REVERSED_RELATIONS = {
+    sympy.StrictGreaterThan: sympy.StrictLessThan,
+    sympy.GreaterThan: sympy.LessThan,
+}
+
+# the most operations (see `sympy.count_ops`) an expression can have to be simplified by `compare_symbolic`,
+# as `simplify` can take arbitrarily long on a large expression
+SIMPLIFY_MAX_OPS = 200
+
+
+def are_equivalent(correct_latex: str, student_latex: str, variable_values: dict = {}, samples: int = 32,
+                   rtol: float = 1e-8, atol: float = 1e-10, seed: int = 0, symbolic_fallback: bool = True):
+    '''
+    Determine if two latex answers are mathematically equivalent, e.g. `(x-y)(x+2y)` and `x^2+xy-2y^2`.
+
+    Both sides are evaluated at `samples` random points, drawn from domains that match the symbol assumptions
+    (e.g. `positive=True`), and compared with `rtol` and `atol`. A difference at any point means not equivalent.
+    If too few points can be evaluated (e.g. division by zero, or functions with no numeric form),
+    the result is inconclusive, and a symbolic check is used instead if `symbolic_fallback` is set.
+    Returns `None` if the symbolic check is inconclusive too, see `compare_symbolic`.
+    '''
+    correct = process_sympy(correct_latex, variable_values)
+    student = process_sympy(student_latex, variable_values)
+    return are_equivalent_exprs(correct, student, samples=samples, rtol=rtol, atol=atol, seed=seed,
+                                symbolic_fallback=symbolic_fallback)
+
+
+def are_equivalent_exprs(correct, student, samples: int = 32, rtol: float = 1e-8, atol: float = 1e-10, seed: int = 0,
+                         symbolic_fallback: bool = True):
+    '''
+    Same as `are_equivalent`, for already converted expressions
+    '''
+    result = compare_numeric(correct, student, samples=samples, rtol=rtol, atol=atol, seed=seed)
+    if result is None and symbolic_fallback:
+        return compare_symbolic(correct, student)
+    return bool(result)
+
+
+def compare_numeric(correct, student, samples: int = 32, rtol: float = 1e-8, atol: float = 1e-10, seed: int = 0):
+    '''
+    Compare two converted expressions at random points.
+
+    Returns `True` or `False`, or `None` if inconclusive.
+    '''
+    if numpy is None:  # pragma: no cover
+        return None
+
+    if isinstance(correct, list) or isinstance(student, list):
+        if not isinstance(correct, list) or not isinstance(student, list) or len(correct) != len(student):
+            return False
+        results = [compare_numeric(c, s, samples, rtol, atol, seed) for c, s in zip(correct, student)]
+        return False if False in results else (None if None in results else True)
+
+    correct, student = normalize_relation(correct), normalize_relation(student)
+    if isinstance(correct, sympy.core.relational.Relational) or isinstance(student, sympy.core.relational.Relational):
+        if type(correct) != type(student):
+            return False
+        return compare_residuals(correct, student, samples, rtol, atol, seed)
+
+    if getattr(correct, 'is_Matrix', False) or getattr(student, 'is_Matrix', False):
+        return compare_matrices(correct, student, samples, rtol, atol, seed)
+
+    symbols = get_symbols(correct, student)
+    points = get_sample_points(symbols, samples, seed)
+    correct_values = evaluate_samples(correct, symbols, points, samples)
+    student_values = evaluate_samples(student, symbols, points, samples)
+    return compare_samples(correct_values, student_values, samples, rtol, atol)
+
+
+def compare_symbolic(correct, student):
+    '''
+    Compare two converted expressions symbolically, which may be slow.
+
+    Returns `True` or `False`, or `None` if inconclusive, i.e. if an expression to simplify has more than
+    `SIMPLIFY_MAX_OPS` operations, as it is not simplified.
+    '''
+    if isinstance(correct, list) or isinstance(student, list):
+        if not isinstance(correct, list) or not isinstance(student, list) or len(correct) != len(student):
+            return False
+        results = [compare_symbolic(c, s) for c, s in zip(correct, student)]
+        return False if False in results else (None if None in results else True)
+
+    correct, student = normalize_relation(correct), normalize_relation(student)
+    if isinstance(correct, sympy.core.relational.Relational) or isinstance(student, sympy.core.relational.Relational):
+        if type(correct) != type(student):
+            return False
+        correct_residual = correct.rhs - correct.lhs
+        student_residual = student.rhs - student.lhs
+        ratio = simplify_bounded(correct_residual / student_residual)
+        if ratio is None:
+            return None
+        if not ratio.is_constant() or ratio == 0:
+            return False
+        return not isinstance(correct, (sympy.StrictLessThan, sympy.LessThan)) or bool(ratio > 0)
+
+    try:
+        difference = correct.doit() - student.doit()
+        if sympy.count_ops(difference) > SIMPLIFY_MAX_OPS:
+            return None
+        difference = simplify_bounded(sympy.expand(difference))
+        if difference is None:
+            return None
+        return bool(difference.is_zero_matrix) if difference.is_Matrix else difference == 0
+    except Exception:
+        return False
+
+
+def simplify_bounded(expr):
+    '''
+    Simplify the expression, or return `None` if it has more than `SIMPLIFY_MAX_OPS` operations
+    '''
+    if sympy.count_ops(expr) > SIMPLIFY_MAX_OPS:
+        return None
+    return sympy.simplify(expr)
+
+
+def normalize_relation(expr):
+    cls = REVERSED_RELATIONS.get(type(expr))
+    if cls is not None:
+        return cls(expr.rhs, expr.lhs, evaluate=False)
+    return expr
+
+
+def get_symbols(*exprs):
+    symbols = set()
+    for expr in exprs:
+        symbols |= expr.free_symbols
+    return sorted(symbols, key=lambda s: s.name)
+
+
+def get_sample_points(symbols, samples: int, seed: int = 0):
+    '''
+    Return an array of `samples` random values for each symbol, in a domain that matches its assumptions
+    '''
+    rng = numpy.random.default_rng(seed)
+    points = []
+    for symbol in symbols:
+        low, high = POSITIVE_DOMAIN if symbol.is_positive else REAL_DOMAIN
+        values = rng.uniform(low, high, samples)
+        if symbol.is_integer:
+            values = numpy.round(values)
+        if not symbol.is_real:
+            values = values + 1j * rng.uniform(low, high, samples)
+        points.append(values)
+    return points
+
+
+def evaluate_samples(expr, symbols, points, samples: int):
+    '''
+    Evaluate `expr` at the sample `points` of `symbols`, or return `None` if it has no numeric form
+    '''
+    try:
+        # derivatives are cheap to evaluate symbolically, and have no numeric form
+        if expr.has(sympy.Derivative):
+            expr = expr.replace(lambda e: isinstance(e, sympy.Derivative), lambda e: e.doit())
+        func = compile_numeric(expr, symbols=symbols)
+        with numpy.errstate(all='ignore'):
+            values = numpy.asarray(func(*points), dtype=complex)
+        # constants are evaluated once, repeat them for each point
+        return numpy.broadcast_to(values, (samples,))
+    except Exception:
+        return None
+
+
+def compare_samples(correct_values, student_values, samples: int, rtol: float, atol: float):
+    if correct_values is None or student_values is None:
+        return None
+    # only compare the points where both sides are defined, and require at least half of the points
+    finite = numpy.isfinite(correct_values) & numpy.isfinite(student_values)
+    if numpy.count_nonzero(finite) < max(1, samples // 2):
+        return None
+    return bool(numpy.allclose(correct_values[finite], student_values[finite], rtol=rtol, atol=atol))
+
+
+def compare_residuals(correct, student, samples: int, rtol: float, atol: float, seed: int):
+    '''
+    Compare relations by their residuals `rhs - lhs`, which must be proportional, e.g. `a=x+1` and `2a=2x+2`
+    '''
+    symbols = get_symbols(correct, student)
+    points = get_sample_points(symbols, samples, seed)
+    correct_values = evaluate_samples(correct.rhs - correct.lhs, symbols, points, samples)
+    student_values = evaluate_samples(student.rhs - student.lhs, symbols, points, samples)
+    return compare_residual_samples(correct, correct_values, student_values, samples, rtol, atol)
+
+
+def compare_residual_samples(correct, correct_values, student_values, samples: int, rtol: float, atol: float):
+    if correct_values is None or student_values is None:
+        return None
+
+    finite = numpy.isfinite(correct_values) & numpy.isfinite(student_values)
+    if numpy.count_nonzero(finite) < max(1, samples // 2):
+        return None
+    correct_values, student_values = correct_values[finite], student_values[finite]
+
+    # where one residual is zero, the other must be too
+    nonzero = ~numpy.isclose(student_values, 0, atol=atol)
+    if not numpy.array_equal(nonzero, ~numpy.isclose(correct_values, 0, atol=atol)):
+        return False
+    if not numpy.any(nonzero):
+        return True
+
+    ratios = correct_values[nonzero] / student_values[nonzero]
+    if not numpy.allclose(ratios, ratios[0], rtol=rtol, atol=atol):
+        return False
+    # an inequality can only be scaled by a positive number
+    if isinstance(correct, (sympy.StrictLessThan, sympy.LessThan)):
+        return bool(ratios[0].real > 0 and abs(ratios[0].imag) <= atol)
+    return True
+
+
+def compare_matrices(correct, student, samples: int, rtol: float, atol: float, seed: int):
+    if not getattr(correct, 'is_Matrix', False) or not getattr(student, 'is_Matrix', False):
+        return False
+    try:
+        correct, student = sympy.Matrix(correct.doit()), sympy.Matrix(student.doit())
+    except Exception:
+        return None
+    if correct.shape != student.shape:
+        return False
+    results = [compare_numeric(c, s, samples, rtol, atol, seed) for c, s in zip(correct, student)]
+    return False if False in results else (None if None in results else True)
@@ -0,0 +1,217 @@
+import concurrent.futures
+import time
+from collections import namedtuple
+import sympy
+import sympy.physics.units as sympy_units
+from latex2sympy.latex2sympy import LatexToSympy
+from latex2sympy.latex2sympyAsUnit import LatexToSympyAsUnit
+from latex2sympy.canonical import canonical_hash
+from latex2sympy.equivalence import compare_numeric, compare_symbolic, compare_samples, compare_residual_samples, \
+    normalize_relation, get_symbols, get_sample_points, evaluate_samples
+from latex2sympy.numeric import numpy
+from latex2sympy.units import convert_to_base_units
+
+# tiers of the grading pipeline, in order, each one only runs if the previous ones did not decide
+TIERS = ('syntax', 'hash', 'numeric', 'symbolic')
+
+# units which have the same dimension, but measure different kinds of radiation doses, as in `units.convert_to`
+DOSE_UNIT_NAMES = ('gray', 'sievert')
+
+GradingResult = namedtuple('GradingResult', ['latex', 'correct', 'tier', 'error', 'timings'])
+GradingResult.__doc__ = '''
+The score of a student answer.
+
+correct: bool - if the answer is equivalent to the correct answer, or None if the symbolic check is inconclusive
+tier: str - the tier of the pipeline which decided, one of `TIERS`
+error: str - the conversion error, if the answer could not be converted
+timings: dict - tier -> seconds spent on the answer in that tier
+'''
+
+
+class GradingSession:
+    '''
+    Score many student answers against one correct answer.
+
+    The correct answer is converted once, and its canonical hash, symbols, sample points and values at those points
+    are precomputed. Each student answer then goes through the tiers of the pipeline, stopping at the first that
+    decides:
+
+    - syntax: an answer which cannot be converted is not correct
+    - hash: an answer with the same `canonical_hash` is correct
+    - numeric: both answers are compared at the sample points, as in `are_equivalent`
+    - symbolic: if sampling was inconclusive, and `symbolic_fallback` is set, both answers are compared symbolically
+
+    With `units`, answers are converted with `LatexToSympyAsUnit`, and compared in the base units of the
+    "SI Extended" unit system, e.g. `km` and `1000\\: m` are equivalent.
+
+    Results are cached by student latex for the whole session, and the total time spent in each tier is in `timings`.
+    '''
+
+    def __init__(self, correct_latex: str, variable_values: dict = {}, units: bool = False, samples: int = 32,
+                 rtol: float = 1e-8, atol: float = 1e-10, seed: int = 0, symbolic_fallback: bool = True):
+        self.correct_latex = correct_latex
+        self.variable_values = variable_values
+        self.units = units
+        self.samples = samples
+        self.rtol = rtol
+        self.atol = atol
+        self.seed = seed
+        self.symbolic_fallback = symbolic_fallback
+
+        self.correct = self.convert(correct_latex)
+        self.correct_hash = canonical_hash(self.correct)
+        self.correct_expr = self.prepare(self.correct)
+        self.symbols = get_symbols(self.correct_expr) if not isinstance(self.correct_expr, list) else []
+        self.points = get_sample_points(self.symbols, samples, seed) if numpy is not None else None
+        self.correct_values = self.evaluate(self.correct_expr, self.symbols, self.points)
+
+        self.results = {}
+        self.timings = dict.fromkeys(TIERS, 0.0)
+
+    def __getstate__(self):
+        # worker processes do not need the results of the session
+        state = self.__dict__.copy()
+        state['results'] = {}
+        state['timings'] = dict.fromkeys(TIERS, 0.0)
+        return state
+
+    def convert(self, latex: str):
+        converter_class = LatexToSympyAsUnit if self.units else LatexToSympy
+        return converter_class(latex, self.variable_values).process_sympy()
+
+    def prepare(self, expr):
+        '''
+        Return the form of a converted answer which is compared at the sample points
+        '''
+        if isinstance(expr, list):
+            return [self.prepare(item) for item in expr]
+        if self.units:
+            # compare units by their scale in base units, with each base unit as a positive symbol
+            expr = convert_to_base_units(expr)
+            expr = expr.xreplace({q: sympy.Symbol(str(q.name), positive=True) for q in expr.atoms(sympy_units.Quantity)})
+        return normalize_relation(expr)
+
+    def evaluate(self, expr, symbols, points):
+        '''
+        Return the values of a prepared scalar expression or relation at the sample points, or `None` if the answer
+        is a list or matrix (which are compared with `compare_numeric` instead), or has no numeric form
+        '''
+        if points is None or isinstance(expr, list) or getattr(expr, 'is_Matrix', False):
+            return None
+        if isinstance(expr, sympy.core.relational.Relational):
+            expr = expr.rhs - expr.lhs
+        return evaluate_samples(expr, symbols, points, self.samples)
+
+    def score(self, student_latex: str):
+        '''
+        Return the `GradingResult` of a student answer
+        '''
+        result = self.results.get(student_latex)
+        if result is None:
+            result = self.grade(student_latex)
+            self.add_result(result)
+        return result
+
+    def score_many(self, student_latex_list: list, processes: int = 0):
+        '''
+        Return the `GradingResult` of each student answer, in order.
+
+        Each distinct answer is only graded once. With `processes`, the answers which are not cached yet are graded
+        in a pool of that many processes.
+        '''
+        pending = list(dict.fromkeys(latex for latex in student_latex_list if latex not in self.results))
+        if processes > 0 and len(pending) > 1:
+            with concurrent.futures.ProcessPoolExecutor(processes, initializer=init_worker, initargs=(self,)) as executor:
+                chunksize = max(1, len(pending) // (processes * 4))
+                for result in executor.map(grade_in_worker, pending, chunksize=chunksize):
+                    self.add_result(result)
+        else:
+            for latex in pending:
+                self.add_result(self.grade(latex))
+        return [self.results[latex] for latex in student_latex_list]
+
+    def add_result(self, result):
+        self.results[result.latex] = result
+        for tier, seconds in result.timings.items():
+            self.timings[tier] += seconds
+
+    def grade(self, student_latex: str):
+        timings = {}
+        start = time.perf_counter()
+
+        def finish(tier, correct, error=None):
+            timings[tier] = time.perf_counter() - start
+            return GradingResult(student_latex, correct, tier, error, timings)
+
+        try:
+            student = self.convert(student_latex)
+        except Exception as e:
+            return finish('syntax', False, str(e))
+        timings['syntax'] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        try:
+            if canonical_hash(student) == self.correct_hash:
+                return finish('hash', True)
+        except Exception:  # pragma: no cover
+            pass
+        timings['hash'] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        try:
+            student_expr = self.prepare(student)
+            result = self.compare_numeric(student, student_expr)
+        except Exception:
+            student_expr, result = None, None
+        if result is not None or not self.symbolic_fallback or student_expr is None:
+            return finish('numeric', bool(result))
+        timings['numeric'] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        return finish('symbolic', compare_symbolic(self.correct_expr, student_expr))
+
+    def compare_numeric(self, student, student_expr):
+        if self.units:
+            correct_doses, student_doses = get_dose_units(self.correct), get_dose_units(student)
+            if len(correct_doses) > 0 and len(student_doses) > 0 and correct_doses != student_doses:
+                return False
+        if self.correct_values is None or isinstance(student_expr, list) or getattr(student_expr, 'is_Matrix', False):
+            return compare_numeric(self.correct_expr, student_expr, self.samples, self.rtol, self.atol, self.seed)
+
+        correct_relation = isinstance(self.correct_expr, sympy.core.relational.Relational)
+        if correct_relation or isinstance(student_expr, sympy.core.relational.Relational):
+            if type(self.correct_expr) != type(student_expr):
+                return False
+
+        # reuse the correct answer's sample points, and only sample the symbols it does not have
+        extra_symbols = [s for s in get_symbols(student_expr) if s not in self.symbols]
+        symbols = self.symbols + extra_symbols
+        points = self.points + get_sample_points(extra_symbols, self.samples, self.seed + 1)
+        student_values = self.evaluate(student_expr, symbols, points)
+        if correct_relation:
+            return compare_residual_samples(self.correct_expr, self.correct_values, student_values, self.samples,
+                                            self.rtol, self.atol)
+        return compare_samples(self.correct_values, student_values, self.samples, self.rtol, self.atol)
+
+
+def get_dose_units(expr):
+    '''
+    Return the names of the radiation dose units (e.g. gray) of a unit expression, including prefixed ones
+    '''
+    if isinstance(expr, list):
+        return set().union(*[get_dose_units(item) for item in expr])
+    names = [str(q.name) for q in expr.atoms(sympy_units.Quantity)]
+    return {dose for dose in DOSE_UNIT_NAMES if any(name.endswith(dose) for name in names)}
+
+
+# the session of a worker process, set once when the process starts
+worker_session = None
+
+
+def init_worker(session):
+    global worker_session
+    worker_session = session
+
+
+def grade_in_worker(student_latex: str):
+    return worker_session.grade(student_latex)
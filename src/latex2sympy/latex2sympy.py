@@ -1,21 +1,91 @@
+import functools
 import hashlib
-import json
 import re
 import sympy
-from latex2sympy.lib import parseToJson, LATEXLexerToken
+from latex2sympy.lib import parseToObject, LATEXLexerToken
 from latex2sympy.utils.differential import DIFFERENTIAL_PREFIX, is_differential_var, get_differential_var
-from latex2sympy.utils.expression import create_rational_or_number, add_flat, mat_add_flat, mul_flat, mat_mul_flat, create_ceil, create_floor, create_gcd_lcm
-from latex2sympy.utils.json import has_type_or_token, get_token
+from latex2sympy.utils.expression import create_rational_or_number, add_flat, mul_flat, mat_mul_flat, create_ceil, create_floor, create_gcd_lcm, FlatChain, negate_flat
+from latex2sympy.utils.json import has_type_or_token, get_token, get_chain, get_func_args, find_type
+from latex2sympy.utils.token import wrap_single_char_sub_sup, split_e_notation, split_polar_angle, is_variable_text, is_number_text, POLAR_ANGLE_DEGREES_REGEX, RADIAN_FRACTION_REGEX, RADIANS_REGEX
+from latex2sympy.utils.cache import LRUCache
 
 # replacement for `sympy.S.EmptySet` which can be printed to a string, or used in expression comparisons
 EmptySet = sympy.Symbol('emptyset')
 
+# opt-in cache of `process_sympy` results, keyed on the pre-processed latex and the variable values
+# disabled by default, enable with e.g. `parse_cache.resize(1024)`
+parse_cache = LRUCache()
+
+
+# relation classes, by the type of the relation's operator token
+RELATION_CLASSES = {
+    LATEXLexerToken.LT: sympy.StrictLessThan,
+    LATEXLexerToken.LTE: sympy.LessThan,
+    LATEXLexerToken.GT: sympy.StrictGreaterThan,
+    LATEXLexerToken.GTE: sympy.GreaterThan,
+    LATEXLexerToken.EQUAL: sympy.Eq,
+    LATEXLexerToken.UNEQUAL: sympy.Ne,
+}
+
+# converters for atoms, by the type of the atom or one of its tokens
+ATOM_CONVERTERS = {
+    LATEXLexerToken.SYMBOL: lambda self, atom: self.convert_atom_symbol(atom),
+    LATEXLexerToken.NUMBER: lambda self, atom: self.convert_atom_number(atom),
+    LATEXLexerToken.SCI_NOTATION_NUMBER: lambda self, atom: self.convert_atom_sci_notation_number(atom),
+    LATEXLexerToken.FRACTION_NUMBER: lambda self, atom: self.convert_atom_fraction_number(atom),
+    LATEXLexerToken.E_NOTATION: lambda self, atom: self.convert_atom_e_notation(atom),
+    LATEXLexerToken.VARIABLE: lambda self, atom: self.convert_atom_variable(atom),
+    LATEXLexerToken.PERCENT_NUMBER: lambda self, atom: self.convert_atom_percent_number(atom),
+    LATEXLexerToken.COMPLEX_NUMBER_POLAR_ANGLE: lambda self, atom: self.convert_atom_polar_angle(atom),
+}
+
+# converters for funcs without a name, by the type of the func's command token
+FUNC_CONVERTERS = {
+    LATEXLexerToken.FUNC_INT: lambda self, func: self.convert_func_integral(func),
+    LATEXLexerToken.FUNC_SQRT: lambda self, func: self.convert_func_sqrt(func),
+    LATEXLexerToken.FUNC_SUM: lambda self, func: self.convert_func_sum_or_prod(func, 'summation'),
+    LATEXLexerToken.FUNC_PROD: lambda self, func: self.convert_func_sum_or_prod(func, 'product'),
+    LATEXLexerToken.FUNC_LIM: lambda self, func: self.convert_func_limit(func),
+    LATEXLexerToken.EXP_E: lambda self, func: self.convert_func_exp_e(func),
+}
+
 
 def process_sympy(latex: str, variable_values: dict = {}):
     instance = LatexToSympy(latex, variable_values)
     return instance.process_sympy()
 
 
+@functools.lru_cache(maxsize=1024)
+def get_variable_symbol(name: str):
+    '''
+    Return the symbol for `\\variable{name}`, with a hash of the name added to distinguish it from regular symbols
+    '''
+    hash = hashlib.md5(name.encode()).hexdigest()
+    return sympy.Symbol(name + hash, real=True)
+
+
+def get_variable_values_key(variable_values: dict):
+    '''
+    Return a hashable fingerprint of `variable_values`, for use in a cache key.
+
+    `srepr` is used so that values which compare equal but convert differently (e.g. `1` and `1.0`) have distinct keys,
+    and so that unhashable values (e.g. a mutable `Matrix`) can be used.
+    '''
+    return tuple(sorted((name, sympy.srepr(value)) for name, value in variable_values.items()))
+
+
+def copy_mutable(data):
+    '''
+    Copy any mutable parts of a `process_sympy` result (lists and mutable matrices), so that cached results are never
+    modified by the caller
+    '''
+    if isinstance(data, list):
+        return [copy_mutable(item) for item in data]
+    if isinstance(data, (sympy.MutableDenseMatrix, sympy.MutableSparseMatrix)):
+        return data.copy()
+    return data
+
+
 class LatexToSympy:
     def __init__(self, latex: str, variable_values: dict = {}):
         self.latex = latex
@@ -29,14 +99,28 @@ class LatexToSympy:
         # pre-processing
         pre_processed_latex = self.pre_process_latex(self.latex)
 
+        # return the cached result for the same input, if the cache is enabled
+        use_cache = parse_cache.enabled
+        if use_cache:
+            cache_key = (type(self), pre_processed_latex, get_variable_values_key(self.variable_values))
+            cached_data = parse_cache.get(cache_key)
+            if cached_data is not None:
+                return copy_mutable(cached_data)
+
         # process the input
-        return_data = None
-        json_string = parseToJson(pre_processed_latex)
+        math = parseToObject(pre_processed_latex)
 
-        # print(json_string)
+        # for debugging, the same tree is available as a json string
+        # print(parseToJson(pre_processed_latex))
 
-        math = json.loads(json_string)
+        return_data = self.convert_math(math)
 
+        if use_cache:
+            parse_cache.put(cache_key, copy_mutable(return_data))
+
+        return return_data
+
+    def convert_math(self, math):
         # if a list
         if 'relation_list' in math:
             return_data = []
@@ -70,18 +154,16 @@ class LatexToSympy:
         # pattern to find variable commands, with the first group being the name
         variable_regex = r'\\variable{([^}_]+?(_({[^}_]+?}|[^}_]))?)}'
 
-        unwrapped_single_char_sub_sup_regex = r'([\^_])([0-9a-zA-Z])'
-
         # find all original variable names and make a mapping from new to original name
         variable_name_dict = {}
         variable_matches = re.finditer(variable_regex, latex)
         for match in variable_matches:
             original_name = match.groups()[0]
-            new_name = re.sub(unwrapped_single_char_sub_sup_regex, '\\1{\\2}', original_name)
+            new_name = wrap_single_char_sub_sup(original_name)
             variable_name_dict[new_name] = original_name
         self.variable_name_dict = variable_name_dict
 
-        pre_processed_latex = re.sub(unwrapped_single_char_sub_sup_regex, '\\1{\\2}', latex)
+        pre_processed_latex = wrap_single_char_sub_sup(latex)
 
         return pre_processed_latex
 
@@ -92,20 +174,10 @@ class LatexToSympy:
         relations = rel.get('relation')
         lh = self.convert_relation(relations[0])
         rh = self.convert_relation(relations[1])
-        if has_type_or_token(rel, LATEXLexerToken.LT):
-            return sympy.StrictLessThan(lh, rh, evaluate=False)
-        elif has_type_or_token(rel, LATEXLexerToken.LTE):
-            return sympy.LessThan(lh, rh, evaluate=False)
-        elif has_type_or_token(rel, LATEXLexerToken.GT):
-            return sympy.StrictGreaterThan(lh, rh, evaluate=False)
-        elif has_type_or_token(rel, LATEXLexerToken.GTE):
-            return sympy.GreaterThan(lh, rh, evaluate=False)
-        elif has_type_or_token(rel, LATEXLexerToken.EQUAL):
-            return sympy.Eq(lh, rh, evaluate=False)
-        elif has_type_or_token(rel, LATEXLexerToken.UNEQUAL):
-            return sympy.Ne(lh, rh, evaluate=False)
-        else:  # pragma: no cover
+        relation_cls = RELATION_CLASSES.get(find_type(rel, RELATION_CLASSES))
+        if relation_cls is None:  # pragma: no cover
             raise Exception('Unrecognized relation')
+        return relation_cls(lh, rh, evaluate=False)
 
     def convert_expr(self, expr):
         if 'additive' in expr:
@@ -134,27 +206,23 @@ class LatexToSympy:
         if 'mp' in add:
             return self.convert_mp(add.get('mp'))
 
-        type = add.get('type')
-
-        if type == LATEXLexerToken.ADD:
-            lh = self.convert_add(add.get('additive')[0])
-            rh = self.convert_add(add.get('additive')[1])
-
-            if lh.is_Matrix or rh.is_Matrix:
-                return mat_add_flat(lh, rh)
-            else:
-                return add_flat(lh, rh)
-        elif type == LATEXLexerToken.SUB:
-            lh = self.convert_add(add.get('additive')[0])
-            rh = self.convert_add(add.get('additive')[1])
+        # build a single flat Add for the whole chain, e.g. `a + b - c + ...`
+        operands, types = get_chain(add, 'additive')
+        chain = FlatChain(self.convert_add(operands[0]), 'add')
+        for operand, type in zip(operands[1:], types):
+            rh = self.convert_add(operand)
+
+            if type == LATEXLexerToken.ADD:
+                chain.apply(rh)
+            elif type == LATEXLexerToken.SUB:
+                if chain.is_Matrix or rh.is_Matrix:
+                    chain.apply(mat_mul_flat(-1, rh))
+                else:
+                    chain.apply(mul_flat(-1, rh))
+            else:  # pragma: no cover
+                raise Exception('Unrecognized add')
 
-            if lh.is_Matrix or rh.is_Matrix:
-                return mat_add_flat(lh, mat_mul_flat(-1, rh))
-            else:
-                rh = mul_flat(-1, rh)
-                return add_flat(lh, rh)
-        else:  # pragma: no cover
-            raise Exception('Unrecognized add')
+        return chain.build()
 
     def convert_mp(self, mp):
         if 'unary' in mp:
@@ -162,39 +230,30 @@ class LatexToSympy:
         if 'unary_nofunc' in mp:
             return self.convert_unary(mp.get('unary_nofunc'))
 
-        if 'mp' in mp:
-            mp_left = mp.get('mp')[0]
-            mp_right = mp.get('mp')[1]
-        else:
-            mp_left = mp.get('mp_nofunc')[0]
-            mp_right = mp.get('mp_nofunc')[1]
-
-        type = mp.get('type')
-
-        if type == LATEXLexerToken.MUL or type == LATEXLexerToken.CMD_TIMES or type == LATEXLexerToken.CMD_CDOT:
-            lh = self.convert_mp(mp_left)
-            rh = self.convert_mp(mp_right)
+        # build a single flat Mul for each run of multiplication in the chain, e.g. `a \cdot b \times c / d`
+        operands, types = get_chain(mp, 'mp' if 'mp' in mp else 'mp_nofunc')
+        chain = FlatChain(self.convert_mp(operands[0]), 'mul')
+        for operand, type in zip(operands[1:], types):
+            rh = self.convert_mp(operand)
+
+            if type == LATEXLexerToken.MUL or type == LATEXLexerToken.CMD_TIMES or type == LATEXLexerToken.CMD_CDOT:
+                chain.apply(rh)
+            elif type == LATEXLexerToken.DIV or type == LATEXLexerToken.CMD_DIV or type == LATEXLexerToken.COLON:
+                lh = chain.build()
+                if lh.is_Matrix or rh.is_Matrix:
+                    chain = FlatChain(sympy.MatMul(lh, sympy.Pow(rh, -1, evaluate=False), evaluate=False), 'mul')
+                else:
+                    chain = FlatChain(sympy.Mul(lh, sympy.Pow(rh, -1, evaluate=False), evaluate=False), 'mul')
+            elif type == LATEXLexerToken.CMD_MOD:
+                lh = chain.build()
+                if rh.is_Matrix:
+                    raise Exception('Cannot perform modulo operation with a matrix as an operand')
+                else:
+                    chain = FlatChain(sympy.Mod(lh, rh, evaluate=False), 'mul')
+            else:  # pragma: no cover
+                raise Exception('Unrecognized mp')
 
-            if lh.is_Matrix or rh.is_Matrix:
-                return mat_mul_flat(lh, rh)
-            else:
-                return mul_flat(lh, rh)
-        elif type == LATEXLexerToken.DIV or type == LATEXLexerToken.CMD_DIV or type == LATEXLexerToken.COLON:
-            lh = self.convert_mp(mp_left)
-            rh = self.convert_mp(mp_right)
-            if lh.is_Matrix or rh.is_Matrix:
-                return sympy.MatMul(lh, sympy.Pow(rh, -1, evaluate=False), evaluate=False)
-            else:
-                return sympy.Mul(lh, sympy.Pow(rh, -1, evaluate=False), evaluate=False)
-        elif type == LATEXLexerToken.CMD_MOD:
-            lh = self.convert_mp(mp_left)
-            rh = self.convert_mp(mp_right)
-            if rh.is_Matrix:
-                raise Exception('Cannot perform modulo operation with a matrix as an operand')
-            else:
-                return sympy.Mod(lh, rh, evaluate=False)
-        else:  # pragma: no cover
-            raise Exception('Unrecognized mp')
+        return chain.build()
 
     def convert_unary(self, unary):
         if 'postfix_nofunc' in unary:
@@ -216,42 +275,31 @@ class LatexToSympy:
         if type == LATEXLexerToken.ADD:
             return self.convert_unary(nested_unary)
         elif type == LATEXLexerToken.SUB:
-            tmp_convert_nested_unary = self.convert_unary(nested_unary)
-            if tmp_convert_nested_unary.is_Matrix:
-                return mat_mul_flat(-1, tmp_convert_nested_unary)
-            else:
-                if tmp_convert_nested_unary.func.is_Number:
-                    return -tmp_convert_nested_unary
-                else:
-                    return mul_flat(-1, tmp_convert_nested_unary)
+            return negate_flat(self.convert_unary(nested_unary))
         else:  # pragma: no cover
             raise Exception('Unrecognized unary')
 
-    def convert_postfix_list(self, arr, i=0):
-        if i >= len(arr):  # pragma: no cover
+    def convert_postfix_list(self, arr):
+        if len(arr) == 0:  # pragma: no cover
             raise Exception('Index out of bounds')
 
-        list_item = arr[i]
-        res = self.convert_postfix(list_item)
+        # convert left to right, then multiply right to left so that a derivative applies to everything after it
+        items = [self.convert_postfix(list_item) for list_item in arr]
 
-        if isinstance(res, sympy.Expr) or isinstance(res, sympy.Matrix) or res is EmptySet:
-            if i == len(arr) - 1:
-                return res  # nothing to multiply by
-            else:
-                # multiply by next
-                rh = self.convert_postfix_list(arr, i + 1)
+        res = items[-1]
+        if not (isinstance(res, sympy.Expr) or isinstance(res, sympy.Matrix) or res is EmptySet):
+            raise Exception('Expected expression for derivative')
 
-                if res.is_Matrix or rh.is_Matrix:
-                    return mat_mul_flat(res, rh)
-                else:
-                    return mul_flat(res, rh)
-        else:  # must be derivative
-            wrt = res[0]
-            if i == len(arr) - 1:
-                raise Exception('Expected expression for derivative')
-            else:
-                expr = self.convert_postfix_list(arr, i + 1)
-                return sympy.Derivative(expr, wrt)
+        # build a single flat Mul for each run of factors between derivatives, e.g. `2xyz`
+        chain = FlatChain(res, 'mul', prepend=True)
+        for res in reversed(items[:-1]):
+            if isinstance(res, sympy.Expr) or isinstance(res, sympy.Matrix) or res is EmptySet:
+                chain.apply(res)
+            else:  # must be derivative
+                wrt = res[0]
+                chain = FlatChain(sympy.Derivative(chain.build(), wrt), 'mul', prepend=True)
+
+        return chain.build()
 
     def do_eval_at_subs(self, expr, at):
         if 'expr' in at:
@@ -422,104 +470,172 @@ class LatexToSympy:
             atom_symbol = result.args[0] if isinstance(result, sympy.Pow) else result
             diff_atom_symbol = sympy.Symbol(DIFFERENTIAL_PREFIX + atom_symbol.name, real=True, positive=True)
             return sympy.Pow(diff_atom_symbol, result.args[1], evaluate=False) if isinstance(result, sympy.Pow) else diff_atom_symbol
-        elif has_type_or_token(atom, LATEXLexerToken.SYMBOL):
-            # remove dollar sign, percentage symbol, and whitespace
-            s = atom.get('text').replace('\\$', '').replace('\\%', '').strip()
-            if s == '\\infty':
-                return sympy.oo
-            elif s == '\\pi':
-                return sympy.pi
-            elif s == '\\emptyset':
-                return EmptySet
-            elif s == '\\imaginaryI' or s == '\\imaginaryJ':
-                return sympy.I
-            else:  # pragma: no cover
-                raise Exception('Unrecognized symbol')
-        elif has_type_or_token(atom, LATEXLexerToken.NUMBER):
-            s = atom.get('text').replace(',', '')
-            return create_rational_or_number(s)
-        elif has_type_or_token(atom, LATEXLexerToken.SCI_NOTATION_NUMBER):
-            s = atom.get('text')
-            s_parts = s.split('\\times 10^')
-            s1 = s_parts[0].replace(',', '')
-            n1 = create_rational_or_number(s1)
-            s2 = s_parts[1].replace('{', '').replace(',', '').replace('}', '')
-            n2 = create_rational_or_number(s2)
-            n_exp = sympy.Mul(n1, sympy.Pow(10, n2))
-            return create_rational_or_number(n_exp)
-        elif has_type_or_token(atom, LATEXLexerToken.FRACTION_NUMBER):
-            s = atom.get('text').replace('\\frac{', '').replace('}{', '/').replace('}', '').replace(',', '')
-            try:
-                sr = sympy.Rational(s)
-                return sr
-            except ZeroDivisionError:
-                # preserve the divide by zero as an expression
-                s_parts = s.split('/')
-                p = create_rational_or_number(s_parts[0])
-                q = create_rational_or_number(s_parts[1])
-                return sympy.Mul(p, sympy.Pow(q, -1, evaluate=False), evaluate=False)
-            except (TypeError, ValueError):  # pragma: no cover
-                return sympy.Number(s)
-        elif has_type_or_token(atom, LATEXLexerToken.E_NOTATION):
-            text = atom.get('text').replace(',', '')
-            parts = text.split('E')
-
-            # parse variables if either part is a variable
-            if '\\variable' in parts[0] or '\\variable' in parts[1]:
-                v1 = process_sympy(parts[0], variable_values=self.variable_values) if '\\variable' in parts[0] else create_rational_or_number(parts[0])
-                v2 = process_sympy(parts[1], variable_values=self.variable_values) if '\\variable' in parts[1] else create_rational_or_number(parts[1])
-                return sympy.Mul(v1, sympy.Pow(10, v2, evaluate=False), evaluate=False)
-
-            return create_rational_or_number(text)
         elif 'mathit' in atom:
             text = atom.get('mathit').get('mathit_text').get('text')
             return sympy.Symbol(text, real=True, positive=True)
-        elif has_type_or_token(atom, LATEXLexerToken.VARIABLE):
-            text = atom.get('text')
-            is_percent = text.endswith('\\%')
-            trim_amount = 3 if is_percent else 1
-            name = text[10:]
-            name = name[0:len(name) - trim_amount]
-
-            # revert to the 'original' variable name stored from `pre_process_latex`
-            # original name might be the same if it already had a wrapped single char sub
-            name = self.variable_name_dict[name]
-
-            # add hash to distinguish from regular symbols
-            hash = hashlib.md5(name.encode()).hexdigest()
-            symbol_name = name + hash
-
-            # replace the variable for already known variable values
-            if name in self.variable_values:
-                symbol = self.variable_values[name]
-            else:
-                symbol = sympy.Symbol(symbol_name, real=True)
-
-            if is_percent:
-                return sympy.Mul(symbol, sympy.Pow(100, -1, evaluate=False), evaluate=False)
-
-            # return the symbol
-            return symbol
-        elif has_type_or_token(atom, LATEXLexerToken.PERCENT_NUMBER):
-            text = atom.get('text').replace('\\%', '').replace(',', '')
-            number = create_rational_or_number(text)
-            percent = sympy.Rational(number, 100)
-            return percent
-        elif has_type_or_token(atom, LATEXLexerToken.COMPLEX_NUMBER_POLAR_ANGLE):
-            angle_str = atom.get('text').replace('\\angle ', '')
-            if '\\degree' in angle_str:
-                angle_str = angle_str.replace('\\degree', '').strip()
-                angle_degrees = process_sympy(angle_str, variable_values=self.variable_values)
-                # convert angle from degrees to radians
-                angle = sympy.Mul(angle_degrees, sympy.Pow(180, -1, evaluate=False), sympy.pi, evaluate=False)
-            else:
-                angle = process_sympy(angle_str, variable_values=self.variable_values)
-            # represent the polar complex number in exponential form, so that angle is not duplicated
-            # polar form: r * (cos(angle) + i * sin(angle))
-            # exponential form: r * e^{i * angle}
-            return sympy.exp(sympy.Mul(sympy.I, angle, evaluate=False), evaluate=False)
-        else:  # pragma: no cover
+
+        # token atoms, e.g. numbers and variables
+        atom_converter = ATOM_CONVERTERS.get(find_type(atom, ATOM_CONVERTERS))
+        if atom_converter is None:  # pragma: no cover
             raise Exception('Unrecognized atom')
+        return atom_converter(self, atom)
+
+    def convert_atom_symbol(self, atom):
+        # remove dollar sign, percentage symbol, and whitespace
+        s = atom.get('text').replace('\\$', '').replace('\\%', '').strip()
+        if s == '\\infty':
+            return sympy.oo
+        elif s == '\\pi':
+            return sympy.pi
+        elif s == '\\emptyset':
+            return EmptySet
+        elif s == '\\imaginaryI' or s == '\\imaginaryJ':
+            return sympy.I
+        else:  # pragma: no cover
+            raise Exception('Unrecognized symbol')
+
+    def convert_atom_number(self, atom):
+        s = atom.get('text').replace(',', '')
+        return create_rational_or_number(s)
+
+    def convert_atom_sci_notation_number(self, atom):
+        s = atom.get('text')
+        s_parts = s.split('\\times 10^')
+        s1 = s_parts[0].replace(',', '')
+        n1 = create_rational_or_number(s1)
+        s2 = s_parts[1].replace('{', '').replace(',', '').replace('}', '')
+        n2 = create_rational_or_number(s2)
+        n_exp = sympy.Mul(n1, sympy.Pow(10, n2))
+        return create_rational_or_number(n_exp)
+
+    def convert_atom_fraction_number(self, atom):
+        s = atom.get('text').replace('\\frac{', '').replace('}{', '/').replace('}', '').replace(',', '')
+        try:
+            sr = sympy.Rational(s)
+            return sr
+        except ZeroDivisionError:
+            # preserve the divide by zero as an expression
+            s_parts = s.split('/')
+            p = create_rational_or_number(s_parts[0])
+            q = create_rational_or_number(s_parts[1])
+            return sympy.Mul(p, sympy.Pow(q, -1, evaluate=False), evaluate=False)
+        except (TypeError, ValueError):  # pragma: no cover
+            return sympy.Number(s)
+
+    def convert_atom_e_notation(self, atom):
+        text = atom.get('text')
+
+        # convert variables from the token text if either part is a variable
+        if '\\variable' in text:
+            base, sign, exponent = split_e_notation(text)
+            v1 = self.convert_number_or_variable_text(base)
+            if is_variable_text(exponent):
+                v2 = self.convert_atom_variable({'text': exponent})
+                v2 = negate_flat(v2) if sign == '-' else v2
+            else:
+                v2 = create_rational_or_number(sign + exponent)
+            return sympy.Mul(v1, sympy.Pow(10, v2, evaluate=False), evaluate=False)
+
+        return create_rational_or_number(text.replace(',', ''))
+
+    def convert_atom_variable(self, atom):
+        text = atom.get('text')
+        is_percent = text.endswith('\\%')
+        trim_amount = 3 if is_percent else 1
+        name = text[10:]
+        name = name[0:len(name) - trim_amount]
+
+        # revert to the 'original' variable name stored from `pre_process_latex`
+        # original name might be the same if it already had a wrapped single char sub
+        name = self.variable_name_dict[name]
+
+        # replace the variable for already known variable values
+        if name in self.variable_values:
+            symbol = self.variable_values[name]
+        else:
+            symbol = get_variable_symbol(name)
+
+        if is_percent:
+            return sympy.Mul(symbol, sympy.Pow(100, -1, evaluate=False), evaluate=False)
+
+        # return the symbol
+        return symbol
+
+    def convert_atom_percent_number(self, atom):
+        text = atom.get('text').replace('\\%', '').replace(',', '')
+        number = create_rational_or_number(text)
+        percent = sympy.Rational(number, 100)
+        return percent
+
+    def convert_atom_polar_angle(self, atom):
+        angle = self.convert_polar_angle(atom.get('text'))
+        # represent the polar complex number in exponential form, so that angle is not duplicated
+        # polar form: r * (cos(angle) + i * sin(angle))
+        # exponential form: r * e^{i * angle}
+        return sympy.exp(sympy.Mul(sympy.I, angle, evaluate=False), evaluate=False)
+
+    def convert_polar_angle(self, text):
+        '''
+        Convert the angle of a `COMPLEX_NUMBER_POLAR_ANGLE` token from its text, with the same result as parsing the
+        angle on its own, e.g. `\\angle -\\frac{3\\pi}{4}`
+        '''
+        sign, angle_text = split_polar_angle(text)
+
+        degrees_match = POLAR_ANGLE_DEGREES_REGEX.fullmatch(angle_text)
+        if degrees_match is not None:
+            angle_degrees = self.convert_number_or_variable_text(degrees_match.group('degrees'))
+            angle_degrees = negate_flat(angle_degrees) if sign == '-' else angle_degrees
+            # convert angle from degrees to radians
+            return sympy.Mul(angle_degrees, sympy.Pow(180, -1, evaluate=False), sympy.pi, evaluate=False)
+
+        fraction_match = RADIAN_FRACTION_REGEX.fullmatch(angle_text)
+        if fraction_match is not None and not is_number_text(fraction_match.group('radians')):
+            upper = self.convert_radians(fraction_match.group('sign'), fraction_match.group('radians'))
+            lower = create_rational_or_number(fraction_match.group('denominator').replace(',', ''))
+            lower = negate_flat(lower) if fraction_match.group('denominator_sign') == '-' else lower
+            angle = sympy.Mul(upper, sympy.Pow(lower, -1, evaluate=False), evaluate=False)
+        elif fraction_match is not None:
+            # a fraction of two numbers is a single `FRACTION_NUMBER`
+            angle = self.convert_atom_fraction_number({'text': angle_text})
+        else:
+            return self.convert_radians(sign, angle_text)
+
+        return negate_flat(angle) if sign == '-' else angle
+
+    def convert_radians(self, sign, text):
+        '''
+        Convert an angle in radians from its text, e.g. `2\\pi`, `2\\cdot \\pi`, `\\frac{1}{2}\\pi` or `\\variable{x}`
+        '''
+        match = RADIANS_REGEX.fullmatch(text)
+        if match is None or match.group(0) == '':  # pragma: no cover
+            raise Exception('Unrecognized polar angle')
+
+        if match.group('variable') is not None:
+            coefficient = self.convert_atom_variable({'text': match.group('variable')})
+        elif match.group('fraction') is not None:
+            coefficient = self.convert_atom_fraction_number({'text': match.group('fraction')})
+        elif match.group('number') is not None:
+            coefficient = create_rational_or_number(match.group('number').replace(',', ''))
+        else:
+            coefficient = None
+
+        if coefficient is None:
+            angle = sympy.pi
+        elif match.group('pi') is None:
+            angle = coefficient
+        elif match.group('operator') is not None:
+            # an explicit multiplication binds looser than the sign, e.g. `-2\\cdot \\pi` is `(-2) \\cdot \\pi`
+            coefficient = negate_flat(coefficient) if sign == '-' else coefficient
+            return mul_flat(coefficient, sympy.pi)
+        else:
+            angle = mul_flat(coefficient, sympy.pi)
+
+        return negate_flat(angle) if sign == '-' else angle
+
+    def convert_number_or_variable_text(self, text):
+        if is_variable_text(text):
+            return self.convert_atom_variable({'text': text})
+        return create_rational_or_number(text.replace(',', ''))
 
     def convert_frac(self, frac):
         frac_upper = frac.get('upper')
@@ -577,8 +693,14 @@ class LatexToSympy:
                 arg = self.convert_func_arg(func.get('func_arg'))
             else:  # 'func_args'
                 # commas are **always** used to split args for multi-arg functions
-                args = func.get('func_args').get('text').split(',')
-                args = list(map(lambda arg: process_sympy(arg, self.variable_values), args))
+                func_args = func.get('func_args')
+                arg_exprs = get_func_args(func_args)
+                arg_texts = func_args.get('text').split(',')
+                if len(arg_exprs) == len(arg_texts):
+                    args = [self.convert_expr(arg_expr) for arg_expr in arg_exprs]
+                else:
+                    # a token contains a comma, e.g. `\\max(1,000)` has one `NUMBER` arg but is split into two
+                    args = list(map(lambda arg: process_sympy(arg, self.variable_values), arg_texts))
 
             # single arg functions
             # change arc<trig> -> a<trig>
@@ -656,26 +778,20 @@ class LatexToSympy:
 
             return expr
 
-        elif has_type_or_token(func, LATEXLexerToken.FUNC_INT):
-            return self.convert_func_integral(func)
-        elif has_type_or_token(func, LATEXLexerToken.FUNC_SQRT):
-            exprs = func.get('expr')
-            expr = self.convert_expr(exprs[1]) if isinstance(exprs, list) else self.convert_expr(exprs)
-            if isinstance(exprs, list):
-                r = self.convert_expr(exprs[0])
-                return sympy.Pow(expr, 1 / r, evaluate=False)
-            else:
-                return sympy.Pow(expr, sympy.S.Half, evaluate=False)
-        elif has_type_or_token(func, LATEXLexerToken.FUNC_SUM):
-            return self.convert_func_sum_or_prod(func, 'summation')
-        elif has_type_or_token(func, LATEXLexerToken.FUNC_PROD):
-            return self.convert_func_sum_or_prod(func, 'product')
-        elif has_type_or_token(func, LATEXLexerToken.FUNC_LIM):
-            return self.convert_func_limit(func)
-        elif has_type_or_token(func, LATEXLexerToken.EXP_E):
-            return self.convert_func_exp_e(func)
-        else:  # pragma: no cover
+        # funcs without a name, e.g. `\\int` or `\\sqrt`
+        func_converter = FUNC_CONVERTERS.get(find_type(func, FUNC_CONVERTERS))
+        if func_converter is None:  # pragma: no cover
             raise Exception('Unrecognized func')
+        return func_converter(self, func)
+
+    def convert_func_sqrt(self, func):
+        exprs = func.get('expr')
+        expr = self.convert_expr(exprs[1]) if isinstance(exprs, list) else self.convert_expr(exprs)
+        if isinstance(exprs, list):
+            r = self.convert_expr(exprs[0])
+            return sympy.Pow(expr, 1 / r, evaluate=False)
+        else:
+            return sympy.Pow(expr, sympy.S.Half, evaluate=False)
 
     def convert_func_arg(self, arg):
         if 'expr' in arg:
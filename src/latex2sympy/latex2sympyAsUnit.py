@@ -1,32 +1,91 @@
+import sympy
 from latex2sympy.latex2sympy import LatexToSympy
 from latex2sympy.lib import LATEXLexerToken
 from latex2sympy.utils.json import has_type_or_token
-from latex2sympy.units import find_unit, is_unit
+from latex2sympy import units
 
 
-def process_sympy_as_unit(latex: str, variable_values: dict = {}):
+def process_sympy_as_unit(latex: str, variable_values: dict = {}, return_metadata: bool = False):
+    '''
+    Convert the latex of a unit expression, e.g. `\\frac{km}{hr}`.
+
+    With `return_metadata`, return `(expr, UnitMetadata)`, where the metadata has the units of the expr,
+    so that callers do not need to walk the expr to find them.
+    '''
     instance = LatexToSympyAsUnit(latex, variable_values)
-    return instance.process_sympy()
+    return_data = instance.process_sympy()
+    if return_metadata:
+        return return_data, instance.unit_metadata
+    return return_data
+
+
+class UnitMetadata:
+    '''
+    The units of a converted unit expression, recorded as they are resolved while converting
+
+    units: dict - each `Quantity` -> the number of times it occurs, in the order they were resolved
+    '''
+
+    def __init__(self):
+        self.units = {}
+        self._dimensions = None
+
+    @classmethod
+    def from_expr(cls, expr):
+        '''
+        Create the metadata by walking the expr, for a result which was not converted (e.g. it was cached)
+        '''
+        from sympy.physics.units.quantities import Quantity
+
+        metadata = cls()
+        if isinstance(expr, sympy.Basic):
+            for node in sympy.preorder_traversal(expr):
+                if isinstance(node, Quantity):
+                    metadata.add(node)
+        return metadata
+
+    def add(self, unit):
+        self.units[unit] = self.units.get(unit, 0) + 1
+        self._dimensions = None
+
+    @property
+    def count(self):
+        '''
+        The number of units in the expr, including repeated units, e.g. 2 for `m/m`
+        '''
+        return sum(self.units.values())
+
+    @property
+    def unit_set(self):
+        return frozenset(self.units)
+
+    @property
+    def dimensions(self):
+        '''
+        Each unit -> its dimension exponents (see `units.dimension_of`), from the precomputed unit dimensions
+        '''
+        if self._dimensions is None:
+            self._dimensions = {unit: units.dimension_of(unit) for unit in self.units}
+        return self._dimensions
 
 
 class LatexToSympyAsUnit(LatexToSympy):
     def __init__(self, latex: str, variable_values: dict = {}):
         super().__init__(latex, variable_values)
+        self.unit_metadata = UnitMetadata()
 
     def process_sympy(self):
+        self.unit_metadata = UnitMetadata()
         return_data = super().process_sympy()
-        if not is_unit(return_data):
-            raise Exception('Unrecognized unit')
+        # the units are recorded in `get_atom_symbol_for_atom_expr`, so the result does not need to be walked,
+        # unless no units were resolved (e.g. the result was cached), or the result is a list or matrix
+        if self.unit_metadata.count == 0 or not isinstance(return_data, sympy.Basic):
+            if not units.is_unit(return_data):
+                raise Exception('Unrecognized unit')
+            self.unit_metadata = UnitMetadata.from_expr(return_data)
         return return_data
 
-    def convert_postfix_list(self, arr, i=0):
-        if i >= len(arr):  # pragma: no cover
-            raise Exception('Index out of bounds')
-
-        # only run the merge logic once
-        if i > 0:
-            return super().convert_postfix_list(arr, i)
-
+    def convert_postfix_list(self, arr):
         # loop through list and merge adjacent atoms into a single LETTER atom_expr
         new_list_items = []
         new_atom_text = None
@@ -45,7 +104,7 @@ class LatexToSympyAsUnit(LatexToSympy):
                 # a space means multiplication, so add the new list item with all text before the space, if any
                 if atom_text == '\\: ':
                     if new_atom_text is not None:
-                        new_list_items.append(create_new_list_item(new_atom_text))
+                        new_list_items.extend(create_unit_list_items(new_atom_text))
                     new_atom_text = None
                     continue
 
@@ -57,34 +116,47 @@ class LatexToSympyAsUnit(LatexToSympy):
 
                 # if this atom has a sub or sup, complete the list item and include the sub and sup
                 if 'subexpr' in atom_target or 'supexpr' in atom_target:
-                    new_list_items.append(create_new_list_item(new_atom_text, atom_target))
+                    new_list_items.extend(create_unit_list_items(new_atom_text, atom_target))
                     new_atom_text = None
                     continue
             else:
                 # this `list_item` is NOT able to merge
                 # add a new list item with the previously tracked text, if any
                 if new_atom_text is not None:
-                    new_list_items.append(create_new_list_item(new_atom_text))
+                    new_list_items.extend(create_unit_list_items(new_atom_text))
                     new_atom_text = None
                 # preserve the current item as-is
                 new_list_items.append(list_item)
 
         # add a new list item with the previously tracked text, if any
         if new_atom_text is not None:
-            new_list_items.append(create_new_list_item(new_atom_text))
+            new_list_items.extend(create_unit_list_items(new_atom_text))
 
-        return super().convert_postfix_list(new_list_items, i)
+        return super().convert_postfix_list(new_list_items)
 
     def get_atom_symbol_for_atom_expr(self, atom_name, type):
         # do not call parent class
         search_name = '\\' + atom_name if type == LATEXLexerToken.GREEK_CMD else atom_name
         # all valid units and prefixed units are accounted for here
-        unit = find_unit(search_name)
+        unit = units.find_unit(search_name)
         if unit is not None:
+            self.unit_metadata.add(unit)
             return unit
         raise Exception('Unrecognized unit')
 
 
+def create_unit_list_items(text, atom_expr=None):
+    '''
+    Create the list items for the merged text of adjacent atoms, which is split into units if it is not a unit itself,
+    e.g. `kgm` is `kg` and `m`. A sub or sup of the text only applies to its last unit, e.g. `kgm^{2}` is `kg m^{2}`
+    '''
+    if units.find_unit(text) is None:
+        symbols = units.split_units(text)
+        if symbols is not None and len(symbols) > 1:
+            return [create_new_list_item(symbol) for symbol in symbols[:-1]] + [create_new_list_item(symbols[-1], atom_expr)]
+    return [create_new_list_item(text, atom_expr)]
+
+
 def create_new_list_item(text, atom_expr=None):
     new_atom_expr = {'text': text, 'type': LATEXLexerToken.LETTER}
     if atom_expr is not None and 'subexpr' in atom_expr:
@@ -1,11 +1,70 @@
+import json
 import platform
+from latex2sympy.utils.json import loads_iterative
 
 if platform.system() == 'Linux':  # pragma: no cover
-    from latex2sympy.lib.linux.latex2antlrJson import parseToJson, LATEXLexerToken
+    from latex2sympy.lib.linux import latex2antlrJson
 elif platform.system() == 'Darwin':  # pragma: no cover
     if platform.machine() == 'arm64':  # pragma: no cover
-        from latex2sympy.lib.macOS.arm64.latex2antlrJson import parseToJson, LATEXLexerToken
+        from latex2sympy.lib.macOS.arm64 import latex2antlrJson
     else:
-        from latex2sympy.lib.macOS.x86_64.latex2antlrJson import parseToJson, LATEXLexerToken
+        from latex2sympy.lib.macOS.x86_64 import latex2antlrJson
 else:  # pragma: no cover
     raise Exception(platform.system() + ' platform not supported')
+
+parseToJson = latex2antlrJson.parseToJson
+LATEXLexerToken = latex2antlrJson.LATEXLexerToken
+
+
+def parseToObject(input):
+    '''
+    Parse the input to the tree as python objects
+    '''
+    # the parser only returns the tree as a json string, so it is decoded here
+    data = parseToJson(input)
+    try:
+        return json.loads(data)
+    except RecursionError:
+        # the parser nests a chain like `a + b + ...` once per operation
+        return loads_iterative(data)
+
+
+def _parse_many(parse, inputs):
+    results = []
+    for input in inputs:
+        try:
+            results.append((parse(input), None))
+        except Exception as e:
+            results.append((None, str(e)))
+    return results
+
+
+def parseManyToJson(inputs):
+    '''
+    Parse each input one after the other, to `(json, error)` tuples in input order
+    '''
+    return _parse_many(parseToJson, inputs)
+
+
+def parseManyToObject(inputs):
+    '''
+    Parse each input one after the other, to `(tree, error)` tuples in input order
+    '''
+    return _parse_many(parseToObject, inputs)
+
+
+def validateSyntax(input):
+    '''
+    Parse the input, and return `None` if it is valid, or the offset and the error of its syntax error
+    '''
+    # the error only has the column of the error in its line, as the length of the marker, e.g. `~~~^`,
+    # so parse the input on one line, where the column is the offset (newlines are whitespace, which is skipped)
+    try:
+        parseToJson(input.replace('\n', ' '))
+    except Exception as e:
+        message, _, marker = str(e).split('\n')
+        offset = len(marker) - 1
+        # the error of the input as it is, with the column of the error in its own line
+        column = offset - (input.rfind('\n', 0, offset) + 1)
+        return (offset, '\n'.join([message, input, '~' * column + '^']))
+    return None
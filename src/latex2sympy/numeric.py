@@ -0,0 +1,156 @@
+import functools
+import hashlib
+import sympy
+from latex2sympy.latex2sympy import process_sympy, EmptySet
+from latex2sympy.utils.cache import LRUCache
+
+# numpy is optional, install with `pip install latex2sympy[numeric]`
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+BACKENDS = ['numpy', 'math']
+
+# compiled functions, keyed on the canonical expression (with the arguments renamed by position) and the backend
+numeric_cache = LRUCache(256)
+
+
+def compile_numeric(latex, symbols=None, backend: str = 'numpy', variable_values: dict = {}):
+    '''
+    Return a `NumericFunction` evaluating the converted `latex` (or an already converted sympy expression).
+
+    symbols: List[str | Symbol] - the arguments of the function, in order, by symbol or by name,
+        where the name of `\\variable{x}` is `x`. Defaults to all free symbols, sorted by name
+    backend: str - 'numpy' for a vectorized function over arrays, or 'math' for a scalar function
+    variable_values: dict - values of `\\variable{...}` placeholders, as in `process_sympy`
+    '''
+    if backend not in BACKENDS:
+        raise Exception('Unrecognized backend, expected one of: ' + ', '.join(BACKENDS))
+    if backend == 'numpy' and numpy is None:  # pragma: no cover
+        raise Exception('numpy is required for the numpy backend')
+
+    expr = process_sympy(latex, variable_values) if isinstance(latex, str) else latex
+    if isinstance(expr, list) or isinstance(expr, sympy.core.relational.Relational):
+        raise Exception('Expected an expression, not a relation or list')
+    expr = prepare_numeric(expr)
+    if backend == 'numpy':
+        expr = prepare_numpy(expr)
+
+    args = get_arg_symbols(expr, symbols)
+    arg_names = [get_symbol_name(arg) for arg in args]
+
+    # rename the arguments by position, so that e.g. `x^{2}` and `y^{2}` share a compiled function
+    positional_args = [sympy.Symbol('_arg' + str(i)) for i in range(len(args))]
+    canonical_expr = expr.xreplace(dict(zip(args, positional_args)))
+    key = (sympy.srepr(canonical_expr), len(args), backend)
+
+    func = numeric_cache.get(key)
+    if func is None:
+        modules = [NUMPY_FUNCTIONS, 'numpy'] if backend == 'numpy' else ['math', 'mpmath']
+        func = sympy.lambdify(positional_args, canonical_expr, modules=modules)
+        numeric_cache.put(key, func)
+
+    return NumericFunction(func, args, arg_names, backend)
+
+
+def numpy_max(*args):
+    return functools.reduce(numpy.maximum, args)
+
+
+def numpy_min(*args):
+    return functools.reduce(numpy.minimum, args)
+
+
+# functions that sympy prints for numpy in a way which does not broadcast, e.g. `Max` as `numpy.amax((x, 2), axis=0)`,
+# which fails if `x` is an array and `2` is not, so they are replaced with functions of these names (see `prepare_numpy`)
+NUMPY_FUNCTIONS = {'numpy_max': numpy_max, 'numpy_min': numpy_min}
+NUMPY_REPLACEMENTS = {sympy.Max: sympy.Function('numpy_max'), sympy.Min: sympy.Function('numpy_min')}
+
+
+def prepare_numeric(expr):
+    '''
+    Rewrite the converter's own constructs into expressions that `lambdify` can print
+    '''
+    # `\emptyset` has no numeric value
+    expr = expr.xreplace({EmptySet: sympy.nan})
+    # gcd/lcm are wrapped so that they are not evaluated further
+    expr = expr.replace(lambda e: isinstance(e, sympy.UnevaluatedExpr), lambda e: e.args[0])
+    return expr
+
+
+def prepare_numpy(expr):
+    '''
+    Replace the functions in `NUMPY_REPLACEMENTS`, to be printed as calls of `NUMPY_FUNCTIONS`
+    '''
+    return expr.replace(lambda e: type(e) in NUMPY_REPLACEMENTS, lambda e: NUMPY_REPLACEMENTS[type(e)](*e.args))
+
+
+def get_symbol_name(symbol):
+    '''
+    Return the name of `symbol`, without the hash added to `\\variable{...}` symbols
+    '''
+    name = symbol.name
+    if len(name) > 32:
+        variable_name = name[:-32]
+        if hashlib.md5(variable_name.encode()).hexdigest() == name[-32:]:
+            return variable_name
+    return name
+
+
+def get_arg_symbols(expr, symbols):
+    free_symbols = sorted(expr.free_symbols, key=lambda s: (get_symbol_name(s), s.name))
+    if symbols is None:
+        return free_symbols
+
+    symbols_by_name = {}
+    for symbol in free_symbols:
+        symbols_by_name.setdefault(get_symbol_name(symbol), []).append(symbol)
+
+    args = []
+    for symbol in symbols:
+        if isinstance(symbol, sympy.Symbol):
+            args.append(symbol)
+        elif len(symbols_by_name.get(symbol, [])) > 1:
+            raise Exception('Ambiguous symbol name: ' + symbol)
+        elif symbol in symbols_by_name:
+            args.append(symbols_by_name[symbol][0])
+        else:
+            # not in the expression, the function still accepts it as an argument
+            args.append(sympy.Symbol(symbol, real=True, positive=True))
+
+    missing = [get_symbol_name(s) for s in free_symbols if s not in args]
+    if len(missing) > 0:
+        raise Exception('Missing symbols: ' + ', '.join(missing))
+    return args
+
+
+class NumericFunction:
+    '''
+    A compiled numeric function of a converted expression.
+
+    Call with the argument values in the order of `names`, or by name as keyword arguments.
+    With the numpy backend, the values can be arrays, and the result is broadcast to the shape of the arguments.
+    '''
+
+    def __init__(self, func, symbols, names, backend):
+        self.func = func
+        self.symbols = symbols
+        self.names = names
+        self.backend = backend
+
+    def __call__(self, *args, **kwargs):
+        if len(kwargs) > 0:
+            args = list(args) + [kwargs.pop(name) for name in self.names[len(args):] if name in kwargs]
+            if len(kwargs) > 0:
+                raise Exception('Unexpected arguments: ' + ', '.join(kwargs))
+        if len(args) != len(self.names):
+            raise Exception('Expected arguments: ' + ', '.join(self.names))
+
+        if self.backend != 'numpy':
+            return self.func(*args)
+
+        args = [numpy.asarray(arg) for arg in args]
+        result = self.func(*args)
+        # constant expressions return a scalar, broadcast it to the shape of the arguments
+        return numpy.broadcast_arrays(result, *args)[0] if len(args) > 0 else numpy.asarray(result)
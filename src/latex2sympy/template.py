@@ -0,0 +1,135 @@
+import sympy
+from latex2sympy.latex2sympy import LatexToSympy, get_variable_symbol, copy_mutable
+from latex2sympy.lib import parseToObject, LATEXLexerToken
+from latex2sympy.utils.json import has_type_or_token, find_type
+
+# multi-arg functions which are evaluated when converted, e.g. `\\gcd(6, 4)` is `2`
+EVALUATED_FUNCS = ['gcd', 'lcm']
+# functions without a name which are created evaluated, so the same values do not create the same tree with `xreplace`
+EVALUATED_FUNC_TYPES = [LATEXLexerToken.FUNC_INT, LATEXLexerToken.FUNC_SUM, LATEXLexerToken.FUNC_PROD]
+
+
+def compile_template(latex: str):
+    '''
+    Parse `latex` once, for binding its `\\variable{...}` placeholders to many sets of values, e.g.
+
+    template = compile_template('2\\pi \\variable{r}^{2}')
+    template.bind_many([{'r': 1}, {'r': 2}])
+    '''
+    return LatexTemplate(latex)
+
+
+class LatexTemplate:
+    '''
+    A latex string parsed once, with its `\\variable{...}` placeholders bound to values without re-parsing.
+
+    placeholders: dict - variable name -> placeholder symbol in `expr`
+    expr: the converted latex, with placeholder symbols for all variables
+    depends_on_values: bool - `True` if the values change how the latex is converted, see `depends_on_values`
+    '''
+
+    def __init__(self, latex: str):
+        self.latex = latex
+        self.converter = LatexToSympy(latex)
+        self.math = parseToObject(self.converter.pre_process_latex(latex))
+        self.expr = self.converter.convert_math(self.math)
+        self.placeholders = {name: get_variable_symbol(name) for name in self.converter.variable_name_dict.values()}
+        self.depends_on_values = depends_on_values(self.math)
+
+    def bind(self, values: dict):
+        '''
+        Return the converted latex with the placeholders replaced by `values` (variable name -> sympy value),
+        the same as `process_sympy(latex, variable_values=values)`, except that a negated number value is left as
+        e.g. `Mul(-1, 2)` instead of `-2`.
+
+        Scalar values are substituted into `expr` with `xreplace`, without evaluating.
+        Matrix values change how the surrounding expression is built (e.g. `MatMul` instead of `Mul`),
+        as do the values of some variables (see `depends_on_values`), e.g. `\\sin^{\\variable{n}}(x)` is `asin(x)`
+        for `n = -1`, so in these cases the stored tree is converted again with the values instead,
+        which still does not re-parse.
+        '''
+        values = {name: sympy.sympify(value) for name, value in values.items() if name in self.placeholders}
+
+        if self.depends_on_values or any(value.is_Matrix for value in values.values()):
+            converter = LatexToSympy(self.latex, values)
+            converter.variable_name_dict = self.converter.variable_name_dict
+            return converter.convert_math(self.math)
+
+        replacements = {self.placeholders[name]: value for name, value in values.items()}
+        with sympy.evaluate(False):
+            if isinstance(self.expr, list):
+                return [copy_mutable(expr.xreplace(replacements)) for expr in self.expr]
+            return copy_mutable(self.expr.xreplace(replacements))
+
+    def bind_many(self, values_list: list):
+        '''
+        Return `bind(values)` for each of `values_list`, in order
+        '''
+        return [self.bind(values) for values in values_list]
+
+
+def depends_on_values(math):
+    '''
+    Return `True` if the conversion of the parsed latex depends on the values of its variables, rather than only
+    containing them, i.e. if a variable is in:
+
+    - the args of `EVALUATED_FUNCS`, e.g. `\\gcd(\\variable{x}, 4)`
+    - the exponent of a named function, e.g. `\\sin^{\\variable{n}}(x)`, as `\\sin^{-1}(x)` is `asin(x)`
+    - the index of a root, e.g. `\\sqrt[\\variable{n}]{8}`, as its exponent `1 / n` is evaluated
+    - a `\\binom`, or `EVALUATED_FUNC_TYPES`, e.g. `\\int_{0}^{\\variable{b}} x dx`
+    '''
+    stack = [math]
+    while len(stack) > 0:
+        node = stack.pop()
+        if isinstance(node, list):
+            stack.extend(node)
+            continue
+        if not isinstance(node, dict):
+            continue
+        func = node.get('func')
+        if func is not None:
+            if 'func_single_arg' in func or 'func_multi_arg' in func:
+                if has_variable(func.get('supexpr')):
+                    return True
+                if get_multi_arg_func_name(func) in EVALUATED_FUNCS and has_variable(func.get('func_args')):
+                    return True
+            elif has_type_or_token(func, LATEXLexerToken.FUNC_SQRT) and isinstance(func.get('expr'), list):
+                if has_variable(func.get('expr')[0]):
+                    return True
+            elif find_type(func, EVALUATED_FUNC_TYPES) is not None and has_variable(func):
+                return True
+        if has_variable(node.get('binom')):
+            return True
+        stack.extend(value for key, value in node.items() if key != 'token_index')
+    return False
+
+
+def get_multi_arg_func_name(func):
+    '''
+    Return the name of a multi-arg function, e.g. `gcd` for `\\gcd` or `\\operatorname{gcd}`, otherwise `None`
+    '''
+    sub_func = func.get('func_multi_arg')
+    if sub_func is None:
+        return None
+    if 'func_cmd_multi_arg' in sub_func:
+        return sub_func.get('func_cmd_multi_arg').get('text')[1:]
+    if 'func_name_multi_arg' in sub_func:
+        return sub_func.get('func_name_multi_arg').get('text')
+    return sub_func.get('tokens')[0].get('text')[1:]
+
+
+def has_variable(node):
+    '''
+    Return `True` if there is a `\\variable{...}` in the parsed node
+    '''
+    stack = [node]
+    while len(stack) > 0:
+        node = stack.pop()
+        if isinstance(node, list):
+            stack.extend(node)
+        elif isinstance(node, dict):
+            text = node.get('text')
+            if isinstance(text, str) and '\\variable' in text:
+                return True
+            stack.extend(value for key, value in node.items() if key != 'token_index')
+    return False
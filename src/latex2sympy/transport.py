@@ -0,0 +1,256 @@
+import array
+import functools
+import importlib
+import marshal
+import pickle
+import sympy
+from mpmath.libmp import MPZ
+from sympy.core.function import AppliedUndef, Application
+from sympy.core.operations import AssocOp
+from sympy.core.relational import Relational
+from sympy.core.singleton import Singleton
+from sympy.matrices import MatrixBase
+from sympy.physics.units.quantities import Quantity
+
+# the version of the format, which is checked by `loads`
+VERSION = 1
+
+# the tags of the nodes, where a node of an expression (e.g. `Add`) is tagged with the index of its class, so `NODE`
+# is only used to encode it
+NODE = 0
+SYMBOL = -1
+INTEGER = -2
+RATIONAL = -3
+FLOAT = -4
+SINGLETON = -5
+QUANTITY = -6
+UNDEFINED_FUNCTION = -7
+MATRIX = -8
+LIST = -9
+VALUE = -10
+PICKLE = -11
+
+# the types of the converted expressions which are evaluated when created, unless created with `evaluate=False`
+UNEVALUATED_TYPES = (AssocOp, sympy.Pow, sympy.MatPow, Relational, Application)
+
+
+def dumps(obj):
+    '''
+    Serialize a converted expression (or a list of them, e.g. the results of `process_sympy_many`) to bytes,
+    to send it to another process, where `loads` creates an equal expression, without evaluating it.
+
+    The expression tree is flattened into a table of nodes of plain python values (e.g. `(class index, args)`),
+    where each node is stored once, and children come before their parents, which is written with `marshal`.
+    The args of a node are the indices of their nodes, packed into bytes.
+    Objects which are not in the converter's output (e.g. an exception) are pickled.
+    '''
+    encoder = Encoder()
+    root = encoder.encode(obj)
+    typecode = 'H' if len(encoder.nodes) <= 0xFFFF else 'I'
+    for node in encoder.nodes:
+        # the args are the last item of a node, and are only a list if the node has args
+        if type(node) is list:
+            node[-1] = array.array(typecode, node[-1]).tobytes()
+    return marshal.dumps((VERSION, typecode, tuple(encoder.classes), tuple(encoder.nodes), root))
+
+
+def loads(data: bytes):
+    '''
+    Deserialize an expression serialized with `dumps`.
+
+    As with `pickle`, only load data from a trusted source, e.g. a worker process.
+    '''
+    version, typecode, class_names, nodes, root = marshal.loads(data)
+    if version != VERSION:  # pragma: no cover
+        raise Exception(f'Unsupported transport version {version}')
+    classes = [get_class(module, name) for module, name in class_names]
+    builders = [get_builder(cls) for cls in classes]
+
+    objs = []
+    for node in nodes:
+        tag = node[0]
+        if tag >= 0:
+            obj = builders[tag](classes[tag], [objs[i] for i in memoryview(node[1]).cast(typecode)])
+        elif tag == SYMBOL:
+            obj = sympy.Symbol(node[1], **dict(node[2]))
+        elif tag == INTEGER:
+            obj = sympy.Integer(node[1])
+        elif tag == RATIONAL:
+            obj = sympy.Rational(node[1], node[2], 1)
+        elif tag == FLOAT:
+            sign, man, exp, bc = node[1]
+            obj = sympy.Float._new((sign, MPZ(man), exp, bc), node[2])
+        elif tag == SINGLETON:
+            obj = getattr(sympy.S, classes[node[1]].__name__)
+        elif tag == QUANTITY:
+            obj = get_quantity(classes[node[1]], node[2], node[3])
+        elif tag == UNDEFINED_FUNCTION:
+            obj = sympy.Function(node[1])(*[objs[i] for i in memoryview(node[2]).cast(typecode)])
+        elif tag == MATRIX:
+            obj = classes[node[1]](node[2], node[3], [objs[i] for i in memoryview(node[4]).cast(typecode)])
+        elif tag == LIST:
+            obj = [objs[i] for i in memoryview(node[1]).cast(typecode)]
+        elif tag == VALUE:
+            obj = node[1]
+        else:
+            obj = pickle.loads(node[1])
+        objs.append(obj)
+    return objs[root]
+
+
+class Encoder:
+    '''
+    Flatten objects into a table of nodes, see `dumps`
+
+    nodes: list - the node of each object, after the nodes of its children, where a node with args is a list, with the
+        indices of the nodes of its args last
+    classes: list - `(module, name)` of each class of the nodes
+    '''
+
+    def __init__(self):
+        self.nodes = []
+        self.classes = []
+        # class -> index in `classes`
+        self.class_ids = {}
+        # id of each encoded object -> index in `nodes`, objects are only referenced while encoding
+        self.node_ids = {}
+
+    def encode(self, obj):
+        '''
+        Add the node of the object, and of its children, and return its index
+        '''
+        index = self.node_ids.get(id(obj))
+        if index is None:
+            node = self.create_node(obj)
+            index = len(self.nodes)
+            self.nodes.append(node)
+            self.node_ids[id(obj)] = index
+        return index
+
+    def create_node(self, obj):
+        kind = get_kind(type(obj))
+        if kind == NODE:
+            if len(obj.args) > 0:
+                return [self.get_class_id(type(obj)), self.encode_all(obj.args)]
+            # e.g. an atom which is not in the converter's output
+            kind = PICKLE
+        if kind == SYMBOL:
+            _, assumptions = obj.__getnewargs_ex__()
+            return SYMBOL, obj.name, tuple(assumptions.items())
+        if kind == INTEGER:
+            return INTEGER, int(obj)
+        if kind == RATIONAL:
+            return RATIONAL, int(obj.p), int(obj.q)
+        if kind == FLOAT:
+            sign, man, exp, bc = obj._mpf_
+            return FLOAT, (sign, int(man), exp, bc), obj._prec
+        if kind == SINGLETON:
+            return SINGLETON, self.get_class_id(type(obj))
+        if kind == QUANTITY:
+            # the name and abbrev are symbols, so use their names, rather than printing them
+            return QUANTITY, self.get_class_id(type(obj)), obj.name.name, obj.abbrev.name
+        if kind == UNDEFINED_FUNCTION:
+            return [UNDEFINED_FUNCTION, str(type(obj).__name__), self.encode_all(obj.args)]
+        if kind == MATRIX:
+            return [MATRIX, self.get_class_id(type(obj)), obj.rows, obj.cols, self.encode_all(obj)]
+        if kind == LIST:
+            return [LIST, self.encode_all(obj)]
+        if kind == VALUE:
+            return VALUE, obj
+        # e.g. an exception
+        return PICKLE, pickle.dumps(obj, pickle.HIGHEST_PROTOCOL)
+
+    def encode_all(self, objs):
+        return [self.encode(obj) for obj in objs]
+
+    def get_class_id(self, cls):
+        class_id = self.class_ids.get(cls)
+        if class_id is None:
+            class_id = len(self.classes)
+            self.classes.append((cls.__module__, cls.__qualname__))
+            self.class_ids[cls] = class_id
+        return class_id
+
+
+@functools.lru_cache(maxsize=None)
+def get_kind(cls):
+    '''
+    Return the tag of the nodes of the class, or `NODE` for the other expressions
+    '''
+    if cls is sympy.Symbol:
+        return SYMBOL
+    if issubclass(cls, sympy.Basic):
+        if cls.is_Integer:
+            return INTEGER
+        if cls.is_Rational:
+            return RATIONAL
+        if cls.is_Float:
+            return FLOAT
+        if isinstance(cls, Singleton):
+            return SINGLETON
+        if issubclass(cls, Quantity):
+            return QUANTITY
+        if issubclass(cls, AppliedUndef):
+            return UNDEFINED_FUNCTION
+    if issubclass(cls, MatrixBase):
+        return MATRIX
+    if issubclass(cls, sympy.Basic):
+        return NODE
+    if cls is list:
+        return LIST
+    if cls in (bool, int, float, str, type(None)):
+        return VALUE
+    return PICKLE
+
+
+@functools.lru_cache(maxsize=None)
+def get_class(module: str, name: str):
+    return getattr(importlib.import_module(module), name)
+
+
+@functools.lru_cache(maxsize=None)
+def get_builder(cls):
+    '''
+    Return the function which creates a node of the class from its args, without evaluating it
+    '''
+    # the args of a node are already sympified, and in the order they were converted,
+    # so `Add` and `Mul` are created the same as with `evaluate=False`, but without checking the args again
+    if cls is sympy.Add or cls is sympy.Mul:
+        return create_assoc_op
+    if cls is sympy.Pow:
+        return create_pow
+    if issubclass(cls, UNEVALUATED_TYPES):
+        return create_unevaluated
+    return create_node
+
+
+def create_assoc_op(cls, args):
+    return cls._from_args(args)
+
+
+def create_pow(cls, args):
+    base, exp = args
+    obj = sympy.Expr.__new__(cls, base, exp)
+    obj.is_commutative = base.is_commutative and exp.is_commutative
+    return obj
+
+
+def create_unevaluated(cls, args):
+    return cls(*args, evaluate=False)
+
+
+def create_node(cls, args):
+    return cls(*args)
+
+
+def get_quantity(cls, name: str, abbrev: str):
+    '''
+    Return the unit with the name and abbrev, so that units created on demand (e.g. `GiB`) are also created in this
+    process, which defines their scale factors and dimensions
+    '''
+    from latex2sympy.units.unit_aliases import UNIT_ALIASES, UnitAliasIndex
+    if isinstance(UNIT_ALIASES, UnitAliasIndex):
+        quantity = UNIT_ALIASES.find_quantity(name, abbrev)
+        if quantity is not None:
+            return quantity
+    return cls(name, abbrev)
@@ -1,4 +1,34 @@
-from latex2sympy.units.prefixes import PREFIX_ALIASES, create_prefixed_unit
-from latex2sympy.units.sie import SIE
-from latex2sympy.units.unit_aliases import UNIT_ALIASES
-from latex2sympy.units.utils import find_prefix, find_unit, is_unit, convert_to
+import importlib
+
+# the units subsystem is loaded on first use, as building the unit aliases and the "SI Extended" unit system is slow,
+# and they are not needed to convert latex without units
+LAZY_ATTRIBUTES = {
+    'PREFIX_ALIASES': 'latex2sympy.units.prefixes',
+    'create_prefixed_unit': 'latex2sympy.units.prefixes',
+    'SIE': 'latex2sympy.units.sie',
+    'UNIT_ALIASES': 'latex2sympy.units.unit_aliases',
+    'find_prefix': 'latex2sympy.units.utils',
+    'find_unit': 'latex2sympy.units.utils',
+    'is_unit': 'latex2sympy.units.utils',
+    'convert_to': 'latex2sympy.units.utils',
+    'convert_to_base_units': 'latex2sympy.units.utils',
+    'conversion_cache': 'latex2sympy.units.utils',
+    'convert_many': 'latex2sympy.units.utils',
+    'dimension_of': 'latex2sympy.units.dimensions',
+    'same_dimension': 'latex2sympy.units.dimensions',
+    'si_scale_factor_of': 'latex2sympy.units.dimensions',
+    'split_units': 'latex2sympy.units.trie',
+}
+
+
+def __getattr__(name):
+    if name in LAZY_ATTRIBUTES:
+        value = getattr(importlib.import_module(LAZY_ATTRIBUTES[name]), name)
+        # later lookups find the value directly, without calling `__getattr__`
+        globals()[name] = value
+        return value
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+def __dir__():
+    return sorted(set(globals()) | set(LAZY_ATTRIBUTES))
@@ -1,5 +1,98 @@
+from fractions import Fraction
 from sympy.physics.units import Dimension
 
 # define new dimensions
 solid_angle = Dimension("solid_angle")
 luminous_flux = Dimension("luminous_flux")
+
+
+def dimension_of(expr):
+    '''
+    Return the dimension of the expr, as a tuple of the exponents of each dimension in `get_dimension_names()`,
+    e.g. `km/hr` and `m/s` both have the dimension of `length / time`.
+
+    The dimensions of units are precomputed in the unit aliases, so this is tuple arithmetic, and does not use the
+    sympy dimension system.
+    '''
+    import sympy
+    from sympy.physics.units.quantities import Quantity
+
+    if isinstance(expr, Quantity):
+        return get_quantity_dimension_and_scale_factor(expr)[0]
+    if isinstance(expr, sympy.Mul):
+        exponents = get_dimensionless()
+        for arg in expr.args:
+            exponents = tuple(e + arg_e for e, arg_e in zip(exponents, dimension_of(arg)))
+        return exponents
+    if isinstance(expr, sympy.Pow) and expr.exp.is_Rational:
+        power = int(expr.exp) if expr.exp.is_Integer else Fraction(int(expr.exp.p), int(expr.exp.q))
+        return tuple(e * power for e in dimension_of(expr.base))
+    if isinstance(expr, sympy.Add):
+        exponents = [dimension_of(arg) for arg in expr.args]
+        if any(e != exponents[0] for e in exponents):
+            raise Exception(f'Could not find the dimension of "{str(expr)}", as its terms have different dimensions')
+        return exponents[0]
+    if not expr.has(Quantity):
+        # numbers and variables are dimensionless
+        return get_dimensionless()
+    raise Exception(f'Could not find the dimension of "{str(expr)}"')
+
+
+def same_dimension(a, b):
+    '''
+    Check if both exprs have the same dimension, e.g. `km/hr` and `m/s`, so that one can be converted to the other.
+    '''
+    return dimension_of(a) == dimension_of(b)
+
+
+def si_scale_factor_of(expr):
+    '''
+    Return the exact scale factor of the expr to SI base units, e.g. `km/hr` => `5/18`, and `3 km` => `3000`.
+    '''
+    from sympy.physics.units.quantities import Quantity
+
+    dimension_of(expr)  # check that the terms of a sum have the same dimension
+    return expr.replace(lambda e: isinstance(e, Quantity), lambda q: get_quantity_dimension_and_scale_factor(q)[1])
+
+
+def get_dimensionless():
+    return (0,) * len(get_dimension_names())
+
+
+def get_dimension_names():
+    '''
+    Return the names of the dimensions of `dimension_of`: the "SI Extended" base dimensions (including `solid_angle`),
+    followed by the dimensions which are not defined in base dimensions (e.g. `information`)
+    '''
+    from latex2sympy.units.unit_aliases import UNIT_ALIASES, UnitAliasIndex
+    if isinstance(UNIT_ALIASES, UnitAliasIndex):
+        return UNIT_ALIASES.dimension_names
+    else:  # pragma: no cover
+        from latex2sympy.units.sie import dimsys_SIE
+        return [str(dimension.name) for dimension in dimsys_SIE.base_dims]
+
+
+def get_quantity_dimension_and_scale_factor(quantity):
+    '''
+    Return `(dimension exponents, scale factor to SI base units)` of the unit
+    '''
+    from latex2sympy.units.unit_aliases import UNIT_ALIASES, UnitAliasIndex
+    if isinstance(UNIT_ALIASES, UnitAliasIndex):
+        dimension = UNIT_ALIASES.get_dimension(quantity)
+        if dimension is not None:
+            return dimension
+
+    # the unit is not in the unit aliases, so use the sympy dimension system
+    from sympy.physics.units import kilogram
+    from latex2sympy.units.sie import SIE, dimsys_SIE
+    dimension_names = get_dimension_names()
+    exponents = [0] * len(dimension_names)
+    dimension = SIE.get_quantity_dimension(quantity)
+    for dependency, exponent in dimsys_SIE.get_dimensional_dependencies(dimension).items():
+        if str(dependency.name) not in dimension_names:
+            raise Exception(f'Could not find the dimension of "{str(quantity)}"')
+        exponents[dimension_names.index(str(dependency.name))] += int(exponent)
+    # sympy scales mass to grams
+    mass_exponent = exponents[dimension_names.index('mass')]
+    scale_factor = SIE.get_quantity_scale_factor(quantity) / SIE.get_quantity_scale_factor(kilogram)**mass_exponent
+    return tuple(exponents), scale_factor
@@ -27,7 +27,6 @@ from latex2sympy.units.unit_definitions import (
     lumen,
     lbf, slug, calorie, btu, degC, degF, dB, mph, knot, cfm, cfs, rood, acre, sievert, pc, cc, molar, rpm
 )
-from latex2sympy.units.prefixed_unit_definitions import additional_prefixed_units
 
 # define units to include in SIE that are not in SI, or are new versions
 all_units: list[Quantity] = [
@@ -35,7 +34,6 @@ all_units: list[Quantity] = [
     liter, gray, bit, byte,
     lbf, slug, calorie, btu, degC, degF, dB, mph, knot, cfm, cfs, rood, acre, sievert, pc, cc, molar, rpm
 ]
-all_units.extend(additional_prefixed_units)
 
 dimsys_SIE = dimsys_SI.extend(
     [
@@ -0,0 +1,126 @@
+import functools
+from latex2sympy.units.prefixes import ALL_PREFIXES, PREFIX_ALIASES
+from latex2sympy.units.unit_aliases import UnitAliasIndex
+
+# the symbols of units whose abbrev is their name, e.g. `hour`, which are aliases
+ALIAS_SYMBOLS = {'h', 'min', 'lb', 'in', 'mi'}
+
+# the prefixes of the units which can follow another unit, e.g. `Nkm`, as units with other prefixes are more likely
+# to be letters, e.g. `pm` in `gpm`
+INNER_PREFIXES = {'k', 'M', 'G', 'c', 'm'}
+
+
+def split_units(text: str):
+    '''
+    Split a run of unit symbols without spaces into the symbols of its units, e.g. `kgm` => `['kg', 'm']`,
+    or return `None` if it cannot be split.
+
+    See `UnitTrie.split` for how the split is chosen.
+    '''
+    return get_unit_trie().split(text)
+
+
+@functools.lru_cache(maxsize=1)
+def get_unit_trie():
+    # the unit aliases are loaded on first use
+    from latex2sympy.units.unit_aliases import UNIT_ALIASES
+    return UnitTrie(get_units(UNIT_ALIASES))
+
+
+def get_units(unit_aliases):
+    '''
+    Return `[class name, name, abbrev, aliases]` of each unit in `unit_aliases`
+    '''
+    if isinstance(unit_aliases, UnitAliasIndex):
+        # the prefixed units are not created, only their aliases
+        return [*unit_aliases.units, *unit_aliases.get_prefixed_units()]
+    else:  # pragma: no cover
+        # the unit aliases were imported from code, as a dict of alias -> `Quantity`
+        aliases_by_unit = {}
+        for alias, unit in unit_aliases.items():
+            aliases_by_unit.setdefault(unit, []).append(alias)
+        return [[type(u).__name__, str(u.name), str(u.abbrev), aliases] for u, aliases in aliases_by_unit.items()]
+
+
+class UnitTrie:
+    '''
+    A trie of unit symbols, for splitting a run of symbols without spaces (e.g. `kgm`) into units.
+
+    Only symbols are used, i.e. abbrevs (e.g. `kg`, not `kilogram`), latex (e.g. `k\\Omega`) and `ALIAS_SYMBOLS`,
+    and physical constants (e.g. `c`) are excluded, as they are too easily confused with letters.
+
+    symbols: dict - unit symbol -> the abbrev of its prefix, if the unit is prefixed (e.g. `k` for `kg`), or `None`
+    '''
+
+    def __init__(self, units: list):
+        prefix_names = {str(prefix.name): abbrev for abbrev, prefix in ALL_PREFIXES.items()}
+        unit_names = set(unit[1] for unit in units)
+
+        self.symbols = {}
+        for class_name, name, abbrev, aliases in units:
+            if class_name == 'PhysicalConstant':
+                continue
+            # e.g. `kilogram` is `kilo` + `gram`
+            prefix = next((a for p, a in prefix_names.items() if name.startswith(p) and name[len(p):] in unit_names),
+                          None)
+            for alias in aliases:
+                if alias == abbrev or '\\' in alias or alias in ALIAS_SYMBOLS:
+                    self.symbols[alias] = prefix
+
+        # each node is a dict of char -> child node, and the empty string -> symbol, if a symbol ends at the node
+        self.root = {}
+        for symbol in self.symbols:
+            node = self.root
+            for char in symbol:
+                node = node.setdefault(char, {})
+            node[''] = symbol
+
+    def split(self, text: str):
+        '''
+        Split `text` into unit symbols, or return `None` if it cannot be split.
+
+        - the first unit cannot also be a prefix, if more units follow, e.g. `Mohms` is not `M ohm s`,
+          as it reads as a prefixed unit
+        - units after the first can only be prefixed with `INNER_PREFIXES`, e.g. `gpm` is not `g pm`
+        - of the remaining splits, the one with the fewest prefixed units is used, then the one with the fewest units,
+          e.g. `Nms` is `N m s`, not `N ms`, but `Nkm` is `N km`
+        - if more than one split is the best, the split is ambiguous, and `None` is returned,
+          e.g. `lbft` is either `lbf t` or `lb ft`
+
+        The trie is walked once from each position, so this takes linear time in the length of `text`
+        (times the length of the longest symbol), without trying each possible split.
+        '''
+        n = len(text)
+        # the best split of `text[i:]`, as (prefixed unit count, unit count, end of the first unit, `True` if another
+        # split is as good)
+        best = [None] * n + [(0, 0, n, False)]
+        for i in range(n - 1, -1, -1):
+            node = self.root
+            for j in range(i, n):
+                node = node.get(text[j])
+                if node is None:
+                    break
+                symbol = node.get('')
+                if symbol is None or best[j + 1] is None:
+                    continue
+                prefix = self.symbols[symbol]
+                if i > 0 and prefix is not None and prefix not in INNER_PREFIXES:
+                    continue
+                if i == 0 and j + 1 < n and symbol in PREFIX_ALIASES:
+                    continue
+                prefixed_count, count, _, ambiguous = best[j + 1]
+                rank = (prefixed_count + (prefix is not None), count + 1)
+                if best[i] is None or rank < best[i][:2]:
+                    best[i] = (*rank, j + 1, ambiguous)
+                elif rank == best[i][:2]:
+                    best[i] = (*rank, best[i][2], True)
+
+        if best[0] is None or best[0][3]:
+            return None
+        symbols = []
+        i = 0
+        while i < n:
+            end = best[i][2]
+            symbols.append(text[i:end])
+            i = end
+        return symbols
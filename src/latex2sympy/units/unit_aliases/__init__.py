@@ -1,17 +1,256 @@
+import json
 import os.path
-import pickle
+import threading
+from collections.abc import Mapping
 
 # export UNIT_ALIASES
 # -------------------
-# load UNIT_ALIASES from a pickled file, if the file exists
+# load UNIT_ALIASES on first use, from the alias index file generated by `unit_aliases.py`, if the file exists
 # or import from code
 
 ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '.'))
-pickle_file_path = f'{ROOT_DIR}/unit_aliases.pkl'
-pickle_file_exists = os.path.isfile(pickle_file_path)
-if pickle_file_exists:
-    pickle_file = open(pickle_file_path, 'rb')
-    UNIT_ALIASES = pickle.load(pickle_file)
-    pickle_file.close()
-else:  # pragma: no cover
-    from latex2sympy.units.unit_aliases.unit_aliases import UNIT_ALIASES
+index_file_path = f'{ROOT_DIR}/unit_aliases_index.json'
+
+load_lock = threading.Lock()
+
+
+class UnitAliasIndex(Mapping):
+    '''
+    A read-only mapping of unit alias -> `Quantity`, loaded from the alias index file.
+
+    Only the table of aliases is loaded, and each `Quantity` is created on its first lookup and then reused,
+    so looking up a string which is not a unit alias does not create any units, or build the unit system.
+
+    The aliases of additional prefixed units (e.g. `kL`, `GiB`) are not stored. Instead, an alias which is not found
+    is split into a prefix and the alias suffix of a unit which allows that prefix, and the prefixed unit is created
+    with `create_prefixed_unit`.
+
+    units: list - unit id -> `[class name, name, abbrev, aliases]`
+    prefixed_units: list - `[unit id, prefix abbrevs, abbrev suffixes, name suffixes]` of each unit which is prefixed
+        on first lookup, e.g. the abbrev suffixes of liter are `['L']`, and its name suffixes `['liter', 'litre']`
+    prefixed_unit_aliases: dict - the other aliases of prefixed units -> `[prefixed unit index, prefix abbrev]`,
+        e.g. `milliliters`, as only some prefixed liters have plural names
+    dimension_names: list - the SIE base dimensions, followed by the dimensions which are not defined in base dimensions
+        (e.g. `information`)
+    unit_dimensions: list - unit id -> `[[dimension index, exponent], ...], scale factor to SI base units`
+    '''
+
+    def __init__(self, units: list, prefixed_units: list, prefixed_unit_aliases: dict,
+                 dimension_names: list, unit_dimensions: list):
+        self.units = units
+        self.prefixed_units = prefixed_units
+        self.prefixed_unit_aliases = prefixed_unit_aliases
+        self.dimension_names = dimension_names
+        self.unit_dimensions = unit_dimensions
+        # (name, abbrev) -> unit id, or (prefixed unit index, prefix abbrev), created on first use
+        self.unit_keys = None
+        # unit id, or (prefixed unit index, prefix abbrev) -> `(dimension exponents, scale factor)`
+        self.dimensions = {}
+        self.unit_ids = {alias: unit_id for unit_id, unit in enumerate(units) for alias in unit[3]}
+        # alias suffix -> index of each prefixed unit with that suffix
+        self.prefixed_unit_ids = {}
+        for prefixed_unit_id, (_, _, abbrev_suffixes, name_suffixes) in enumerate(prefixed_units):
+            for suffix in set([*abbrev_suffixes, *name_suffixes]):
+                self.prefixed_unit_ids.setdefault(suffix, []).append(prefixed_unit_id)
+        # unit id, or (prefixed unit index, prefix abbrev) -> `Quantity`
+        self.quantities = {}
+
+    def __getitem__(self, alias):
+        key = self.unit_ids.get(alias)
+        if key is None:
+            key = self.find_prefixed_unit(alias)
+            if key is None:
+                raise KeyError(alias)
+        return self.get_quantity(key)
+
+    def __contains__(self, alias):
+        return alias in self.unit_ids or self.find_prefixed_unit(alias) is not None
+
+    def __iter__(self):
+        yield from self.unit_ids
+        for _, _, _, aliases in self.get_prefixed_units():
+            yield from aliases
+
+    def __len__(self):
+        return len(self.unit_ids) + sum(len(aliases) for _, _, _, aliases in self.get_prefixed_units())
+
+    def find_prefixed_unit(self, alias: str):
+        '''
+        Split the alias into a prefix and the suffix of a prefixed unit, e.g. `kL` => `k` + `L`,
+        and return `(prefixed unit index, prefix abbrev)`, or `None` if it is not the alias of a prefixed unit.
+        '''
+        from latex2sympy.units.prefixes import PREFIX_ALIASES
+
+        if alias in self.prefixed_unit_aliases:
+            return tuple(self.prefixed_unit_aliases[alias])
+        for i in range(1, len(alias)):
+            prefixed_unit_ids = self.prefixed_unit_ids.get(alias[i:])
+            if prefixed_unit_ids is None:
+                continue
+            # the prefix may also be capitalized (e.g. `Kiloliter`), or followed by a space (e.g. `\mu L`)
+            prefix_text = alias[:i].rstrip()
+            prefix = PREFIX_ALIASES.get(prefix_text, PREFIX_ALIASES.get(prefix_text[:1].lower() + prefix_text[1:]))
+            if prefix is None:
+                continue
+            prefix_abbrev = str(prefix.abbrev)
+            for prefixed_unit_id in prefixed_unit_ids:
+                # the prefix must be allowed for the unit, and the alias one of its aliases, e.g. not `kliter`
+                if prefix_abbrev in self.prefixed_units[prefixed_unit_id][1] and \
+                        alias in self.get_prefixed_aliases(prefixed_unit_id, prefix_abbrev):
+                    return prefixed_unit_id, prefix_abbrev
+        return None
+
+    def get_prefixed_aliases(self, prefixed_unit_id: int, prefix_abbrev: str):
+        '''
+        Return the aliases of the unit with the given prefix, the same as `unit_aliases.py` defines them.
+        '''
+        from latex2sympy.units.prefixes import PREFIX_ALIASES
+
+        _, _, abbrev_suffixes, name_suffixes = self.prefixed_units[prefixed_unit_id]
+        prefix_name = str(PREFIX_ALIASES[prefix_abbrev].name)
+        return get_prefixed_aliases(prefix_abbrev, prefix_name, abbrev_suffixes, name_suffixes)
+
+    def get_prefixed_units(self):
+        '''
+        Return `[class name, name, abbrev, aliases]` of each prefixed unit, without creating them
+        '''
+        from latex2sympy.units.prefixes import PREFIX_ALIASES
+
+        other_aliases = {}
+        for alias, key in self.prefixed_unit_aliases.items():
+            other_aliases.setdefault(tuple(key), []).append(alias)
+
+        prefixed_units = []
+        for prefixed_unit_id, (unit_id, prefix_abbrevs, _, _) in enumerate(self.prefixed_units):
+            _, name, abbrev, _ = self.units[unit_id]
+            for prefix_abbrev in prefix_abbrevs:
+                prefix_name = str(PREFIX_ALIASES[prefix_abbrev].name)
+                aliases = [
+                    *self.get_prefixed_aliases(prefixed_unit_id, prefix_abbrev),
+                    *other_aliases.get((prefixed_unit_id, prefix_abbrev), [])
+                ]
+                prefixed_units.append(['Quantity', prefix_name + name, prefix_abbrev + abbrev, aliases])
+        return prefixed_units
+
+    def get_quantity(self, key):
+        quantity = self.quantities.get(key)
+        if quantity is None:
+            # if another thread created the same unit first, use that one
+            quantity = self.quantities.setdefault(key, self.create_quantity(key))
+        return quantity
+
+    def find_quantity(self, name: str, abbrev: str):
+        '''
+        Return the `Quantity` with the name and abbrev, e.g. to replace a copy of it (e.g. unpickled),
+        which the unit system does not know, or `None` if the unit is not in the index
+        '''
+        key = self.get_unit_key(name, abbrev)
+        if key is None:
+            return None
+        return self.get_quantity(key)
+
+    def get_dimension(self, quantity):
+        '''
+        Return `(dimension exponents, scale factor to SI base units)` of the unit, where the exponents are a tuple of
+        integers by `dimension_names`, or `None` if the unit is not in the index
+        '''
+        key = self.get_unit_key(str(quantity.name), str(quantity.abbrev))
+        if key is None:
+            return None
+        return self.get_dimension_by_key(key)
+
+    def get_unit_key(self, name: str, abbrev: str):
+        if self.unit_keys is None:
+            self.unit_keys = self.create_unit_keys()
+        return self.unit_keys.get((name, abbrev))
+
+    def get_dimension_by_key(self, key):
+        dimension = self.dimensions.get(key)
+        if dimension is None:
+            # if another thread created the same dimension first, use that one
+            dimension = self.dimensions.setdefault(key, self.create_dimension(key))
+        return dimension
+
+    def create_dimension(self, key):
+        import sympy
+        from latex2sympy.units.prefixes import PREFIX_ALIASES
+
+        if isinstance(key, tuple):
+            # a prefixed unit has the dimension of its unit, scaled by the prefix
+            prefixed_unit_id, prefix_abbrev = key
+            exponents, scale_factor = self.get_dimension_by_key(self.prefixed_units[prefixed_unit_id][0])
+            return exponents, scale_factor * PREFIX_ALIASES[prefix_abbrev].scale_factor
+
+        dimension_exponents, scale_factor = self.unit_dimensions[key]
+        exponents = [0] * len(self.dimension_names)
+        for dimension_id, exponent in dimension_exponents:
+            exponents[dimension_id] = exponent
+        return tuple(exponents), sympy.sympify(scale_factor)
+
+    def create_unit_keys(self):
+        from latex2sympy.units.prefixes import PREFIX_ALIASES
+
+        unit_keys = {(name, abbrev): unit_id for unit_id, (_, name, abbrev, _) in enumerate(self.units)}
+        for prefixed_unit_id, (unit_id, prefix_abbrevs, _, _) in enumerate(self.prefixed_units):
+            _, name, abbrev, _ = self.units[unit_id]
+            for prefix_abbrev in prefix_abbrevs:
+                prefix_name = str(PREFIX_ALIASES[prefix_abbrev].name)
+                unit_keys[(prefix_name + name, prefix_abbrev + abbrev)] = (prefixed_unit_id, prefix_abbrev)
+        return unit_keys
+
+    def create_quantity(self, key):
+        # the unit system defines the scale factors of the units, so build it first
+        import latex2sympy.units.sie  # noqa: F401
+        from sympy.physics.units.quantities import Quantity, PhysicalConstant
+        from latex2sympy.units.prefixes import PREFIX_ALIASES, create_prefixed_unit
+
+        if isinstance(key, tuple):
+            # the prefixed unit is created from its unit, which defines its scale factor and dimension
+            prefixed_unit_id, prefix_abbrev = key
+            unit = self.get_quantity(self.prefixed_units[prefixed_unit_id][0])
+            return create_prefixed_unit(unit, PREFIX_ALIASES[prefix_abbrev])
+
+        class_name, name, abbrev, _ = self.units[key]
+        # a unit is re-created from its name and abbrev, the same as when unpickling it
+        cls = PhysicalConstant if class_name == 'PhysicalConstant' else Quantity
+        return cls(name, abbrev)
+
+
+def get_prefixed_aliases(prefix_abbrev: str, prefix_name: str, abbrev_suffixes: list, name_suffixes: list):
+    '''
+    Return the aliases of a prefixed unit, from the prefix and the alias suffixes of the unit, e.g.
+    `k`, `kilo`, `['L']`, `['liter', 'litre']` => `['kL', 'kiloliter', 'Kiloliter', 'kilolitre', 'Kilolitre']`
+    '''
+    aliases = [prefix_abbrev + suffix for suffix in abbrev_suffixes]
+    # add "u" and "\\mu" as additional "micro" prefixes
+    if prefix_abbrev == 'mu':
+        aliases.extend('u' + suffix for suffix in abbrev_suffixes)
+        aliases.extend('\\mu ' + suffix for suffix in abbrev_suffixes)
+    capitalized_prefix_name = prefix_name[0].upper() + prefix_name[1:]
+    for suffix in name_suffixes:
+        aliases.append(prefix_name + suffix)
+        aliases.append(capitalized_prefix_name + suffix)
+    return aliases
+
+
+def load_unit_aliases():
+    if os.path.isfile(index_file_path):
+        with open(index_file_path, 'r', encoding='utf-8') as index_file:
+            index = json.load(index_file)
+            return UnitAliasIndex(index['units'], index['prefixed_units'], index['prefixed_unit_aliases'],
+                                  index['dimension_names'], index['unit_dimensions'])
+    else:  # pragma: no cover
+        import latex2sympy.units.sie  # noqa: F401
+        from latex2sympy.units.unit_aliases.unit_aliases import UNIT_ALIASES
+        return UNIT_ALIASES
+
+
+def __getattr__(name):
+    global UNIT_ALIASES
+    if name == 'UNIT_ALIASES':
+        with load_lock:
+            # another thread may have loaded it while waiting for the lock
+            if 'UNIT_ALIASES' not in globals():
+                UNIT_ALIASES = load_unit_aliases()
+        return UNIT_ALIASES
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -1,22 +1,27 @@
 import json
 import os.path
-import pickle
-from sympy import latex
+from sympy import latex, sympify
 import sympy.physics.units.definitions.unit_definitions as sympy_units
 from sympy.physics.units.quantities import Quantity, PhysicalConstant
 from sympy.physics.units.systems.mks import all_units as mks_units
 from sympy.physics.units.systems.mksa import all_units as mksa_units
 from sympy.physics.units.systems.si import all_units as si_units
-from latex2sympy.units.sie import all_units as sie_units
-from latex2sympy.units.prefixes import ALL_PREFIXES, PREFIX_ALIASES
+from latex2sympy.units.sie import SIE, dimsys_SIE, all_units as sie_units
+from latex2sympy.units.prefixes import (
+    ALL_PREFIXES, PREFIX_ALIASES, SI_PREFIXES, INFORMATION_SI_PREFIXES, BIN_PREFIXES, prefix_unit
+)
 import latex2sympy.units.unit_definitions as additional_units
 from latex2sympy.units.unit_definitions import liter, gray, bit, byte
-from latex2sympy.units.prefixed_unit_definitions import (
-    liter_prefixed_units,
-    gray_prefixed_units,
-    bit_prefixed_units, bit_si_prefixed_units,
-    byte_prefixed_units
-)
+from latex2sympy.units.prefixed_unit_definitions import prefixed_unit_rules, create_additional_prefixed_units
+from latex2sympy.units.unit_aliases import get_prefixed_aliases
+
+# create the additional prefixed units, to define their aliases
+additional_prefixed_units = create_additional_prefixed_units()
+liter_prefixed_units = prefix_unit(liter, SI_PREFIXES)
+gray_prefixed_units = prefix_unit(gray, SI_PREFIXES)
+bit_prefixed_units = prefix_unit(bit, BIN_PREFIXES)
+bit_si_prefixed_units = prefix_unit(bit, INFORMATION_SI_PREFIXES)
+byte_prefixed_units = prefix_unit(byte, BIN_PREFIXES)
 
 # -------------------------------------------------------------------------------------------------
 # define fixed sympy units / additional unit aliases
@@ -262,7 +267,8 @@ all_si_units = set([
     *mks_units,
     *mksa_units,
     *si_units,
-    *sie_units
+    *sie_units,
+    *additional_prefixed_units
 ])
 # add aliases for all prefixed units
 for u in all_si_units:
@@ -285,14 +291,121 @@ for attr in dir(additional_units):
             UNIT_ALIASES[alias] = u
 
 # -------------------------------------------------------------------------------------------------
-# output pickled file
+# output alias index file
 # -------------------------------------------------------------------------------------------------
 
 ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '.'))
 
-pickle_file = open(f'{ROOT_DIR}/unit_aliases.pkl', 'wb')
-pickle.dump(UNIT_ALIASES, pickle_file)
-pickle_file.close()
+# each unit is stored once, as `[class name, name, abbrev, aliases]`, and is re-created from its name and abbrev
+# when first looked up (see `UnitAliasIndex`)
+ALIASES_BY_QUANTITY = {}
+for alias, unit in UNIT_ALIASES.items():
+    ALIASES_BY_QUANTITY.setdefault(unit, []).append(alias)
+
+
+def get_alias_suffixes(aliases, unit, prefix):
+    '''
+    split the aliases of a prefixed unit into the alias suffixes after the prefix abbrev, and after the prefix name
+    '''
+    prefix_abbrev = str(prefix.abbrev)
+    prefix_name = str(prefix.name)
+    abbrev_suffixes = {}
+    name_suffixes = {}
+    for alias in aliases:
+        # a name suffix starts like the unit name, e.g. `Kibibit` is `Kibi` + `bit`, but `Kibit` is `Ki` + `bit`
+        if (alias.startswith(prefix_name) or alias.startswith(capitalize_first_letter(prefix_name))) and \
+                alias[len(prefix_name):].startswith(str(unit.name)[0]):
+            name_suffixes[alias[len(prefix_name):]] = True
+        elif alias.startswith(prefix_abbrev):
+            abbrev_suffixes[alias[len(prefix_abbrev):]] = True
+    return [*abbrev_suffixes], [*name_suffixes]
+
+
+# additional prefixed units are not stored, but are split into the prefix and an alias suffix of the unit
+# when first looked up, so store the alias suffixes of each unit, and its allowed prefixes
+prefixes_by_unit = {}
+for unit, prefixes in prefixed_unit_rules:
+    # override sympy units that have been fixed
+    if str(unit.name) in fixed_sympy_units:
+        unit = fixed_sympy_units[str(unit.name)]
+    prefixes_by_unit.setdefault(unit, {}).update(prefixes)
+
+alias_suffixes_by_unit = {}
+# the other aliases of some prefixed units, e.g. `milliliters`, as sympy also defines `milliliter`
+prefixed_unit_aliases = {}
+for unit, prefixes in prefixes_by_unit.items():
+    prefixed_units = dict(zip(prefixes, prefix_unit(unit, prefixes)))
+    aliases_by_prefix = {
+        prefix_abbrev: ALIASES_BY_QUANTITY.pop(prefixed_unit) for prefix_abbrev, prefixed_unit in prefixed_units.items()
+    }
+    # use the suffixes of every prefixed unit
+    suffixes_by_prefix = [get_alias_suffixes(aliases_by_prefix[p], unit, prefixes[p]) for p in prefixes]
+    abbrev_suffixes = [s for s in suffixes_by_prefix[0][0] if all(s in suffixes[0] for suffixes in suffixes_by_prefix)]
+    name_suffixes = [s for s in suffixes_by_prefix[0][1] if all(s in suffixes[1] for suffixes in suffixes_by_prefix)]
+    alias_suffixes_by_unit[unit] = (abbrev_suffixes, name_suffixes)
+    for prefix_abbrev, aliases in aliases_by_prefix.items():
+        prefix_name = str(prefixes[prefix_abbrev].name)
+        prefixed_aliases = get_prefixed_aliases(prefix_abbrev, prefix_name, abbrev_suffixes, name_suffixes)
+        if not set(prefixed_aliases).issubset(aliases):  # pragma: no cover
+            prefixed_unit_name = str(prefixed_units[prefix_abbrev].name)
+            raise Exception(f'prefixed unit: {prefixed_unit_name} is missing aliases of {str(unit.name)}')
+        for alias in aliases:
+            if alias not in prefixed_aliases:
+                prefixed_unit_aliases[alias] = (unit, prefix_abbrev)
+
+sorted_units = sorted(ALIASES_BY_QUANTITY.items(), key=lambda kvp: (str(kvp[0].name), str(kvp[0].abbrev)))
+index_units = [[type(unit).__name__, str(unit.name), str(unit.abbrev), aliases] for unit, aliases in sorted_units]
+unit_ids = {unit: unit_id for unit_id, (unit, _) in enumerate(sorted_units)}
+sorted_prefixed_units = sorted(prefixes_by_unit, key=lambda u: unit_ids[u])
+index_prefixed_units = [[unit_ids[u], [*prefixes_by_unit[u]], *alias_suffixes_by_unit[u]] for u in sorted_prefixed_units]
+index_prefixed_unit_aliases = {
+    alias: [sorted_prefixed_units.index(unit), prefix_abbrev]
+    for alias, (unit, prefix_abbrev) in prefixed_unit_aliases.items()
+}
+
+
+def get_dimension_exponents(unit):
+    '''
+    return the exponents of the dimension of the unit in the "SI Extended" unit system, by dimension name
+    '''
+    exponents = {}
+    dimension = SIE.get_quantity_dimension(unit)
+    for dependency, exponent in dimsys_SIE.get_dimensional_dependencies(dimension).items():
+        if not sympify(exponent).is_Integer:  # pragma: no cover
+            raise Exception(f'dimension: {str(unit.name)} has a non-integer exponent of {str(dependency.name)}')
+        dependency_name = str(dependency.name)
+        exponents[dependency_name] = exponents.get(dependency_name, 0) + int(exponent)
+    return {name: exponent for name, exponent in exponents.items() if exponent != 0}
+
+
+def get_si_scale_factor(unit, exponents):
+    '''
+    return the scale factor of the unit to SI base units, as sympy scales mass to grams, e.g. `kilogram` => `1000`
+    '''
+    mass_scale_factor = SIE.get_quantity_scale_factor(sympy_units.kilogram)
+    return SIE.get_quantity_scale_factor(unit) / mass_scale_factor**exponents.get('mass', 0)
+
+
+# the dimension of each unit, as exponents of the SIE base dimensions, followed by the dimensions which SIE does not
+# define in base dimensions (e.g. `information`), and its scale factor to SI base units (see `units.dimension_of`)
+unit_dimension_exponents = [get_dimension_exponents(unit) for unit, _ in sorted_units]
+base_dimension_names = [str(dimension.name) for dimension in dimsys_SIE.base_dims]
+other_dimension_names = set(name for exponents in unit_dimension_exponents for name in exponents)
+dimension_names = [*base_dimension_names, *sorted(other_dimension_names - set(base_dimension_names))]
+index_unit_dimensions = [
+    [[[dimension_names.index(name), exponent] for name, exponent in exponents.items()],
+     str(get_si_scale_factor(unit, exponents))]
+    for (unit, _), exponents in zip(sorted_units, unit_dimension_exponents)
+]
+with open(f'{ROOT_DIR}/unit_aliases_index.json', 'w', encoding='utf-8') as f:
+    index = {
+        'units': index_units,
+        'prefixed_units': index_prefixed_units,
+        'prefixed_unit_aliases': index_prefixed_unit_aliases,
+        'dimension_names': dimension_names,
+        'unit_dimensions': index_unit_dimensions
+    }
+    json.dump(index, f, ensure_ascii=False, separators=(',', ':'))
 
 # -------------------------------------------------------------------------------------------------
 # output JSON debug file
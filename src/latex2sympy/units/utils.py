@@ -1,9 +1,20 @@
+import sympy
 import sympy.physics.units as sympy_units
+from latex2sympy.utils.cache import LRUCache
 from latex2sympy.utils.expression import is_or_contains_instance
-from latex2sympy.units.unit_definitions import gray, sievert
-from latex2sympy.units.unit_aliases import UNIT_ALIASES
+from latex2sympy.units.unit_definitions import gray, sievert, degC, degF
 from latex2sympy.units.prefixes import PREFIX_ALIASES
-from latex2sympy.units.sie import SIE
+
+# conversion plans, keyed on the unit part of the expr and the target units
+# a plan is the unit part converted to the target units, e.g. `km/hr` to `m/s` => `5*m/(18*s)`,
+# so converting e.g. `3 km/hr` only multiplies the plan by `3`
+conversion_cache = LRUCache(1024)
+
+# affine temperature units, as `(scale, offset)` where `kelvin = scale * value + offset`
+AFFINE_UNITS = {
+    degC: (sympy.Integer(1), sympy.Rational(27315, 100)),
+    degF: (sympy.Rational(5, 9), sympy.Rational(27315, 100) - sympy.Rational(5, 9) * 32),
+}
 
 
 def find_prefix(text):
@@ -14,10 +25,11 @@ def find_prefix(text):
 
 
 def find_unit(text):
+    # the unit aliases are loaded on first use
+    from latex2sympy.units.unit_aliases import UNIT_ALIASES
     possible_alias = text.replace('\\: ', '').strip()
-    if possible_alias in UNIT_ALIASES:
-        return UNIT_ALIASES[possible_alias]
-    return None
+    # additional prefixed units (e.g. `GiB`) are created on first lookup (see `UnitAliasIndex`)
+    return UNIT_ALIASES.get(possible_alias)
 
 
 def is_unit(expr):
@@ -37,14 +49,137 @@ def convert_to(expr, target_units):
 
     If not able to convert, an exception is raised.
     '''
+    # the unit system is built on first use
+    from latex2sympy.units.sie import SIE
+
     # do not convert between gray and sievert, as they measure different kinds of radiation doses
     if expr == gray and target_units == sievert or expr == sievert and target_units == gray:
         raise Exception(f'Could not convert "{str(expr)}" to "{str(target_units)}"')
 
-    converted_expr = sympy_units.convert_to(expr, target_units, SIE)
+    converted_expr = convert_with_plan(expr, target_units, SIE)
 
     # if the expressions are equal, that means they could not convert
     if converted_expr == expr:
         raise Exception(f'Could not convert "{str(expr)}" to "{str(target_units)}"')
 
     return converted_expr
+
+
+def convert_to_base_units(expr):
+    '''
+    Convert the given expr to the base units of the "SI Extended" unit system, e.g. `km` to `1000 m`.
+
+    Units which have no conversion (e.g. `degreeCelsius`) are kept as is.
+    '''
+    # the unit system is built on first use
+    from latex2sympy.units.sie import SIE
+    return convert_with_plan(expr, SIE._base_units, SIE)
+
+
+def convert_many(values, source_unit_latex: str, target_unit_latex: str):
+    '''
+    Convert an array of magnitudes in the source units to the target units, e.g. `mph` to `\\frac{m}{s}`,
+    with one numpy operation (requires numpy, install with `pip install latex2sympy[numeric]`).
+
+    The units are converted with `process_sympy_as_unit` and the exact scale factor between them is computed once.
+    Affine temperature units (`degC`, `degF`) are converted with their offset, e.g. `0 degC` is `273.15 K`.
+
+    If the units cannot be converted (e.g. their dimensions differ), an exception is raised before any value is
+    converted.
+    '''
+    # numpy is optional, and only imported when needed
+    try:
+        import numpy
+    except ImportError:  # pragma: no cover
+        raise Exception('numpy is required for convert_many')
+    from latex2sympy.latex2sympyAsUnit import process_sympy_as_unit
+
+    source_unit = process_sympy_as_unit(source_unit_latex)
+    target_unit = process_sympy_as_unit(target_unit_latex)
+    scale, offset = get_linear_conversion(source_unit, target_unit)
+
+    values = numpy.asarray(values, dtype=float)
+    if offset == 0:
+        return values * float(scale)
+    return values * float(scale) + float(offset)
+
+
+def get_linear_conversion(source_unit, target_unit):
+    '''
+    Return the exact `(scale, offset)` of the conversion from the source units to the target units,
+    where `target value = scale * source value + offset`, and the offset is only non-zero for affine units.
+
+    If not able to convert, an exception is raised.
+    '''
+    from latex2sympy.units.dimensions import same_dimension
+
+    if source_unit in AFFINE_UNITS or target_unit in AFFINE_UNITS:
+        # convert through kelvin, e.g. `degF` => `K` => `degC`
+        source_conversion = get_kelvin_conversion(source_unit)
+        target_conversion = get_kelvin_conversion(target_unit)
+        if source_conversion is None or target_conversion is None:
+            raise Exception(f'Could not convert "{str(source_unit)}" to "{str(target_unit)}"')
+        (source_scale, source_offset), (target_scale, target_offset) = source_conversion, target_conversion
+        return source_scale / target_scale, (source_offset - target_offset) / target_scale
+
+    if source_unit == target_unit:
+        return sympy.Integer(1), sympy.Integer(0)
+    if not same_dimension(source_unit, target_unit):
+        raise Exception(f'Could not convert "{str(source_unit)}" to "{str(target_unit)}"')
+    scale = convert_to(source_unit, target_unit) / target_unit
+    # the scale must be a number, otherwise the units were only partly converted
+    if scale.has(sympy_units.Quantity):  # pragma: no cover
+        raise Exception(f'Could not convert "{str(source_unit)}" to "{str(target_unit)}"')
+    return scale, sympy.Integer(0)
+
+
+def get_kelvin_conversion(unit):
+    '''
+    Return `(scale, offset)` of the conversion from the temperature unit to kelvin,
+    where `kelvin = scale * value + offset`,
+    or `None` if the unit is not a temperature unit
+    '''
+    if unit in AFFINE_UNITS:
+        return AFFINE_UNITS[unit]
+    try:
+        return get_linear_conversion(unit, sympy_units.kelvin)
+    except Exception:
+        return None
+
+
+def convert_with_plan(expr, target_units, unit_system):
+    '''
+    Convert the given expr to the target units, the same as `sympy.physics.units.convert_to`, using the cached
+    conversion plan of the unit part of the expr (see `conversion_cache`).
+
+    The expr is split into its unit part (the factors containing a `Quantity`, e.g. `km/hr`) and the other factors
+    (e.g. `3`), which scale the same way when converted. A sum, e.g. `1 m + 1 cm`, is converted without a plan.
+    '''
+    if not isinstance(expr, sympy.Expr) or isinstance(expr, sympy.Add) or not expr.has(sympy_units.Quantity):
+        return sympy_units.convert_to(expr, target_units, unit_system)
+
+    # flatten unevaluated products, e.g. `3 * (km/hr)` into `3`, `km` and `1/hr`
+    factors = [expr]
+    while any(factor.is_Mul for factor in factors):
+        factors = [arg for factor in factors for arg in sympy.Mul.make_args(factor)]
+
+    coefficient_factors = []
+    unit_factors = []
+    for factor in factors:
+        if factor.has(sympy_units.Quantity):
+            unit_factors.append(factor)
+        else:
+            coefficient_factors.append(factor)
+    unit_part = sympy.Mul(*unit_factors)
+
+    target_key = tuple(target_units) if isinstance(target_units, (list, tuple)) else target_units
+    key = (unit_part, target_key, unit_system.name)
+    plan = conversion_cache.get(key)
+    if plan is None:
+        plan = sympy_units.convert_to(unit_part, target_units, unit_system)
+        conversion_cache.put(key, plan)
+
+    # if the unit part did not convert, return the expr unchanged, as `convert_to` does
+    if plan == unit_part:
+        return expr
+    return sympy.Mul(*coefficient_factors, plan)
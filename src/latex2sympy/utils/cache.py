@@ -0,0 +1,76 @@
+import threading
+from collections import OrderedDict, namedtuple
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'evictions', 'maxsize', 'currsize'])
+
+
+class LRUCache:
+    '''
+    A thread-safe, size-bounded, least-recently-used cache, which tracks hits, misses and evictions.
+
+    The cache is disabled when `maxsize` is 0, and can be resized or cleared at any time.
+    '''
+
+    def __init__(self, maxsize: int = 0):
+        self._lock = threading.Lock()
+        self._data = OrderedDict()
+        self.maxsize = max(0, maxsize)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def enabled(self):
+        return self.maxsize > 0
+
+    def get(self, key, default=None):
+        '''
+        Return the value for `key` and mark it as most recently used, or `default` if it is not cached
+        '''
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._data[key]
+            self.misses += 1
+            return default
+
+    def put(self, key, value):
+        with self._lock:
+            if self.maxsize <= 0:
+                return
+            self._data[key] = value
+            self._data.move_to_end(key)
+            self._evict()
+
+    def resize(self, maxsize: int):
+        '''
+        Change the maximum number of cached values, evicting the least recently used values if needed.
+
+        A `maxsize` of 0 disables the cache.
+        '''
+        with self._lock:
+            self.maxsize = max(0, maxsize)
+            self._evict()
+
+    def clear(self):
+        '''
+        Remove all cached values and reset the counters
+        '''
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def info(self):
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.evictions, self.maxsize, len(self._data))
+
+    def __len__(self):
+        return len(self._data)
+
+    def _evict(self):
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            self.evictions += 1
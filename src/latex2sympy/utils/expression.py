@@ -120,3 +120,69 @@ def create_ceil(expr):
     expr: Expr - sympy expression as an argument to ceil()
     '''
     return sympy.functions.ceiling(expr, evaluate=False)
+
+
+def negate_flat(expr):
+    '''
+    Negate `expr` the same way as a unary minus, e.g. `-2` is a number but `-x` is `Mul(-1, x)`
+    '''
+    if expr.is_Matrix:
+        return mat_mul_flat(-1, expr)
+    elif expr.func.is_Number:
+        return -expr
+    else:
+        return mul_flat(-1, expr)
+
+
+def get_flat_args(expr, cls):
+    '''
+    Return the args of `expr` if it is an instance of `cls` (e.g. `Add`), otherwise `[expr]`
+    '''
+    if getattr(expr, 'is_' + cls.__name__, False):
+        return list(expr.args)
+    return [expr]
+
+
+class FlatChain:
+    '''
+    Build the same expression as repeatedly applying `add_flat`/`mat_add_flat` (or `mul_flat`/`mat_mul_flat`),
+    but in linear time, by collecting the flattened args and constructing the expression only once in `build()`.
+
+    op: str - 'add' or 'mul'
+    prepend: bool - apply each expr on the left, i.e. `mul_flat(expr, chain)` instead of `mul_flat(chain, expr)`
+    '''
+
+    def __init__(self, expr, op, prepend=False):
+        self.scalar_cls, self.matrix_cls = (sympy.Add, sympy.MatAdd) if op == 'add' else (sympy.Mul, sympy.MatMul)
+        self.prepend = prepend
+        # the single expr, until another expr is applied
+        self.expr = expr
+        # the class and args of the flattened expression, args are in reverse order when prepending
+        self.cls = None
+        self.args = None
+
+    @property
+    def is_Matrix(self):
+        if self.cls is None:
+            return self.expr.is_Matrix
+        return self.cls is self.matrix_cls
+
+    def apply(self, expr):
+        cls = self.matrix_cls if self.is_Matrix or expr.is_Matrix else self.scalar_cls
+        # switching between scalar and matrix (or from a single expr) nests the current expression, same as `*_flat`
+        if self.cls is not cls:
+            self.args = get_flat_args(self.build(), cls)
+            if self.prepend:
+                self.args.reverse()
+            self.cls = cls
+            self.expr = None
+        args = get_flat_args(expr, cls)
+        if self.prepend:
+            args.reverse()
+        self.args.extend(args)
+
+    def build(self):
+        if self.cls is None:
+            return self.expr
+        args = self.args[::-1] if self.prepend else self.args
+        return self.cls(*args, evaluate=False)
@@ -1,4 +1,31 @@
+import re
+from json import JSONDecodeError
+from json.decoder import scanstring
+
+# the json values which are neither strings, objects nor arrays, with the number as group 1
+JSON_SCALAR = re.compile(r'(-?(?:0|[1-9][0-9]*)(\.[0-9]+)?([eE][-+]?[0-9]+)?)|true|false|null')
+JSON_LITERALS = {'true': True, 'false': False, 'null': None}
+JSON_WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+
+def index_tokens(node):
+    '''
+    Add a `token_index` of type -> first token of that type to a node with `tokens`,
+    for use as the `object_hook` when decoding the parser's json
+    '''
+    tokens = node.get('tokens')
+    if tokens is not None:
+        token_index = {}
+        for token in tokens:
+            token_index.setdefault(token.get('type'), token)
+        node['token_index'] = token_index
+    return node
+
+
 def get_token(node, type):
+    token_index = node.get('token_index')
+    if token_index is not None:
+        return token_index.get(type)
     tokens = node.get('tokens') if 'tokens' in node else None
     token = next((t for t in node.get('tokens') if t.get('type') == type), None) if tokens is not None else None
     return token
@@ -9,3 +36,130 @@ def has_type_or_token(node, type):
         return True
     token = get_token(node, type)
     return token is not None
+
+
+def find_type(node, table):
+    '''
+    Return the key of `table` that is the type of `node`, or the type of one of its tokens, otherwise `None`.
+
+    Used for table dispatch, where a node has at most one of the types in `table`.
+    '''
+    type = node.get('type')
+    if type in table:
+        return type
+    token_index = node.get('token_index')
+    if token_index is not None:
+        return next((t for t in token_index if t in table), None)
+    return next((t.get('type') for t in node.get('tokens', ()) if t.get('type') in table), None)
+
+
+def get_chain(node, name):
+    '''
+    Return the operand nodes and operator types of a chain of a left-recursive binary rule, e.g. `additive` or `mp`.
+
+    Handles flattened nodes, e.g. `{additive: [a, b, c], tokens: [+, -]}`,
+    as well as nested binary nodes, e.g. `{additive: [{additive: [a, b], type: +}, c], type: -}`, without recursion.
+    '''
+    operands = []
+    types = []
+    while isinstance(node.get(name), list):
+        children = node.get(name)
+        node_types = [t.get('type') for t in node.get('tokens')] if 'tokens' in node else [node.get('type')]
+        operands.extend(reversed(children[1:]))
+        types.extend(reversed(node_types))
+        node = children[0]
+    operands.append(node)
+    operands.reverse()
+    types.reverse()
+    return operands, types
+
+
+def get_func_args(func_args):
+    '''
+    Return the `expr` nodes of the right-recursive `func_args` rule, e.g. `\\max(a, b, c)`, without recursion
+    '''
+    exprs = []
+    while func_args is not None:
+        exprs.append(func_args.get('expr'))
+        func_args = func_args.get('func_args')
+    return exprs
+
+
+def loads_iterative(data, object_hook=None):
+    '''
+    Decode json like `json.loads`, with a stack instead of recursion,
+    for json nested deeper than the recursion limit, e.g. the tree of a long chain like `a + b + ...`
+    '''
+    # the objects and arrays being decoded, and the key of the next value of each (`None` for arrays)
+    containers = []
+    keys = []
+    index = 0
+    while True:
+        index = JSON_WHITESPACE.match(data, index).end()
+        char = data[index:index + 1]
+        if char == '{' or char == '[':
+            index = JSON_WHITESPACE.match(data, index + 1).end()
+            if data[index:index + 1] != ('}' if char == '{' else ']'):
+                containers.append({} if char == '{' else [])
+                keys.append(None)
+                if char == '{':
+                    keys[-1], index = read_json_key(data, index)
+                continue
+            value = {} if char == '{' else []
+            if char == '{' and object_hook is not None:
+                value = object_hook(value)
+            index += 1
+        elif char == '"':
+            value, index = scanstring(data, index + 1)
+        else:
+            match = JSON_SCALAR.match(data, index)
+            if match is None or match.end() == index:
+                raise JSONDecodeError('Expecting value', data, index)
+            if match.group(1) is None:
+                value = JSON_LITERALS[match.group(0)]
+            elif match.group(2) is None and match.group(3) is None:
+                value = int(match.group(1))
+            else:
+                value = float(match.group(1))
+            index = match.end()
+
+        # add the value to its container, and close each container which ends after it
+        while True:
+            if len(containers) == 0:
+                index = JSON_WHITESPACE.match(data, index).end()
+                if index != len(data):
+                    raise JSONDecodeError('Extra data', data, index)
+                return value
+            container = containers[-1]
+            if isinstance(container, dict):
+                container[keys[-1]] = value
+            else:
+                container.append(value)
+            index = JSON_WHITESPACE.match(data, index).end()
+            char = data[index:index + 1]
+            if char == ',':
+                if isinstance(container, dict):
+                    keys[-1], index = read_json_key(data, index + 1)
+                else:
+                    index += 1
+                break
+            if char != ('}' if isinstance(container, dict) else ']'):
+                raise JSONDecodeError('Expecting \',\' delimiter', data, index)
+            index += 1
+            containers.pop()
+            keys.pop()
+            value = object_hook(container) if isinstance(container, dict) and object_hook is not None else container
+
+
+def read_json_key(data, index):
+    '''
+    Read an object key and its `:` from `index`, and return the key and the index of its value
+    '''
+    index = JSON_WHITESPACE.match(data, index).end()
+    if data[index:index + 1] != '"':
+        raise JSONDecodeError('Expecting property name enclosed in double quotes', data, index)
+    key, index = scanstring(data, index + 1)
+    index = JSON_WHITESPACE.match(data, index).end()
+    if data[index:index + 1] != ':':
+        raise JSONDecodeError('Expecting \':\' delimiter', data, index)
+    return key, index + 1
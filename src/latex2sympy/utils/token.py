@@ -0,0 +1,76 @@
+import re
+
+# patterns for the parts of lexer tokens, matching the fragments in `LATEX.g4`
+NUMBER_PATTERN = r'[0-9,]*\.?[0-9]+'
+VARIABLE_PATTERN = r'\\variable\{(?:[^{}]|\{[^{}]*\})*\}(?:\\% ?)?'
+FRACTION_NUMBER_PATTERN = r'\\frac\{-?' + NUMBER_PATTERN + r'\}\{-?' + NUMBER_PATTERN + r'\}'
+PI_PATTERN = r'\\pi ?'
+MUL_PATTERN = r'(?:\*|\\times ?|\\cdot ?)'
+
+E_NOTATION_REGEX = re.compile(
+    r'(?P<base>' + VARIABLE_PATTERN + '|' + NUMBER_PATTERN + r')E(?P<sign>[-+]?)(?P<exponent>' +
+    VARIABLE_PATTERN + r'|[0-9]+)'
+)
+POLAR_ANGLE_REGEX = re.compile(r'\\angle (?P<sign>-?)(?P<angle>.+)')
+POLAR_ANGLE_DEGREES_REGEX = re.compile(r'(?P<degrees>' + VARIABLE_PATTERN + '|' + NUMBER_PATTERN + r')\\degree ?')
+RADIAN_FRACTION_REGEX = re.compile(
+    r'\\frac\{(?P<sign>-?)(?P<radians>.+)\}\{(?P<denominator_sign>-?)(?P<denominator>' + NUMBER_PATTERN + r')\}'
+)
+RADIANS_REGEX = re.compile(
+    r'(?:(?P<variable>' + VARIABLE_PATTERN + r')|(?P<fraction>' + FRACTION_NUMBER_PATTERN + r')|(?P<number>' +
+    NUMBER_PATTERN + r'))?(?P<operator>' + MUL_PATTERN + r')?(?P<pi>' + PI_PATTERN + r')?'
+)
+
+# a single char sup/sub which is not wrapped in `{}`, e.g. `^2`
+UNWRAPPED_SINGLE_CHAR_SUB_SUP_REGEX = re.compile(r'([\^_])([0-9a-zA-Z])')
+
+
+def wrap_single_char_sub_sup(text):
+    '''
+    Wrap single char sups/subs in `{}`, e.g. `4^26^2` => `4^{2}6^{2}`
+    '''
+    return UNWRAPPED_SINGLE_CHAR_SUB_SUP_REGEX.sub('\\1{\\2}', text)
+
+
+def get_unwrapped_offset(text, offset):
+    '''
+    Return the offset in `text` of the char at `offset` in `wrap_single_char_sub_sup(text)`
+    '''
+    shift = 0
+    for match in UNWRAPPED_SINGLE_CHAR_SUB_SUP_REGEX.finditer(text):
+        start = match.start()
+        if offset <= start + shift:
+            break
+        # `^2` is wrapped as `^{2}`, so an offset inside the braces is the offset of the char, or the char after it
+        if offset < start + shift + 4:
+            return max(start + 1, offset - shift - 1)
+        shift += 2
+    return offset - shift
+
+
+def is_variable_text(text):
+    return re.fullmatch(VARIABLE_PATTERN, text) is not None
+
+
+def is_number_text(text):
+    return re.fullmatch(NUMBER_PATTERN, text) is not None
+
+
+def split_e_notation(text):
+    '''
+    Split the text of an `E_NOTATION` token into its base, exponent sign and exponent, e.g. `\\variable{x}E-2`
+    '''
+    match = E_NOTATION_REGEX.fullmatch(text)
+    if match is None:  # pragma: no cover
+        raise Exception('Unrecognized E notation')
+    return match.group('base'), match.group('sign'), match.group('exponent')
+
+
+def split_polar_angle(text):
+    '''
+    Split the text of a `COMPLEX_NUMBER_POLAR_ANGLE` token into its sign and angle, e.g. `\\angle -45\\degree`
+    '''
+    match = POLAR_ANGLE_REGEX.fullmatch(text)
+    if match is None:  # pragma: no cover
+        raise Exception('Unrecognized polar angle')
+    return match.group('sign'), match.group('angle')
@@ -0,0 +1,25 @@
+from collections import namedtuple
+from latex2sympy.lib import validateSyntax
+from latex2sympy.utils.token import wrap_single_char_sub_sup, get_unwrapped_offset
+
+ValidationError = namedtuple('ValidationError', ['offset', 'message', 'error'])
+ValidationError.__doc__ = '''
+A syntax error in latex.
+
+offset: int - the offset of the error in the latex
+message: str - what the parser expected, e.g. "I expected something else here"
+error: str - the full error, as raised by `process_sympy`
+'''
+
+
+def validate(latex: str):
+    '''
+    Check if `latex` can be parsed, without converting it, and without importing sympy.
+
+    Returns `None` if the latex is valid, or a `ValidationError` if not.
+    '''
+    result = validateSyntax(wrap_single_char_sub_sup(latex))
+    if result is None:
+        return None
+    offset, error = result
+    return ValidationError(get_unwrapped_offset(latex, offset), error.split('\n')[0], error)
@@ -0,0 +1,59 @@
+import pytest
+import sympy
+import latex2sympy
+from latex2sympy.latex2sympy import process_sympy
+from latex2sympy.latex2sympyAsUnit import process_sympy_as_unit
+from latex2sympy.batch import get_chunks
+
+LATEX_LIST = [
+    'x^{2}+1',
+    '\\frac{1}{2}',
+    '\\frac{1}{',
+    'x^{2}+1',
+    '\\begin{pmatrix} 1 & 2 \\\\ 3 & 4 \\end{pmatrix}',
+    '\\variable{r}^{2}',
+    '1, 2',
+    '\\begin{pmatrix} 1 & 2 \\\\ 3 & 4 \\end{pmatrix}',
+]
+
+VARIABLE_VALUES = {'r': sympy.Integer(3)}
+
+
+def assert_results(results, latex_list, convert, variable_values={}):
+    assert len(results) == len(latex_list)
+    for latex, result in zip(latex_list, results):
+        try:
+            expected = convert(latex, variable_values)
+        except Exception as e:
+            assert isinstance(result, Exception)
+            assert str(result) == str(e)
+            continue
+        assert result == expected
+
+
+@pytest.mark.parametrize('workers', [0, 2])
+def test_process_sympy_many(workers):
+    results = latex2sympy.process_sympy_many(LATEX_LIST, VARIABLE_VALUES, workers=workers)
+    assert_results(results, LATEX_LIST, process_sympy, VARIABLE_VALUES)
+
+
+@pytest.mark.parametrize('workers', [0, 2])
+def test_process_sympy_many_as_unit(workers):
+    latex_list = ['\\frac{km}{hr}', 'kgm', 'notaunit', 'kgm', 'GiB']
+    results = latex2sympy.process_sympy_many(latex_list, workers=workers, as_unit=True)
+    assert_results(results, latex_list, process_sympy_as_unit)
+
+
+def test_process_sympy_many_copies_mutable_duplicates():
+    latex = '\\begin{pmatrix} 1 & 2 \\\\ 3 & 4 \\end{pmatrix}'
+    first, second = latex2sympy.process_sympy_many([latex, latex], workers=0)
+    assert first == second
+    assert first is not second
+
+
+def test_get_chunks():
+    latex_list = ['1', 'x+y', 'x' * 100, '2', 'x+2']
+    chunks = get_chunks(latex_list, 4)
+    # the most expensive string is in a chunk by itself, and dispatched first
+    assert chunks[0] == ['x' * 100]
+    assert sorted(latex for chunk in chunks for latex in chunk) == sorted(latex_list)
@@ -0,0 +1,99 @@
+import pytest
+from sympy import Matrix, Rational, Float, srepr
+from latex2sympy.latex2sympy import process_sympy, parse_cache
+from latex2sympy.latex2sympyAsUnit import process_sympy_as_unit
+from latex2sympy.utils.cache import LRUCache
+from .context import compare, get_variable_symbol
+
+
+@pytest.fixture(autouse=True)
+def enabled_parse_cache():
+    parse_cache.clear()
+    parse_cache.resize(16)
+    yield parse_cache
+    parse_cache.resize(0)
+    parse_cache.clear()
+
+
+def test_cache_hit_and_miss():
+    first = process_sympy('x^{2}+1')
+    second = process_sympy('x^{2}+1')
+    compare(second, first)
+    info = parse_cache.info()
+    assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+
+
+def test_cache_keyed_on_pre_processed_latex():
+    # `x^2` is pre-processed to `x^{2}`
+    process_sympy('x^{2}')
+    process_sympy('x^2')
+    assert parse_cache.info().hits == 1
+
+
+def test_cache_keyed_on_variable_values():
+    latex = '2\\variable{r}'
+    compare(process_sympy(latex), 2 * get_variable_symbol('r'))
+    assert srepr(process_sympy(latex, {'r': Rational(1)})) != srepr(process_sympy(latex, {'r': Float(1)}))
+    assert srepr(process_sympy(latex, {'r': Rational(3)})) == srepr(process_sympy(latex, {'r': Rational(3)}))
+    info = parse_cache.info()
+    assert (info.hits, info.misses) == (1, 4)
+
+
+def test_cache_keyed_on_converter():
+    process_sympy('m')
+    process_sympy_as_unit('m')
+    assert parse_cache.info().misses == 2
+
+
+def test_cache_does_not_store_errors():
+    for _ in range(2):
+        with pytest.raises(Exception):
+            process_sympy('\\frac{1}{}')
+    assert parse_cache.info().currsize == 0
+
+
+def test_cache_returns_copies_of_mutable_results():
+    latex = '\\begin{pmatrix}1&2\\\\3&4\\end{pmatrix}'
+    first = process_sympy(latex)
+    first[0, 0] = 100
+    compare(process_sympy(latex), Matrix([[1, 2], [3, 4]]))
+
+    relations = process_sympy('x, y')
+    relations.append(1)
+    assert len(process_sympy('x, y')) == 2
+
+
+def test_cache_eviction_and_resize():
+    for i in range(20):
+        process_sympy(str(i))
+    info = parse_cache.info()
+    assert (info.currsize, info.evictions) == (16, 4)
+
+    parse_cache.resize(10)
+    info = parse_cache.info()
+    assert (info.currsize, info.evictions, info.maxsize) == (10, 10, 10)
+
+    # the most recently used values are kept
+    process_sympy('19')
+    assert parse_cache.info().hits == 1
+
+
+def test_cache_disable_and_clear():
+    process_sympy('x')
+    parse_cache.clear()
+    assert parse_cache.info() == (0, 0, 0, 16, 0)
+
+    parse_cache.resize(0)
+    process_sympy('x')
+    process_sympy('x')
+    assert parse_cache.info() == (0, 0, 0, 0, 0)
+
+
+def test_lru_cache_order():
+    cache = LRUCache(2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    assert cache.get('a') == 1
+    cache.put('c', 3)
+    assert cache.get('b') is None
+    assert cache.get('a') == 1 and cache.get('c') == 3
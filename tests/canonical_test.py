@@ -0,0 +1,68 @@
+import os
+import subprocess
+import sys
+import pytest
+from sympy import Rational, srepr
+from latex2sympy.latex2sympy import process_sympy
+from latex2sympy.canonical import canonicalize, canonical_hash, canonical_hash_latex
+
+SAME_HASH_GROUPS = [
+    ["(x-y)(x+2y)", "(x+2y)(x-y)", "(2\\times y+x)(-y+x)", "(y\\cdot 2+x)(-y+x)"],
+    ["2\\pi \\variable{r}^2", "\\pi 2\\variable{r}^2", "2\\times \\pi \\times \\variable{r}^2"],
+    ["2\\times y", "y\\cdot 2", "2y"],
+    ["2x - 3y", "-3y + 2x"],
+    ["\\frac{x}{y z}", "x / y / z", "x \\div (z y)", "\\frac{1}{yz}x"],
+    ["2\\cdot 3 x", "6x", "\\frac{12}{2} x"],
+    ["1+2+x", "x+3", "3+x+0"],
+    ["\\frac{1}{2}", "0.5", "2^{-1}", "\\frac{2}{4}"],
+    ["a=x^2+1", "x^2+1=a"],
+    ["x < 1", "1 > x"],
+    ["\\begin{pmatrix}x+1&2\\\\3&4\\end{pmatrix}", "\\begin{pmatrix}1+x&2\\\\3&4\\end{pmatrix}"],
+    ["\\sin(x+y)", "\\sin(y+x)"],
+]
+
+DIFFERENT_HASHES = [
+    "(x-y)(x+2y)",
+    "x^2+xy-2y^2",
+    "(x-y)(x-2y)",
+    "x < 1",
+    "x \\leq 1",
+    "\\frac{1}{0}",
+    "x=1, y=2",
+    "y=2, x=1",
+]
+
+
+@pytest.mark.parametrize('group', SAME_HASH_GROUPS)
+def test_same_hash(group):
+    hashes = [canonical_hash_latex(s) for s in group]
+    assert len(set(hashes)) == 1
+
+
+def test_different_hashes():
+    hashes = [canonical_hash_latex(s) for s in DIFFERENT_HASHES]
+    assert len(set(hashes)) == len(hashes)
+
+
+@pytest.mark.parametrize('bits', [64, 128])
+@pytest.mark.parametrize('latex', ["x", "(x-y)(x+2y)", "\\frac{1}{2}", "\\sin(x)^{2}"])
+def test_hash_bits(latex, bits):
+    assert canonical_hash(process_sympy(latex), bits=bits).bit_length() <= bits
+
+
+def test_hash_bits_invalid():
+    with pytest.raises(Exception):
+        canonical_hash_latex("x", bits=32)
+
+
+def test_hash_is_stable_across_processes():
+    code = 'from latex2sympy.canonical import canonical_hash_latex; print(canonical_hash_latex("(x+2y)(x-y)"))'
+    env = dict(os.environ, PYTHONHASHSEED='123', PYTHONPATH=os.pathsep.join(sys.path))
+    output = subprocess.check_output([sys.executable, '-c', code], env=env)
+    assert int(output) == canonical_hash_latex("(x-y)(x+2y)")
+
+
+def test_canonicalize_folds_numbers():
+    assert srepr(canonicalize(process_sympy("\\frac{2}{4}"))) == srepr(Rational(1, 2))
+    # large exponents are not folded
+    assert canonicalize(process_sympy("10^{100}")).is_Pow
@@ -0,0 +1,80 @@
+import pytest
+import latex2sympy.latex2sympy
+from sympy import srepr, Derivative
+from latex2sympy.latex2sympy import process_sympy
+from latex2sympy.lib import parseToObject
+from latex2sympy.utils.json import get_chain
+from .context import assert_equal, _Add, _Mul, _Pow, x, y, z
+
+CHAIN_STRINGS = [
+    "a + b - c + d",
+    "1 + 2 - 3 + x - (y + z) - w",
+    "a \\cdot b \\times c / d \\cdot e",
+    "a \\cdot b \\mod c \\cdot d",
+    "x : y \\cdot z",
+    "\\begin{pmatrix}1\\\\2\\end{pmatrix} + \\begin{pmatrix}x\\\\y\\end{pmatrix} - \\begin{pmatrix}1\\\\2\\end{pmatrix}",
+    "a b \\cdot \\begin{pmatrix}1&2\\\\3&4\\end{pmatrix} \\cdot c \\cdot \\begin{pmatrix}1&2\\\\3&4\\end{pmatrix} d",
+    " + ".join("x_{%d}" % i for i in range(50)),
+]
+
+
+def flatten_chains(node):
+    '''
+    Rewrite nested binary `additive`/`mp`/`mp_nofunc` nodes into the flat shape emitted by newer native parsers
+    '''
+    if isinstance(node, list):
+        return [flatten_chains(item) for item in node]
+    if not isinstance(node, dict):
+        return node
+    for name in ('additive', 'mp', 'mp_nofunc'):
+        if isinstance(node.get(name), list) and 'type' in node:
+            operands, types = get_chain(node, name)
+            return {
+                name: [flatten_chains(operand) for operand in operands],
+                'tokens': [{'type': type} for type in types],
+            }
+    return {key: flatten_chains(value) for key, value in node.items()}
+
+
+def test_long_sum_is_flat():
+    expr = process_sympy(' + '.join('a_{%d}' % i for i in range(200)))
+    assert expr.is_Add
+    assert len(expr.args) == 200
+
+
+def test_very_long_sum():
+    # deeper than the recursion limit, if the parser nests each operation
+    expr = process_sympy(' - '.join('a_{%d}' % i for i in range(500)))
+    assert expr.is_Add
+    assert len(expr.args) == 500
+
+
+def test_mixed_sum_is_flat():
+    assert_equal("x - y + z - 1", _Add(x, _Mul(-1, y), z, _Mul(-1, 1)))
+
+
+def test_product_with_division():
+    assert_equal("x \\cdot y / z \\cdot 2", _Mul(_Mul(x, y), _Pow(z, -1), 2))
+
+
+def test_get_chain_nested():
+    operands, types = get_chain(parseToObject('a + b - c').get('relation').get('expr').get('additive'), 'additive')
+    assert len(operands) == 3
+    assert len(types) == 2
+
+
+@pytest.mark.parametrize('s', CHAIN_STRINGS)
+def test_flat_tree_matches_nested_tree(s, monkeypatch):
+    expected = srepr(process_sympy(s))
+    monkeypatch.setattr(latex2sympy.latex2sympy, 'parseToObject', lambda latex: flatten_chains(parseToObject(latex)))
+    assert srepr(process_sympy(s)) == expected
+
+
+def test_long_implicit_product_is_flat():
+    expr = process_sympy('2' + 'xyz' * 1000)
+    assert expr.is_Mul
+    assert len(expr.args) == 3001
+
+
+def test_derivative_in_implicit_product():
+    assert_equal("2 \\frac{\\differentialD }{\\differentialD x} x y", _Mul(2, Derivative(_Mul(x, y), x)))
@@ -0,0 +1,48 @@
+import pytest
+from latex2sympy.units import convert_many
+
+numpy = pytest.importorskip('numpy')
+
+VALUES = numpy.array([-40.0, 0.0, 1.0, 100.0])
+
+convert_many_examples = [
+    ('mph', '\\frac{m}{s}', VALUES * 0.44704),
+    ('\\frac{km}{hr}', '\\frac{m}{s}', VALUES / 3.6),
+    ('kg', 'g', VALUES * 1000),
+    ('GiB', 'MB', VALUES * 2**30 / 10**6),
+    ('m', 'm', VALUES),
+    # affine temperature units
+    ('degC', 'K', VALUES + 273.15),
+    ('K', 'degC', VALUES - 273.15),
+    ('degF', 'degC', (VALUES - 32) * 5 / 9),
+    ('degC', 'degF', VALUES * 9 / 5 + 32),
+    ('degF', 'K', (VALUES - 32) * 5 / 9 + 273.15),
+    ('mK', 'degC', VALUES / 1000 - 273.15),
+]
+
+
+@pytest.mark.parametrize('src, dest, expected', convert_many_examples)
+def test_convert_many(src, dest, expected):
+    converted = convert_many(VALUES, src, dest)
+    assert isinstance(converted, numpy.ndarray)
+    numpy.testing.assert_allclose(converted, expected, rtol=1e-12, atol=1e-12)
+
+
+def test_convert_many_list():
+    numpy.testing.assert_allclose(convert_many([1, 2], 'km', 'm'), [1000.0, 2000.0])
+
+
+convert_many_incompatible_examples = [
+    ('kg', 'm'),
+    ('kg*m', 'm'),
+    ('Gy', 'Sv'),
+    ('rpm', 'Hz'),
+    ('degC', 'm'),
+    ('degC', '\\frac{K}{s}'),
+]
+
+
+@pytest.mark.parametrize('src, dest', convert_many_incompatible_examples)
+def test_convert_many_should_fail(src, dest):
+    with pytest.raises(Exception, match='Could not convert'):
+        convert_many(VALUES, src, dest)
@@ -0,0 +1,80 @@
+import pytest
+import sympy
+from sympy.physics.units import kilogram
+from latex2sympy.latex2sympyAsUnit import process_sympy_as_unit
+from latex2sympy.units import UNIT_ALIASES, dimension_of, same_dimension, si_scale_factor_of
+from latex2sympy.units.dimensions import get_dimension_names
+from latex2sympy.units.sie import SIE, dimsys_SIE
+
+
+def dimension(**exponents):
+    return tuple(exponents.get(name, 0) for name in get_dimension_names())
+
+
+def test_dimension_names_start_with_base_dimensions():
+    base_dimensions = [str(d.name) for d in dimsys_SIE.base_dims]
+    assert get_dimension_names()[:len(base_dimensions)] == base_dimensions
+    assert 'solid_angle' in base_dimensions
+
+
+dimension_examples = [
+    ('m', dimension(length=1)),
+    ('\\frac{km}{hr}', dimension(length=1, time=-1)),
+    ('N', dimension(mass=1, length=1, time=-2)),
+    ('sr', dimension(solid_angle=1)),
+    ('lm', dimension(luminous_intensity=1, solid_angle=1)),
+    ('GiB', dimension(information=1)),
+    ('3 m^{2}', dimension(length=2)),
+]
+
+
+@pytest.mark.parametrize('latex, expected', dimension_examples)
+def test_dimension_of(latex, expected):
+    assert dimension_of(process_sympy_as_unit(latex)) == expected
+
+
+same_dimension_examples = [
+    ('\\frac{km}{hr}', '\\frac{m}{s}', True),
+    ('J', 'N m', True),
+    ('kL', 'm^{3}', True),
+    ('kg', 'm', False),
+    ('sr', 'rad', False),
+]
+
+
+@pytest.mark.parametrize('a, b, expected', same_dimension_examples)
+def test_same_dimension(a, b, expected):
+    assert same_dimension(process_sympy_as_unit(a), process_sympy_as_unit(b)) == expected
+
+
+si_scale_factor_examples = [
+    ('m', 1),
+    ('3 km', 3000),
+    ('g', sympy.Rational(1, 1000)),
+    ('\\frac{km}{hr}', sympy.Rational(5, 18)),
+    ('mL', sympy.Rational(1, 1000000)),
+]
+
+
+@pytest.mark.parametrize('latex, expected', si_scale_factor_examples)
+def test_si_scale_factor_of(latex, expected):
+    assert si_scale_factor_of(process_sympy_as_unit(latex)) == expected
+
+
+def test_dimension_of_sum_with_different_dimensions():
+    m, s = UNIT_ALIASES['m'], UNIT_ALIASES['s']
+    assert dimension_of(m + 2 * m) == dimension(length=1)
+    with pytest.raises(Exception):
+        dimension_of(m + s)
+
+
+@pytest.mark.parametrize('alias', ['m', 'km', 'GiB', 'kL', 'eV', 'J', 'ohm', 'mSv', 'lm', 'c', 'hbar'])
+def test_unit_dimensions_match_unit_system(alias):
+    unit = UNIT_ALIASES[alias]
+    dependencies = dimsys_SIE.get_dimensional_dependencies(SIE.get_quantity_dimension(unit))
+    expected = dimension(**{str(d.name): int(e) for d, e in dependencies.items()})
+    assert dimension_of(unit) == expected
+    # sympy scales mass to grams
+    mass_exponent = expected[get_dimension_names().index('mass')]
+    scale_factor = SIE.get_quantity_scale_factor(unit) / SIE.get_quantity_scale_factor(kilogram)**mass_exponent
+    assert sympy.N(si_scale_factor_of(unit) / scale_factor) == pytest.approx(1)
@@ -0,0 +1,82 @@
+import pytest
+from latex2sympy import equivalence
+from latex2sympy.latex2sympy import process_sympy
+from latex2sympy.equivalence import are_equivalent, compare_numeric, compare_symbolic
+from latex2sympy.numeric import numpy
+
+EQUIVALENT_PAIRS = [
+    ("(x-y)(x+2y)", "x^2+xy-2y^2"),
+    ("(x-y)(x+2y)", "(2\\times y+x)(-y+x)"),
+    ("2\\pi \\variable{r}^2", "2\\pi \\variable{r} \\times \\variable{r}"),
+    ("x\\times x", "(\\sqrt{x})^{4}"),
+    ("23e^{-1\\times \\sqrt{t^2}}", "23e^{-t}"),
+    ("a=x^2+1", "x^2+1=a"),
+    ("a=x^2+1", "2a=2x^2+2"),
+    ("x < 1", "1 > x"),
+    ("x < 1", "2x < 2"),
+    ("x=1, y=2", "x=1, y=2"),
+    ("\\begin{pmatrix}1&x\\\\2&3\\end{pmatrix}", "\\begin{pmatrix}1&x\\\\2&3\\end{pmatrix}"),
+    ("\\frac{\\differentialD}{\\differentialD x} x^{2}", "2x"),
+    ("\\frac{10}{2}", "5"),
+]
+
+NOT_EQUIVALENT_PAIRS = [
+    ("(x-y)(x+2y)", "(x-y)(x-2y)"),
+    ("2\\pi \\variable{r}^2", "2\\pi r^2"),
+    ("x\\times x", "x^3"),
+    ("a=x^2+1", "a=x^2"),
+    ("x < 1", "-x < -1"),
+    ("x < 1", "x \\leq 1"),
+    ("x=1, y=2", "y=2, x=1"),
+    ("x=1, y=2", "x=1"),
+    ("\\begin{pmatrix}1&x\\\\2&3\\end{pmatrix}", "\\begin{pmatrix}1&x\\\\2&4\\end{pmatrix}"),
+    ("\\begin{pmatrix}1&x\\\\2&3\\end{pmatrix}", "x"),
+    ("5", "6"),
+]
+
+
+@pytest.mark.parametrize('correct, student', EQUIVALENT_PAIRS)
+def test_equivalent(correct, student):
+    assert are_equivalent(correct, student)
+
+
+@pytest.mark.parametrize('correct, student', NOT_EQUIVALENT_PAIRS)
+def test_not_equivalent(correct, student):
+    assert not are_equivalent(correct, student)
+
+
+def test_equivalent_variable_values():
+    assert are_equivalent("\\variable{a}x", "3x", variable_values={'a': process_sympy('3')})
+
+
+@pytest.mark.skipif(numpy is None, reason='numpy is not installed')
+def test_numeric_is_conclusive():
+    assert compare_numeric(process_sympy("(x-y)(x+2y)"), process_sympy("x^2+xy-2y^2")) is True
+    assert compare_numeric(process_sympy("(x-y)(x+2y)"), process_sympy("x^2+xy-2y")) is False
+
+
+@pytest.mark.skipif(numpy is None, reason='numpy is not installed')
+def test_numeric_inconclusive_falls_back_to_symbolic():
+    # undefined at every point
+    correct = process_sympy("\\frac{x}{x-x}")
+    assert compare_numeric(correct, correct) is None
+    assert are_equivalent("\\int_{0}^{1} x \\differentialD x", "\\frac{1}{2}")
+    assert not are_equivalent("\\int_{0}^{1} x \\differentialD x", "\\frac{1}{3}", symbolic_fallback=False)
+
+
+def test_symbolic():
+    assert compare_symbolic(process_sympy("(x-y)(x+2y)"), process_sympy("x^2+xy-2y^2"))
+    assert not compare_symbolic(process_sympy("x < 1"), process_sympy("-x < -1"))
+
+
+def test_symbolic_does_not_simplify_large_expressions(monkeypatch):
+    monkeypatch.setattr(equivalence, 'SIMPLIFY_MAX_OPS', 8)
+    assert compare_symbolic(process_sympy("x(x+1)"), process_sympy("x^2+x"))
+    assert compare_symbolic(process_sympy("a=x+1"), process_sympy("2a=2x+2"))
+    assert compare_symbolic(process_sympy("(x-y)(x+2y)"), process_sympy("x^2+xy-2y^2")) is None
+    assert compare_symbolic(process_sympy("a=(x-y)(x+2y)"), process_sympy("a=x^2+xy-2y^2")) is None
+    correct = [process_sympy("(x-y)(x+2y)"), process_sympy("x")]
+    assert compare_symbolic(correct, [process_sympy("x^2+xy-2y^2"), process_sympy("x")]) is None
+    assert compare_symbolic(correct, [process_sympy("x^2+xy-2y^2"), process_sympy("y")]) is False
+    # the square root of a negative number has no real value at any sample point
+    assert are_equivalent("(x+1)^2\\sqrt{-1-x^2}", "(x^2+2x+1)\\sqrt{-1-x^2}") is None
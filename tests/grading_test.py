@@ -0,0 +1,82 @@
+import pytest
+from latex2sympy import equivalence
+from latex2sympy.grading import GradingSession, TIERS
+
+pytest.importorskip('numpy')
+
+STUDENT_ANSWERS = [
+    ("(x+2y)(x-y)", True, 'hash'),
+    ("x^2+xy-2y^2", True, 'numeric'),
+    ("x^2+xy-2y^2+z-z", True, 'numeric'),
+    ("x^2", False, 'numeric'),
+    ("a=1", False, 'numeric'),
+    ("\\frac{1}{", False, 'syntax'),
+]
+
+
+def test_score_many():
+    session = GradingSession("(x-y)(x+2y)")
+    student_latex_list = [latex for latex, _, _ in STUDENT_ANSWERS]
+    results = session.score_many(student_latex_list)
+    assert [(r.latex, r.correct, r.tier) for r in results] == STUDENT_ANSWERS
+    assert results[-1].error is not None
+    assert set(session.timings) == set(TIERS)
+
+
+def test_score_uses_cache():
+    session = GradingSession("2x")
+    result = session.score("x+x")
+    assert session.score("x+x") is result
+    assert session.score_many(["x+x", "x+x"]) == [result, result]
+
+
+@pytest.mark.parametrize('student_latex, correct', [
+    ("2a=2x^2+2", True),
+    ("x^2+1=a", True),
+    ("a=x^2", False),
+    ("a>x^2+1", False),
+])
+def test_score_relation(student_latex, correct):
+    assert GradingSession("a=x^2+1").score(student_latex).correct == correct
+
+
+def test_score_symbolic_fallback():
+    # the square root of a negative number has no real value at any sample point
+    session = GradingSession("\\sqrt{-1-x^2}")
+    assert session.score("\\sqrt{-(1+x^2)}")[1:3] == (True, 'symbolic')
+    session = GradingSession("\\sqrt{-1-x^2}", symbolic_fallback=False)
+    assert session.score("\\sqrt{-(1+x^2)}")[1:3] == (False, 'numeric')
+
+
+def test_score_symbolic_inconclusive(monkeypatch):
+    monkeypatch.setattr(equivalence, 'SIMPLIFY_MAX_OPS', 8)
+    session = GradingSession("(x+1)^2\\sqrt{-1-x^2}")
+    assert session.score("(x^2+2x+1)\\sqrt{-1-x^2}")[1:3] == (None, 'symbolic')
+
+
+def test_score_max_min():
+    # `x` is positive, so both are `x` at every sample point
+    assert GradingSession("\\max(x,0)").score("|x|")[1:3] == (True, 'numeric')
+    assert GradingSession("\\min(x,-1)").score("x")[1:3] == (False, 'numeric')
+
+
+@pytest.mark.parametrize('student_latex, correct', [
+    ("1000 m", True),
+    ("kilometer", True),
+    ("m", False),
+    ("kg", False),
+])
+def test_score_units(student_latex, correct):
+    assert GradingSession("km", units=True).score(student_latex).correct == correct
+
+
+def test_score_dose_units():
+    session = GradingSession("Gy", units=True)
+    assert [r.correct for r in session.score_many(["1000 mGy", "Sv", "J/kg"])] == [True, False, True]
+
+
+def test_score_many_processes():
+    session = GradingSession("(x-y)(x+2y)")
+    student_latex_list = [latex for latex, _, _ in STUDENT_ANSWERS] * 2
+    results = session.score_many(student_latex_list, processes=2)
+    assert [(r.latex, r.correct, r.tier) for r in results] == STUDENT_ANSWERS * 2
@@ -0,0 +1,77 @@
+import os
+import subprocess
+import sys
+import pytest
+
+# code to run in a fresh process, and the modules which must not be loaded after it
+LAZY_IMPORTS = [
+    ('import latex2sympy', ['sympy']),
+    ('import latex2sympy.units', ['sympy', 'latex2sympy.units.sie', 'latex2sympy.units.utils']),
+    ('import latex2sympy.latex2sympyAsUnit', ['sympy.physics.units', 'latex2sympy.units.sie']),
+    ('from latex2sympy.latex2sympy import process_sympy; process_sympy("x^{2}")', ['sympy.physics.units']),
+    ('from latex2sympy.units import is_unit', ['latex2sympy.units.sie']),
+    ('from latex2sympy import process_sympy_many', ['latex2sympy.units.sie']),
+]
+
+
+def get_loaded_modules(code, modules):
+    code = f'import sys\n{code}\nprint(" ".join(m for m in {modules!r} if m in sys.modules))'
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    return subprocess.check_output([sys.executable, '-c', code], env=env).decode().split()
+
+
+@pytest.mark.parametrize('code, modules', LAZY_IMPORTS)
+def test_lazy_import(code, modules):
+    assert get_loaded_modules(code, modules) == []
+
+
+def test_units_load_on_first_use():
+    code = 'from latex2sympy.latex2sympyAsUnit import process_sympy_as_unit; process_sympy_as_unit("km")'
+    modules = ['latex2sympy.units.sie', 'latex2sympy.units.utils']
+    assert get_loaded_modules(code, modules) == modules
+
+
+def test_units_lazy_attributes():
+    import latex2sympy.units as units
+    from latex2sympy.units.sie import SIE
+    from latex2sympy.units.unit_aliases import UNIT_ALIASES
+    assert units.SIE is SIE
+    assert units.UNIT_ALIASES is UNIT_ALIASES
+    assert 'UNIT_ALIASES' in dir(units)
+    with pytest.raises(AttributeError):
+        units.not_an_attribute
+
+
+def test_unit_alias_miss_does_not_create_units():
+    code = 'from latex2sympy.units import find_unit; assert find_unit("notaunit") is None'
+    assert get_loaded_modules(code, ['latex2sympy.units.sie']) == []
+
+
+def test_unit_alias_index():
+    from sympy.physics.units import kilometer, speed_of_light
+    from latex2sympy.units.unit_aliases import UNIT_ALIASES
+    assert UNIT_ALIASES['km'] == kilometer
+    assert UNIT_ALIASES['km'] is UNIT_ALIASES['kilometer']
+    assert type(UNIT_ALIASES['c']) is type(speed_of_light)
+    assert 'notaunit' not in UNIT_ALIASES
+    assert UNIT_ALIASES.get('notaunit') is None
+    assert len(UNIT_ALIASES) == len(list(UNIT_ALIASES))
+
+
+def test_prefixed_unit_aliases():
+    from latex2sympy.units import create_prefixed_unit, convert_to
+    from latex2sympy.units.prefixes import SI_PREFIXES, BIN_PREFIXES
+    from latex2sympy.units.unit_definitions import liter, byte
+    from latex2sympy.units.unit_aliases import UNIT_ALIASES
+    # prefixed units are not stored in the index, but created on first lookup
+    assert 'kL' not in UNIT_ALIASES.unit_ids
+    assert UNIT_ALIASES['kL'] == create_prefixed_unit(liter, SI_PREFIXES['k'])
+    assert UNIT_ALIASES['kL'] is UNIT_ALIASES['Kilolitre']
+    assert UNIT_ALIASES['\\mu L'] is UNIT_ALIASES['uL']
+    assert UNIT_ALIASES['milliliters'] is UNIT_ALIASES['mL']
+    assert UNIT_ALIASES['GiB'] == create_prefixed_unit(byte, BIN_PREFIXES['Gi'])
+    assert convert_to(UNIT_ALIASES['GiB'], byte) == 2**30 * byte
+    # only aliases of allowed prefixes
+    for alias in ['kliter', 'kiloL', 'k L', 'kiloliters', 'mbit', 'GiL', 'ksr']:
+        assert alias not in UNIT_ALIASES
+        assert UNIT_ALIASES.get(alias) is None
@@ -0,0 +1,61 @@
+import pytest
+from sympy import Symbol
+from latex2sympy.numeric import compile_numeric, numeric_cache, get_symbol_name
+from .context import get_variable_symbol
+
+numpy = pytest.importorskip('numpy')
+
+NUMERIC_PAIRS = [
+    ("x^{2}+\\sin(y)", lambda x, y: x ** 2 + numpy.sin(y)),
+    ("2\\pi \\variable{r}^{2}", lambda r: 2 * numpy.pi * r ** 2),
+    ("\\lfloor x \\rfloor + \\lceil y \\rceil", lambda x, y: numpy.floor(x) + numpy.ceil(y)),
+    ("x \\mod 3", lambda x: numpy.mod(x, 3)),
+    ("\\gcd(12, 18) + x", lambda x: 6 + x),
+    ("\\max(x, y) - \\min(x, y)", lambda x, y: numpy.abs(x - y)),
+    # constant and array arguments
+    ("\\max(x, 2) + \\min(5, x, y)", lambda x, y: numpy.maximum(x, 2) + numpy.minimum(numpy.minimum(x, y), 5)),
+    ("\\frac{\\sqrt{x}}{|y|}", lambda x, y: numpy.sqrt(x) / numpy.abs(y)),
+    ("\\exponentialE^{-x}", lambda x: numpy.exp(-x)),
+]
+
+
+@pytest.mark.parametrize('s, expected', NUMERIC_PAIRS)
+def test_compile_numeric(s, expected):
+    func = compile_numeric(s)
+    values = [numpy.linspace(0.5, 10, 1000) + i for i in range(len(func.names))]
+    assert numpy.allclose(func(*values), expected(*values))
+
+
+def test_compile_numeric_symbols_by_name():
+    func = compile_numeric("x - \\variable{y}", symbols=['y', 'x'])
+    assert func.symbols == [get_variable_symbol('y'), Symbol('x', real=True, positive=True)]
+    assert func(1, 3) == 2
+    assert func(x=3, y=1) == 2
+
+
+def test_compile_numeric_missing_symbol():
+    with pytest.raises(Exception):
+        compile_numeric("x + y", symbols=['x'])
+
+
+def test_compile_numeric_constant_is_broadcast():
+    assert compile_numeric("\\emptyset")().shape == ()
+    assert numpy.isnan(compile_numeric("\\emptyset")())
+    assert compile_numeric("5 + 0x", symbols=['x', 'y'])(numpy.zeros(3), numpy.zeros(3)).shape == (3,)
+
+
+def test_compile_numeric_cache():
+    numeric_cache.clear()
+    compile_numeric("a^{3}")
+    compile_numeric("b^{3}")
+    info = numeric_cache.info()
+    assert (info.hits, info.misses) == (1, 1)
+
+
+def test_compile_numeric_math_backend():
+    assert compile_numeric("x^{2}", backend='math')(3.0) == 9.0
+
+
+def test_get_symbol_name():
+    assert get_symbol_name(get_variable_symbol('x_{1}')) == 'x_{1}'
+    assert get_symbol_name(Symbol('x')) == 'x'
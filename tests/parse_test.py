@@ -0,0 +1,80 @@
+import json
+import pytest
+from latex2sympy.lib import parseToJson, parseToObject, parseManyToJson, parseManyToObject, LATEXLexerToken
+from latex2sympy.utils.json import index_tokens, get_token, find_type, loads_iterative
+
+PARSE_STRINGS = [
+    "0",
+    "-3.14",
+    "x + y - z",
+    "2x\\cdot 3y",
+    "\\frac{1}{2}x^{2}+\\sqrt{y}",
+    "\\frac{\\differentialD }{\\differentialD x}x^{2}",
+    "\\int_{0}^{1}x\\differentialD x",
+    "\\max(1, 2, x)",
+    "\\begin{pmatrix}1&2\\\\3&4\\end{pmatrix}",
+    "\\variable{x_{1}}\\times 10",
+    "x = 1, y < 2",
+    "\\angle 45\\degree ",
+]
+
+
+def test_parse_to_object_error():
+    with pytest.raises(ValueError):
+        parseToObject('\\frac{1}{}')
+
+
+def test_parse_many_to_object():
+    inputs = [*PARSE_STRINGS, '\\frac{1}{}', *PARSE_STRINGS]
+    results = parseManyToObject(inputs)
+    assert len(results) == len(inputs)
+    for input, (tree, error) in zip(inputs, results):
+        if input == '\\frac{1}{}':
+            assert tree is None
+            assert isinstance(error, str) and len(error) > 0
+        else:
+            assert error is None
+            assert tree == parseToObject(input)
+
+
+def test_parse_many_to_json():
+    results = parseManyToJson(['x + 1', '(', 'y'])
+    assert [json.loads(tree) if tree is not None else None for tree, _ in results] == \
+        [json.loads(parseToJson('x + 1')), None, json.loads(parseToJson('y'))]
+    assert results[0][1] is None and results[1][1] is not None and results[2][1] is None
+
+
+def test_parse_many_empty():
+    assert parseManyToObject([]) == []
+
+
+def test_token_index():
+    node = index_tokens({'tokens': [{'text': '(', 'type': 1}, {'text': 'x', 'type': 2}, {'text': '(', 'type': 1}]})
+    assert get_token(node, 1) is node.get('tokens')[0]
+    assert get_token(node, 3) is None
+    assert find_type(node, {2: None, 3: None}) == 2
+    assert find_type(node, {3: None}) is None
+
+
+def test_token_index_relation():
+    relation = parseToObject('x \\leq 1').get('relation')
+    assert find_type(relation, {LATEXLexerToken.LTE: None}) == LATEXLexerToken.LTE
+    assert find_type(relation, {LATEXLexerToken.GT: None}) is None
+
+
+@pytest.mark.parametrize('s', PARSE_STRINGS)
+def test_loads_iterative_matches_json(s):
+    data = parseToJson(s)
+    assert loads_iterative(data, object_hook=index_tokens) == json.loads(data, object_hook=index_tokens)
+
+
+def test_loads_iterative_values():
+    data = ' {"a": [1, -2.5, 3e2, true, false, null, "x\\"\\u00e9"], "b": {"c": {}}, "d": [[], [{}]]} '
+    assert loads_iterative(data) == json.loads(data)
+    assert loads_iterative('[' * 100000 + ']' * 100000) is not None
+
+
+@pytest.mark.parametrize('data', ['', '[1,]', '[1 2]', '{"a" 1}', '{1: 2}', '[1] x', 'tru'])
+def test_loads_iterative_errors(data):
+    with pytest.raises(json.JSONDecodeError):
+        loads_iterative(data)
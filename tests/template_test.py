@@ -0,0 +1,79 @@
+import pytest
+from sympy import Integer, Matrix, Rational, Float, pi, srepr
+from latex2sympy.latex2sympy import process_sympy
+from latex2sympy.template import compile_template
+from .context import compare, get_variable_symbol
+
+TEMPLATE_STRINGS = [
+    "2\\pi \\variable{r}^{2}",
+    "\\frac{\\variable{a}}{\\variable{b}} + 1",
+    "\\sin(\\variable{x}) + \\variable{x_1}",
+    "\\variable{x}\\%",
+    "\\variable{x}E5",
+    "\\max(\\variable{x}, 2)",
+    "\\variable{x} = 2, \\variable{y} < 3",
+    "\\begin{pmatrix}\\variable{x}\\\\1\\end{pmatrix}",
+]
+
+
+def test_template_placeholders():
+    template = compile_template("\\variable{a} + \\variable{x_1} \\cdot \\variable{a}")
+    assert template.placeholders == {'a': get_variable_symbol('a'), 'x_1': get_variable_symbol('x_1')}
+    compare(template.expr, process_sympy(template.latex))
+
+
+@pytest.mark.parametrize('s', TEMPLATE_STRINGS)
+@pytest.mark.parametrize('value', [Rational(3, 7), Float(1.5), pi])
+def test_template_bind_matches_process_sympy(s, value):
+    template = compile_template(s)
+    values = {name: value for name in template.placeholders}
+    compare(template.bind(values), process_sympy(s, values))
+
+
+@pytest.mark.parametrize('s, values', [
+    ("\\gcd(\\variable{x},4)", {'x': Integer(6)}),
+    ("\\operatorname{lcm}(\\variable{x},4)", {'x': Integer(6)}),
+    ("\\sin^{\\variable{n}}(x)", {'n': Integer(-1)}),
+    ("\\ln^{\\variable{n}}(x)", {'n': Integer(0)}),
+    ("\\sqrt[\\variable{n}]{8}", {'n': Integer(3)}),
+    ("\\binom{\\variable{n}}{2}", {'n': Integer(5)}),
+    ("\\int_{0}^{\\variable{b}} x \\differentialD x", {'b': Integer(2)}),
+    ("\\sum_{n=1}^{3} \\variable{b}n", {'b': Integer(2)}),
+])
+def test_template_bind_depends_on_values(s, values):
+    template = compile_template(s)
+    assert template.depends_on_values
+    assert srepr(template.bind(values)) == srepr(process_sympy(s, values))
+
+
+def test_template_bind_does_not_depend_on_values():
+    template = compile_template("\\sin(\\variable{n}) + \\gcd(x, 4)^{\\variable{n}} + \\sqrt[3]{\\variable{n}}")
+    assert not template.depends_on_values
+    values = {'n': Integer(-1)}
+    assert srepr(template.bind(values)) == srepr(process_sympy(template.latex, values))
+
+
+def test_template_bind_many():
+    template = compile_template("2\\pi \\variable{r}^{2}")
+    values_list = [{'r': Rational(r)} for r in range(5)]
+    results = template.bind_many(values_list)
+    expected = [process_sympy(template.latex, values) for values in values_list]
+    assert [srepr(result) for result in results] == [srepr(result) for result in expected]
+
+
+def test_template_bind_partial():
+    template = compile_template("\\variable{a} + \\variable{b}")
+    compare(template.bind({'a': Rational(1), 'c': Rational(2)}), process_sympy(template.latex, {'a': Rational(1)}))
+
+
+def test_template_bind_matrix():
+    template = compile_template("\\variable{M} \\cdot \\variable{v} + \\variable{v}")
+    values = {'M': Matrix([[1, 2], [3, 4]]), 'v': Matrix([1, 2])}
+    compare(template.bind(values), process_sympy(template.latex, values))
+
+
+def test_template_bind_does_not_modify_template():
+    template = compile_template("\\begin{pmatrix}\\variable{x}\\\\1\\end{pmatrix}")
+    expr = template.expr.copy()
+    template.bind({'x': Rational(2)})[0, 0] = 5
+    compare(template.expr, expr)
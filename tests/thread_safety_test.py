@@ -0,0 +1,65 @@
+from concurrent.futures import ThreadPoolExecutor
+from sympy import srepr
+from latex2sympy.lib import parseToJson, parseToObject
+from latex2sympy.latex2sympy import process_sympy
+
+# the pre-compiled parsers hold the GIL while parsing, so these tests check that concurrent calls return the same
+# results as serial calls, not that they parse in parallel
+THREAD_COUNT = 8
+REPEAT_COUNT = 25
+
+# a mix of inputs that exercise different grammar rules, so that concurrent parses share and extend the antlr DFA cache
+STRESS_STRINGS = [
+    "x + y - z",
+    "2x\\cdot 3y \\div 4",
+    "\\frac{1}{2}x^{2}+\\sqrt[3]{y}",
+    "\\frac{\\differentialD }{\\differentialD x}x^{2}",
+    "\\int_{0}^{1}x\\differentialD x",
+    "\\sum_{n=1}^{10}n^{2}",
+    "\\lim_{x\\to 0}\\frac{\\sin x}{x}",
+    "\\max(1, 2, x)",
+    "\\operatorname{gcd}(12, 18)",
+    "\\begin{pmatrix}1&2\\\\3&4\\end{pmatrix}",
+    "\\variable{x_{1}}\\times 10",
+    "\\left\\lfloor x\\right\\rfloor + \\lceil y\\rceil ",
+    "|x| = 1, y < 2",
+    "\\angle 45\\degree ",
+    "12,345.6E-7",
+    "\\binom{n}{k}",
+]
+
+
+def run_concurrently(func, inputs):
+    with ThreadPoolExecutor(max_workers=THREAD_COUNT) as executor:
+        return list(executor.map(func, inputs))
+
+
+def test_concurrent_parse_to_json():
+    inputs = STRESS_STRINGS * REPEAT_COUNT
+    expected = [parseToJson(s) for s in STRESS_STRINGS] * REPEAT_COUNT
+    assert run_concurrently(parseToJson, inputs) == expected
+
+
+def test_concurrent_parse_to_object():
+    inputs = STRESS_STRINGS * REPEAT_COUNT
+    expected = [parseToObject(s) for s in STRESS_STRINGS] * REPEAT_COUNT
+    assert run_concurrently(parseToObject, inputs) == expected
+
+
+def test_concurrent_parse_errors():
+    def parse_error(s):
+        try:
+            parseToObject(s)
+        except ValueError as e:
+            return str(e)
+        return None
+
+    inputs = ['(', '\\frac{1}{}', 'x +', '\\sqrt'] * REPEAT_COUNT
+    expected = [parse_error(s) for s in inputs]
+    assert run_concurrently(parse_error, inputs) == expected
+
+
+def test_concurrent_process_sympy():
+    inputs = STRESS_STRINGS * 4
+    expected = [srepr(process_sympy(s)) for s in inputs]
+    assert run_concurrently(lambda s: srepr(process_sympy(s)), inputs) == expected
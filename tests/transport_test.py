@@ -0,0 +1,88 @@
+import marshal
+import pickle
+import pytest
+import sympy
+from latex2sympy import transport
+from latex2sympy.latex2sympy import process_sympy
+from latex2sympy.latex2sympyAsUnit import process_sympy_as_unit
+
+VARIABLE_VALUES = {'y': sympy.Integer(3)}
+
+transport_examples = [
+    'x^{2}+1',
+    '\\frac{1}{2}x - 0.125',
+    '3.14159265358979323846264338327950288',
+    '\\variable{r}^{2}\\pi',
+    '\\variable{y}+\\variable{z}',
+    '\\sin(x)+\\cos(x)^{2}',
+    '\\max(1, 2, x)',
+    '\\sqrt[3]{x}',
+    '\\frac{d}{dx} x^{2}',
+    '\\int_{0}^{1} x dx',
+    '\\sum_{n=1}^{\\infty} \\frac{1}{n^{2}}',
+    '\\lim_{x \\to 0} \\frac{\\sin(x)}{x}',
+    '|x| + \\lfloor x \\rfloor',
+    'x < 2',
+    'a=x^{2}+1',
+    'e^{i\\pi} + \\infty',
+    '1, 2, x',
+    '\\begin{pmatrix} 1 & x \\\\ 3 & 4 \\end{pmatrix}',
+    '\\begin{pmatrix} 1 & 2 \\\\ 3 & 4 \\end{pmatrix}^{T}',
+]
+
+transport_unit_examples = [
+    '\\frac{km}{hr}',
+    'kgm^{2}',
+    '\\mu L',
+    'GiB',
+    '3 c',
+]
+
+
+def assert_same(a, b):
+    assert type(a) == type(b)
+    if isinstance(a, list):
+        assert len(a) == len(b)
+        for a_item, b_item in zip(a, b):
+            assert_same(a_item, b_item)
+    else:
+        assert a == b
+
+
+@pytest.mark.parametrize('latex', transport_examples)
+def test_transport(latex):
+    expr = process_sympy(latex, VARIABLE_VALUES)
+    assert_same(transport.loads(transport.dumps(expr)), expr)
+
+
+@pytest.mark.parametrize('latex', transport_unit_examples)
+def test_transport_units(latex):
+    expr = process_sympy_as_unit(latex)
+    assert_same(transport.loads(transport.dumps(expr)), expr)
+
+
+def test_transport_does_not_evaluate():
+    expr = process_sympy('x^{2}+1')
+    # pickle evaluates the expression when it is unpickled, which reorders its args
+    assert pickle.loads(pickle.dumps(expr)).args != expr.args
+    assert transport.loads(transport.dumps(expr)).args == expr.args
+
+
+def test_transport_stores_each_node_once():
+    x = sympy.Symbol('x', real=True)
+    term = sympy.Add(x, 1, evaluate=False)
+    expr = sympy.Mul(term, term, evaluate=False)
+    _, _, _, nodes, _ = marshal.loads(transport.dumps(expr))
+    # x, 1, x+1, and the product
+    assert len(nodes) == 4
+    assert transport.loads(transport.dumps(expr)) == expr
+
+
+def test_transport_other_objects():
+    x = sympy.Symbol('x')
+    exception = Exception('Unrecognized unit')
+    objs = [sympy.Function('f')(x), sympy.Dummy('d'), None, 'text', 1, 2.5, exception, [sympy.Integer(1), [x]]]
+    loaded = transport.loads(transport.dumps(objs))
+    assert loaded[:6] == objs[:6]
+    assert type(loaded[6]) == Exception and str(loaded[6]) == str(exception)
+    assert_same(loaded[7], objs[7])
@@ -1,5 +1,6 @@
 import pytest
 from sympy import Rational, pi
+from sympy.physics.units import Quantity
 from sympy.physics.units.definitions.unit_definitions import (
     # MKS - "meter, kilogram, second"
     meter, gram, kilogram, second, joule, newton, watt, pascal, hertz, speed_of_light,
@@ -49,7 +50,7 @@ from latex2sympy.units.unit_definitions import (
     molar,
     rpm
 )
-from latex2sympy.units import UNIT_ALIASES, create_prefixed_unit, convert_to
+from latex2sympy.units import UNIT_ALIASES, create_prefixed_unit, convert_to, dimension_of, split_units
 from .context import _Mul, _Pow, _Add, assert_equal, compare
 
 # create local vars for prefixed units for convenience
@@ -372,6 +373,50 @@ def test_parse_as_unit_should_succeed(input, output):
     compare(parsed, output)
 
 
+# adjacent unit symbols without spaces, split into units
+compact_unit_examples = [
+    ('kgm', _Mul(kilogram, meter)),
+    ('Nms', _Mul(newton, meter, second)),
+    ('kgm^{2}', _Mul(kilogram, _Pow(meter, 2))),
+    ('kgm^{2}/s^{2}', _Mul(_Mul(kilogram, _Pow(meter, 2)), _Pow(_Pow(second, 2), -1))),
+    ('kVA', _Mul(create_prefixed_unit(volt, SI_PREFIXES['k']), ampere)),
+    ('Pas', _Mul(pascal, second)),
+    ('k\\Omegam', _Mul(UNIT_ALIASES['k\\Omega'], meter)),
+    ('Jkg', _Mul(joule, kilogram)),
+    # a unit alias is not split, e.g. `ms` is not `m s`
+    ('ms', UNIT_ALIASES['ms']),
+]
+
+
+@pytest.mark.parametrize('input, output', compact_unit_examples)
+def test_parse_compact_units(input, output):
+    parsed = process_sympy_as_unit(input)
+    compare(parsed, output)
+
+
+@pytest.mark.parametrize('input, output', [
+    ('kgm', ['kg', 'm']),
+    ('Nms', ['N', 'm', 's']),
+    ('k\\Omegam', ['k\\Omega', 'm']),
+    ('kWh', ['kW', 'h']),
+    ('ftlb', ['ft', 'lb']),
+    # the split with the fewest prefixed units is used, e.g. not `N ms`
+    ('Jkg', ['J', 'kg']),
+    ('Nkm', ['N', 'km']),
+    # units after the first can only have common prefixes
+    ('gpm', None),
+    ('Vrms', None),
+    # the first unit cannot also be a prefix, if more units follow
+    ('Mohms', None),
+    ('mkg', None),
+    # ambiguous, `lbf t` or `lb ft`
+    ('lbft', None),
+    ('apples', None),
+])
+def test_split_units(input, output):
+    assert split_units(input) == output
+
+
 bad_unit_examples = [
     # non-Quantity, numeric value or symbols
     '1',
@@ -574,3 +619,45 @@ def test_covert_to_unit_should_fail(src, dest):
     dest_unit = process_sympy_as_unit(dest)
     with pytest.raises(Exception):
         convert_to(src_unit, dest_unit)
+
+
+def test_convert_to_unit_uses_conversion_plan():
+    from latex2sympy.units import conversion_cache
+    src_unit = process_sympy_as_unit('\\frac{km}{hr}')
+    dest_unit = process_sympy_as_unit('\\frac{m}{s}')
+    conversion_cache.clear()
+    compare(convert_to(src_unit, dest_unit), _Mul(Rational(5, 18), meter, _Pow(second, -1)))
+    # the same units with another coefficient reuse the plan
+    compare(convert_to(_Mul(3, src_unit), dest_unit), _Mul(Rational(5, 6), meter, _Pow(second, -1)))
+    assert conversion_cache.info().misses == 1
+    assert conversion_cache.info().hits == 1
+    # a plan which could not convert still raises
+    for _ in range(2):
+        with pytest.raises(Exception):
+            convert_to(_Mul(2, process_sympy_as_unit('kg')), process_sympy_as_unit('m'))
+    assert conversion_cache.info().hits == 2
+
+
+def test_unit_metadata():
+    expr, metadata = process_sympy_as_unit('\\frac{km \\cdot m}{m \\cdot s^{2}}', return_metadata=True)
+    assert metadata.units == {kilometer: 1, meter: 2, second: 1}
+    assert metadata.count == 4
+    assert metadata.unit_set == expr.atoms(Quantity)
+    assert metadata.dimensions[kilometer] == dimension_of(meter)
+
+
+def test_unit_metadata_of_cached_result():
+    from latex2sympy.latex2sympy import parse_cache
+    parse_cache.resize(16)
+    try:
+        process_sympy_as_unit('kg m')
+        # the cached result is not converted, so its units are found in the result
+        _, metadata = process_sympy_as_unit('kg m', return_metadata=True)
+        assert metadata.units == {kilogram: 1, meter: 1}
+        with pytest.raises(Exception):
+            process_sympy_as_unit('3')
+        with pytest.raises(Exception):
+            process_sympy_as_unit('3')
+    finally:
+        parse_cache.resize(0)
+        parse_cache.clear()
@@ -0,0 +1,59 @@
+import subprocess
+import sys
+import os
+import pytest
+import latex2sympy
+from latex2sympy.latex2sympy import process_sympy
+from latex2sympy.validation import validate, ValidationError
+
+VALID_STRINGS = [
+    "x^2+1",
+    "\\frac{1}{2}x^{2}+\\sqrt[3]{y}",
+    "\\variable{x_1}\\times 10",
+    "\\begin{pmatrix}1&2\\\\3&4\\end{pmatrix}",
+    "|x| = 1, y < 2",
+    # valid syntax, which can still fail to convert
+    "\\frac{\\differentialD }{\\differentialD x}",
+]
+
+INVALID_STRINGS = [
+    ("\\frac{1}{", 9),
+    ("x$", 1),
+    # offsets are in the original latex, before single char sups/subs are wrapped in `{}`
+    ("x^2+\\frac{}{}", 10),
+    ("a^2b^2+", 7),
+    ("\\variable{x_1}+", 15),
+    # offsets are in the whole latex, not its last line
+    ("x+1\n+\\frac{1}{", 14),
+    ("x+\n\\frac{}{}\ny", 9),
+]
+
+
+@pytest.mark.parametrize('s', VALID_STRINGS)
+def test_validate_valid(s):
+    assert validate(s) is None
+
+
+@pytest.mark.parametrize('s, offset', INVALID_STRINGS)
+def test_validate_invalid(s, offset):
+    result = validate(s)
+    assert isinstance(result, ValidationError)
+    assert result.offset == offset
+    with pytest.raises(Exception) as e:
+        process_sympy(s)
+    assert result.error == str(e.value)
+    assert result.message == str(e.value).split('\n')[0]
+
+
+def test_validate_top_level():
+    assert latex2sympy.validate is validate
+    assert 'validate' in dir(latex2sympy)
+    with pytest.raises(AttributeError):
+        latex2sympy.not_an_attribute
+
+
+def test_validate_does_not_import_sympy():
+    code = 'import sys, latex2sympy; assert latex2sympy.validate("x+") is not None; print("sympy" in sys.modules)'
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    output = subprocess.check_output([sys.executable, '-c', code], env=env)
+    assert output.strip() == b'False'
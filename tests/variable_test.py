@@ -103,3 +103,13 @@ def test_variable_multi_arg_func():
 
 def test_variable_substitute_sympy_value():
     assert_equal("\\variable{x}", Rational(3, 5), {'x': Rational(3, 5)})
+
+
+def test_variable_single_digit_subscript_multi_arg_func():
+    assert_equal("\\max(\\variable{x_1}, 2)", Max(get_variable_symbol('x_1'), 2, evaluate=False))
+    assert_equal("\\max(\\variable{x_1}, 2)", Max(Rational(3, 5), 2, evaluate=False), {'x_1': Rational(3, 5)})
+
+
+def test_variable_single_digit_subscript_e_notation():
+    assert_equal("\\variable{x_1}E-2", Mul(get_variable_symbol('x_1'), Pow(10, -2, evaluate=False), evaluate=False))
+    assert_equal("2E\\variable{n_1}", Mul(2, Pow(10, 3, evaluate=False), evaluate=False), {'n_1': Rational(3)})